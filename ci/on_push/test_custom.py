@@ -206,3 +206,36 @@ def test_custom_condensed_name():
         condensed_name="my_custom_stack",
     )
     ci.assert_val(prod.condensed_name, "my_custom_stack", "Custom condensed name")
+
+
+@s3_env
+def test_custom_lazy():
+    """Lazy initialization"""
+    opt_stack = others_path() / "20200310T030415_WV02_Ortho_BGRN_STK.tif"
+    prod = READER.open(
+        opt_stack,
+        custom=True,
+        sensor_type="OPTICAL",
+        band_map={"BLUE": 1, "GREEN": 2, "RED": 3, "NIR": 4, SWIR_1: 5},
+        remove_tmp=True,
+        lazy=True,
+    )
+
+    # Nothing computed nor created yet
+    assert "condensed_name" not in prod.__dict__
+    assert "_tmp_process" not in prod.__dict__
+    ci.assert_val(prod.name, "20200310T030415_WV02_Ortho_BGRN_STK", "Lazy name")
+
+    # Computed on first access
+    ci.assert_val(
+        prod.condensed_name,
+        "20200310T030415_WV02_Ortho_BGRN_STK",
+        "Lazy condensed name",
+    )
+    assert prod.bands[BLUE] is not None
+    assert "_tmp_process" not in prod.__dict__
+
+    # Output folder created when needed
+    assert prod.output.is_dir()
+    assert prod._tmp_process.name == f"tmp_{prod.condensed_name}"
+    prod.close()
@@ -4,6 +4,8 @@ import logging
 import os
 
 import numpy as np
+import spyndex
+import xarray as xr
 from sertit import ci
 
 from ci.scripts_utils import (
@@ -16,7 +18,25 @@ from ci.scripts_utils import (
     s3_env,
 )
 from eoreader import EOREADER_NAME, utils
-from eoreader.bands import NBR, NDVI, NDWI, WDRVI
+from eoreader.bands import (
+    BLUE,
+    EVI,
+    GREEN,
+    NBR,
+    NDRE2,
+    NDVI,
+    NDWI,
+    NIR,
+    RED,
+    SAVI,
+    SCI,
+    VRE_2,
+    WDRVI,
+    compute_index,
+    compute_indices,
+    get_index,
+    get_needed_bands,
+)
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
@@ -77,3 +97,66 @@ def test_index(tmp_path):
     # Test parametric index: just test if this doesn't fail
     LOGGER.info("Load parametric index: WDRVI")
     prod.load(WDRVI, pixel_size=RES, alpha=1)
+
+
+def test_compute_indices():
+    """Function testing the fused computation of the indices"""
+    rng = np.random.default_rng(0)
+    bands = {
+        band: xr.DataArray(rng.random((10, 10), dtype=np.float32) + 0.1)
+        for band in [BLUE, RED, NIR, VRE_2]
+    }
+    params = {"N": bands[NIR].data, "R": bands[RED].data, "B": bands[BLUE].data}
+    idx_list = [NDVI, SAVI, EVI, NDRE2]
+    idx = compute_indices(idx_list, bands)
+    assert list(idx.keys()) == idx_list
+
+    np.testing.assert_allclose(
+        idx[NDVI].data, spyndex.computeIndex(NDVI, params), rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        idx[SAVI].data, spyndex.computeIndex(SAVI, {**params, "L": 0.5}), rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        idx[EVI].data,
+        spyndex.computeIndex(EVI, {**params, "g": 2.5, "C1": 6.0, "C2": 7.5, "L": 1.0}),
+        rtol=1e-6,
+    )
+    np.testing.assert_allclose(
+        idx[NDRE2].data,
+        spyndex.computeIndex("NDREI", {"N": params["N"], "RE1": bands[VRE_2].data}),
+        rtol=1e-6,
+    )
+
+    # Same results as one by one, without any upcast
+    for idx_name, idx_arr in idx.items():
+        assert idx_arr.dtype == np.float32
+        assert idx_arr.name == idx_name
+        np.testing.assert_array_equal(idx_arr.data, compute_index(idx_name, bands).data)
+
+
+def test_index_registry():
+    """Function testing the compiled spectral indices"""
+    ndvi = get_index(NDVI)
+    assert ndvi.needed_bands == [NIR, RED]
+    assert ndvi.parameters == []
+    assert get_index(SAVI).parameters == ["L"]
+    assert get_needed_bands(NDRE2) == [NIR, VRE_2]
+
+    # EOReader functions
+    assert get_needed_bands(SCI) == [GREEN, RED]
+    assert get_index(SCI).function is not None
+
+    # Memory cost: 2 bands and 2 temporary arrays
+    assert ndvi.get_memory_cost((10, 10)) == 4 * 10 * 10 * 4
+
+    rng = np.random.default_rng(0)
+    bands = {
+        band: xr.DataArray(rng.random((10, 10), dtype=np.float32))
+        for band in [GREEN, RED, NIR]
+    }
+    sci = compute_index(SCI, bands)
+    np.testing.assert_allclose(
+        sci.data, 3 * bands[GREEN].data - bands[RED].data - 100, rtol=1e-6
+    )
+    assert ndvi(bands).dtype == np.float32
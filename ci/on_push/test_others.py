@@ -1,17 +1,36 @@
 """Other tests."""
 
+import gc
+import io
+import logging
 import os
+import pathlib
+import pickle
+import re
 import sys
 import tempfile
-
+import threading
+import time
+import zipfile
+from types import SimpleNamespace
+from unittest import mock
+
+import dask
+import dask.array as da
+import geopandas as gpd
 import numpy as np
+import pyproj
+import pyresample
 import pytest
 import rasterio
 import tempenv
 import xarray as xr
+from lxml import etree
+from rasterio.crs import CRS
 from rasterio.enums import Resampling
 from rasterio.windows import Window
-from sertit import AnyPath, path, unistra
+from sertit import AnyPath, ci, path, rasters, unistra
+from shapely.geometry import box
 
 from ci.scripts_utils import (
     READER,
@@ -61,14 +80,46 @@ from eoreader.bands import (
     is_sat_band,
     to_band,
 )
-from eoreader.env_vars import DEM_PATH, S3_DB_URL_ROOT
-from eoreader.exceptions import InvalidTypeError
-from eoreader.products import OpticalProduct, SensorType
-from eoreader.reader import Constellation
+from eoreader.dem_cache import DemTileCache
+from eoreader.disk_cache import DiskCache
+from eoreader.env_vars import DEM_PATH, S3_DB_URL_ROOT, TILE_SIZE, WRITE_BEHIND
+from eoreader.exceptions import InvalidProductError, InvalidTypeError
+from eoreader.keywords import SAR_ENGINE
+from eoreader.products import (
+    OpticalProduct,
+    Product,
+    S2Product,
+    S3OlciProduct,
+    S1Product,
+    S3SlstrProduct,
+    SensorType,
+    Sv1Product,
+    VhrProduct,
+)
+from eoreader.products.optical.s2_product import S2GmlMasks, S2Jp2Masks
+from eoreader.products.optical.sv1_product import Sv1ProductType
+from eoreader.products.sar.s1_product import _interp_lut
+from eoreader.products.sar.sar_product import _fill_na
+from eoreader.reader import Constellation, Reader
 
 reduce_verbosity()
 
 
+@pytest.fixture
+def bare_product():
+    """Create products without initializing them (no product needed), with the given attributes"""
+    # Delete the products left by the previous tests first, as deleting a product clears the caches of all the products
+    gc.collect()
+
+    def create(prod_class: type, **attrs) -> Product:
+        prod = prod_class.__new__(prod_class)
+        for name, value in attrs.items():
+            setattr(prod, name, value)
+        return prod
+
+    return create
+
+
 @pytest.mark.xfail
 def test_utils():
     root_dir = AnyPath(__file__).parent.parent.parent
@@ -408,6 +459,32 @@ def test_reader_methods():
     READER.valid_mtd(prod_path, Constellation.L8.name)
     READER.valid_mtd(prod_path, Constellation.L8.value)
 
+    # OPEN MANY
+    for executor in ["thread", "process"]:
+        opened = {
+            str(path): (prod, error)
+            for path, prod, error in READER.open_many(
+                [prod_path, "not_existing"], workers=2, executor=executor
+            )
+        }
+        prod, error = opened[str(prod_path)]
+        assert error is None
+        assert prod.constellation == Constellation.L8
+
+        prod, error = opened["not_existing"]
+        assert prod is None
+        assert isinstance(error, FileNotFoundError)
+
+    # DESCRIPTORS
+    prod = READER.open(prod_path, remove_tmp=True)
+    for desc in [prod.to_descriptor(), prod.to_descriptor(as_json=True)]:
+        desc_prod = READER.from_descriptor(pickle.loads(pickle.dumps(desc)))
+        assert desc_prod.condensed_name == prod.condensed_name
+        assert desc_prod.bands[BLUE] == prod.bands[BLUE]
+        assert desc_prod.crs() == prod.crs()
+        ci.assert_geom_equal(desc_prod.footprint(), prod.footprint())
+        assert desc_prod.output != prod.output
+
 
 @s3_env
 def test_context_manager(tmp_path):
@@ -587,3 +664,1375 @@ def test_constellations():
     assert Constellation.is_real_constellation(Constellation.S2)
     assert not Constellation.is_real_constellation(Constellation.MAXAR)
     assert not Constellation.is_real_constellation(Constellation.S1_RTC_ASF)
+
+
+def test_disk_cache(tmp_path):
+    """Test the persistent disk cache"""
+    disk_cache = DiskCache(tmp_path / "cache", max_size=15)
+
+    # Keys
+    key_1 = disk_cache.get_key("prod", "NDVI", 20)
+    key_2 = disk_cache.get_key("prod", "NDVI", 10)
+    assert key_1 == disk_cache.get_key("prod", "NDVI", 20)
+    assert key_1 != key_2
+
+    # Put and restore
+    src_path = tmp_path / "ndvi.tif"
+    src_path.write_bytes(b"0123456789")
+    assert disk_cache.get(key_1, ".tif") is None
+    assert disk_cache.put(src_path, key_1) is not None
+    assert disk_cache.get(key_1, ".tif").is_file()
+
+    dst_path = tmp_path / "out" / "ndvi.tif"
+    assert disk_cache.restore(key_1, dst_path)
+    assert dst_path.read_bytes() == b"0123456789"
+    assert not disk_cache.restore(key_2, tmp_path / "out" / "ndvi_10m.tif")
+
+    # LRU eviction (the cache can only hold one entry)
+    os.utime(disk_cache.get_path(key_1, ".tif"), (0, 0))
+    disk_cache.put(src_path, key_2)
+    assert disk_cache.get(key_1, ".tif") is None
+    assert disk_cache.get(key_2, ".tif").is_file()
+    assert disk_cache.size() == 10
+
+    # Clear
+    disk_cache.clear()
+    assert disk_cache.size() == 0
+
+    # The keys depend on EOReader's version
+    with mock.patch("eoreader.disk_cache.__version__", "0.0.0"):
+        assert disk_cache.get_key("prod", "NDVI", 20) != key_1
+
+    # Only local caches
+    with pytest.raises(ValueError):
+        DiskCache("s3://bucket/cache")
+
+
+def test_dem_tile_cache(tmp_path):
+    """Test the DEM tile cache"""
+    # Synthetic DEM
+    dem_path = tmp_path / "dem.tif"
+    dem_arr = np.arange(100 * 120, dtype=np.float32).reshape(100, 120)
+    with rasterio.open(
+        dem_path,
+        "w",
+        driver="GTiff",
+        dtype="float32",
+        count=1,
+        width=120,
+        height=100,
+        crs="EPSG:32631",
+        transform=rasterio.transform.from_origin(300000, 4800000, 30, 30),
+    ) as dem_ds:
+        dem_ds.write(dem_arr, 1)
+
+    dem_cache = DemTileCache(dem_path, DiskCache(tmp_path / "cache"), tile_size=32)
+
+    # Spatial index
+    # Half-pixel bounds covering the columns 40 -> 69 and the rows 10 -> 49
+    bounds = (
+        300000 + 30 * 40.5,
+        4800000 - 30 * 49.5,
+        300000 + 30 * 69.5,
+        4800000 - 30 * 10.5,
+    )
+    assert dem_cache.get_tile_ids(bounds, "EPSG:32631") == [
+        (0, 1),
+        (0, 2),
+        (1, 1),
+        (1, 2),
+    ]
+
+    # Each tile is read once
+    tile_path = dem_cache.get_tile((0, 1))
+    assert dem_cache.get_tile((0, 1)) == tile_path
+    with rasterio.open(tile_path) as tile_ds:
+        np.testing.assert_array_equal(tile_ds.read(1), dem_arr[0:32, 32:64])
+
+    # Extraction
+    subset_path = tmp_path / "subset.tif"
+    dem_cache.extract(bounds, "EPSG:32631", subset_path, margin=2)
+    with rasterio.open(subset_path) as subset_ds:
+        assert subset_ds.dtypes[0] == "float32"
+        np.testing.assert_array_equal(subset_ds.read(1), dem_arr[8:52, 38:72])
+
+
+def test_terrain_block(tmp_path):
+    """Test the block-wise computation of the terrain derivatives"""
+    from sertit import rasters
+
+    from eoreader.bands import HILLSHADE, SLOPE
+
+    def compute_by_blocks(dem_path, bands) -> dict:
+        # Compute the derivatives on 16x16 blocks and mosaic them
+        terrain = {band: np.full((60, 50), np.nan, dtype=np.float32) for band in bands}
+        with rasterio.open(dem_path) as dem_ds:
+            for row_off in range(0, 60, 16):
+                for col_off in range(0, 50, 16):
+                    window = Window(
+                        col_off, row_off, min(16, 50 - col_off), min(16, 60 - row_off)
+                    )
+                    terrain_arrs = Product._compute_terrain_block(
+                        dem_ds, window, bands, (120, 30)
+                    )
+                    for band in bands:
+                        terrain[band][window.toslices()] = terrain_arrs[band]
+        return terrain
+
+    # Synthetic DEMs, with square and rectangular pixels
+    rows, cols = np.mgrid[0:60, 0:50]
+    dem_arr = (100 * np.sin(rows / 7) * np.cos(cols / 5) + 3 * rows).astype(np.float32)
+    for x_res, y_res in [(30, 30), (30, 20)]:
+        dem_path = tmp_path / f"dem_{x_res}_{y_res}.tif"
+        with rasterio.open(
+            dem_path,
+            "w",
+            driver="GTiff",
+            dtype="float32",
+            count=1,
+            width=50,
+            height=60,
+            crs="EPSG:32631",
+            transform=rasterio.transform.from_origin(300000, 4800000, x_res, y_res),
+        ) as dem_ds:
+            dem_ds.write(dem_arr, 1)
+
+        # Same slope as sertit (Horn's kernel), with nodata on the DEM borders
+        terrain = compute_by_blocks(dem_path, [SLOPE])
+        sertit_slope = np.squeeze(rasters.slope(dem_path).data)
+        np.testing.assert_allclose(terrain[SLOPE], sertit_slope, rtol=1e-5, atol=1e-5)
+
+    # Same hillshade as sertit (inside the DEM borders)
+    inner = (slice(1, -1), slice(1, -1))
+    dem_path = tmp_path / "dem_30_30.tif"
+    terrain = compute_by_blocks(dem_path, [HILLSHADE])
+    sertit_hillshade = rasters.hillshade(dem_path, 120, 30)
+    np.testing.assert_allclose(
+        terrain[HILLSHADE][inner],
+        np.squeeze(sertit_hillshade.data)[inner],
+        rtol=1e-5,
+    )
+
+
+def test_collocate_bands(bare_product):
+    """Test that the aligned bands are only snapped when collocated"""
+
+    def get_band(x_off: float = 0.0, pixel_size: float = 10.0) -> xr.DataArray:
+        nof_pixels = int(200 / pixel_size)
+        band = xr.DataArray(
+            np.ones((1, nof_pixels, nof_pixels), dtype=np.float32),
+            coords={
+                "band": [1],
+                "y": 4800000 - pixel_size * (np.arange(nof_pixels) + 0.5),
+                "x": 300000 + x_off + pixel_size * (np.arange(nof_pixels) + 0.5),
+            },
+            dims=["band", "y", "x"],
+        )
+        return band.rio.write_crs("EPSG:32631")
+
+    prod = bare_product(Product, collocation_stats={"snapped": 0, "reprojected": 0})
+
+    ref = get_band()
+    bands = prod._collocate_bands(
+        {
+            "ref": ref,
+            "shifted": get_band(x_off=1e-6),
+            "misaligned": get_band(x_off=5.0),
+            "coarse": get_band(pixel_size=20.0),
+        }
+    )
+    assert prod.collocation_stats == {"snapped": 1, "reprojected": 2}
+    for band in bands.values():
+        assert band.rio.shape == ref.rio.shape
+        np.testing.assert_array_equal(band.x, ref.x)
+        np.testing.assert_array_equal(band.y, ref.y)
+
+    # Each band is counted once per load (even when collocated before computing indices)
+    prod.sensor_type = SensorType.OPTICAL
+    prod.has_band = mock.Mock(return_value=True)
+    prod._has_index = mock.Mock(return_value=True)
+    prod._update_attrs = mock.Mock(side_effect=lambda xarr, *args, **kwargs: xarr)
+    prod._load_bands = mock.Mock(
+        side_effect=lambda bands, **kwargs: {
+            RED: get_band(),
+            GREEN: get_band(x_off=1e-6),
+            NIR: get_band(x_off=5.0),
+        }
+    )
+    prod._load_spectral_indices = mock.Mock(
+        side_effect=lambda index_list, loaded_bands, **kwargs: {
+            NDVI: loaded_bands[RED].copy()
+        }
+    )
+    for _ in range(2):
+        band_ds = prod.load([RED, GREEN, NIR, NDVI], pixel_size=10)
+        assert prod.collocation_stats == {"snapped": 1, "reprojected": 1}
+        assert list(band_ds.keys()) == [RED, GREEN, NIR, NDVI]
+
+
+def test_read_stack(tmp_path):
+    """Test that reading several bands of a stack at once gives the same bands as reading them one by one"""
+    stack_path = tmp_path / "stack.tif"
+    with rasterio.open(
+        stack_path,
+        "w",
+        driver="GTiff",
+        width=40,
+        height=30,
+        count=4,
+        dtype=np.float32,
+        crs="EPSG:32631",
+        transform=rasterio.transform.from_origin(500000, 4800000, 10, 10),
+    ) as stack_ds:
+        stack_ds.write(np.arange(4 * 30 * 40, dtype=np.float32).reshape(4, 30, 40))
+        stack_ds.descriptions = ("BLUE", "GREEN", "RED", "NIR")
+
+    indexes = [3, 1, 4]
+    for kwargs in [{}, {"pixel_size": 20}]:
+        arrs = utils.read_stack(stack_path, indexes=indexes, **kwargs)
+        assert len(arrs) == len(indexes)
+        for idx, arr in zip(indexes, arrs):
+            ref = utils.read(stack_path, indexes=[idx], **kwargs)
+            xr.testing.assert_equal(arr, ref)
+
+            # Same attributes, with the long name of the read band
+            assert arr.attrs["long_name"] == ["BLUE", "GREEN", "RED", "NIR"][idx - 1]
+            assert {
+                key: val for key, val in arr.attrs.items() if key != "long_name"
+            } == {key: val for key, val in ref.attrs.items() if key != "long_name"}
+
+
+def test_write_stack():
+    """Test writing a stack band by band, with and without the uint16 conversion"""
+    nof_pixels = 300
+    coords = {
+        "band": [1],
+        "y": 4800000 - 10.0 * (np.arange(nof_pixels) + 0.5),
+        "x": 300000 + 10.0 * (np.arange(nof_pixels) + 0.5),
+    }
+    rng = np.random.default_rng(0)
+    red = rng.uniform(0, 0.5, (1, nof_pixels, nof_pixels)).astype(np.float32)
+    red[0, :10, :10] = np.nan
+    band_xds = xr.Dataset(
+        {
+            RED: xr.DataArray(red, coords=coords),
+            # Already scaled band
+            GREEN: xr.DataArray(
+                np.full((1, nof_pixels, nof_pixels), 1000, dtype=np.float32),
+                coords=coords,
+            ),
+        }
+    ).rio.write_crs("EPSG:32631")
+    band_xds = band_xds.chunk({"y": 128, "x": 128})
+
+    dtype, scales, clip = utils.get_uint16_conversion(band_xds, max_sample_size=1000)
+    assert dtype == np.uint16
+    assert scales == {RED: 10000}
+    assert not clip
+
+    with tempenv.TemporaryEnvironment({TILE_SIZE: "128"}):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stack_path = os.path.join(tmp_dir, "stack.tif")
+            utils.write_stack(
+                band_xds,
+                stack_path,
+                dtype=dtype,
+                scales=scales,
+                attrs={"long_name": "RED GREEN", "constellation": "test"},
+            )
+            assert_is_cog(stack_path)
+            with rasterio.open(stack_path) as ds:
+                assert ds.count == 2
+                assert ds.dtypes == ("uint16", "uint16")
+                assert ds.nodata == utils.UINT16_NODATA
+                assert ds.descriptions == ("RED", "GREEN")
+                assert ds.tags()["constellation"] == "test"
+                scaled_red = np.nan_to_num(red[0] * 10000, nan=utils.UINT16_NODATA)
+                np.testing.assert_array_equal(ds.read(1), scaled_red.astype(np.uint16))
+                np.testing.assert_array_equal(ds.read(2), 1000)
+
+            # Same defaults as sertit.rasters.write (compression, predictor and stats), with the given options and tags
+            for driver, compress in [("GTiff", None), ("COG", None), ("GTiff", "zstd")]:
+                float_path = os.path.join(tmp_dir, f"float_{driver}_{compress}.tif")
+                utils.write_stack(
+                    band_xds,
+                    float_path,
+                    driver=driver,
+                    compress=compress,
+                    tags={"processing": "test"},
+                )
+                with rasterio.open(float_path) as ds:
+                    assert ds.dtypes == ("float32", "float32")
+                    assert ds.tags()["processing"] == "test"
+                    assert ds.profile["compress"] == (
+                        compress or ("deflate" if driver == "COG" else "lzw")
+                    )
+                    assert ds.tags(ns="IMAGE_STRUCTURE").get("PREDICTOR") == "3"
+                    np.testing.assert_array_equal(
+                        ds.read(1), np.nan_to_num(red[0], nan=ds.nodata)
+                    )
+                    red_stats = ds.tags(1)
+                    np.testing.assert_allclose(
+                        float(red_stats["STATISTICS_MEAN"]), np.nanmean(red), rtol=1e-5
+                    )
+                    assert float(red_stats["STATISTICS_MAXIMUM"]) == np.nanmax(red)
+
+
+def test_parallel_bands_loading(bare_product):
+    """Test that the bands opened concurrently are the same as the ones opened sequentially"""
+    bands = [RED, GREEN, BLUE, NIR, SWIR_1]
+
+    def open_band(band, band_path, pixel_size=None, size=None, **kwargs):
+        # The first bands are the slowest
+        time.sleep(0.01 * (len(bands) - bands.index(band)))
+        band_xda = xr.DataArray(
+            np.full((1, 4, 4), bands.index(band), dtype=np.float32),
+            coords={
+                "band": [1],
+                "y": 4800000 - 10.0 * (np.arange(4) + 0.5),
+                "x": 300000 + 10.0 * (np.arange(4) + 0.5),
+            },
+            dims=["band", "y", "x"],
+        )
+        return band_xda.rio.write_crs("EPSG:32631")
+
+    prod = bare_product(OpticalProduct, _stacked_reads=None)
+    band_paths = {band: f"{band.name}.tif" for band in bands}
+
+    with mock.patch.object(prod, "_open_band", side_effect=open_band):
+        with mock.patch.object(utils, "get_max_cores", return_value=4):
+            sequential = prod._open_bands(band_paths, parallel_bands=False)
+            parallel = prod._open_bands(band_paths, parallel_bands=True)
+            parallel_10m = prod._open_bands(
+                band_paths, pixel_size=10, parallel_bands=True
+            )
+
+    for band_arrays in [parallel, parallel_10m]:
+        assert list(band_arrays.keys()) == list(sequential.keys()) == bands
+        for band in bands:
+            xr.testing.assert_identical(band_arrays[band], sequential[band])
+
+
+def test_write_behind(tmp_path, caplog, bare_product):
+    """Test that flush waits for the pending writes and logs the writing errors"""
+    xda = xr.DataArray(
+        np.ones((1, 4, 4), dtype=np.float32),
+        coords={
+            "band": [1],
+            "y": 4800000 - 10.0 * (np.arange(4) + 0.5),
+            "x": 300000 + 10.0 * (np.arange(4) + 0.5),
+        },
+        dims=["band", "y", "x"],
+    ).rio.write_crs("EPSG:32631")
+
+    nof_computes = []
+
+    def compute_band():
+        nof_computes.append(1)
+        return np.ones((1, 4, 4), dtype=np.float32)
+
+    def slow_write(xds, out_path, **kwargs):
+        time.sleep(0.2)
+        np.asarray(xds.data)
+        AnyPath(out_path).write_bytes(b"written")
+
+    prod = bare_product(
+        Product,
+        _pending_writes={},
+        _pending_writes_lock=threading.Lock(),
+        _write_executor=None,
+    )
+
+    out_path = tmp_path / "band.tif"
+    with tempenv.TemporaryEnvironment({WRITE_BEHIND: "1"}):
+        with mock.patch.object(utils, "write", side_effect=slow_write):
+            # The dask arrays are computed only once (for the file and the returned array)
+            lazy_xda = xda.copy(
+                data=da.from_delayed(
+                    dask.delayed(compute_band)(), shape=xda.shape, dtype=xda.dtype
+                )
+            )
+            out_xda = prod._write_intermediary(lazy_xda, out_path)
+            assert not out_path.exists()
+            prod.flush()
+            assert out_path.read_bytes() == b"written"
+            assert not prod._pending_writes
+            xr.testing.assert_identical(out_xda.compute(), xda)
+            assert len(nof_computes) == 1
+
+        # Writing errors are logged
+        with mock.patch.object(utils, "write", side_effect=OSError("disk full")):
+            prod._write_intermediary(xda, tmp_path / "failing.tif")
+            with caplog.at_level(logging.WARNING, logger="eoreader"):
+                prod.flush()
+        assert "Cannot write failing on disk: disk full" in caplog.text
+        assert not list(tmp_path.glob("*tmp*"))
+
+
+def test_iter_tiles(bare_product):
+    """Test that the tiles are aligned on the band grid and mosaic back to the full load"""
+    # 10 m grid, not aligned on round coordinates
+    def_tr = rasterio.transform.from_origin(300003.0, 4800007.0, 10, 10)
+    full_xda = xr.DataArray(
+        np.arange(55 * 47, dtype=np.float32).reshape(1, 47, 55),
+        coords={
+            "band": [1],
+            "y": def_tr.f - 10.0 * (np.arange(47) + 0.5),
+            "x": def_tr.c + 10.0 * (np.arange(55) + 0.5),
+        },
+        dims=["band", "y", "x"],
+        name="RED",
+    ).rio.write_crs("EPSG:32631")
+
+    def load(bands, pixel_size=None, window=None, **kwargs):
+        assert not kwargs["write_intermediary"]
+        if window is None:
+            return full_xda.to_dataset()
+        minx, miny, maxx, maxy = window.total_bounds
+        # The tile bounds are on the pixel edges
+        for bound in [minx - def_tr.c, maxy - def_tr.f]:
+            assert bound % pixel_size == pytest.approx(0)
+        return full_xda.sel(x=slice(minx, maxx), y=slice(maxy, miny)).to_dataset()
+
+    prod = bare_product(Product, pixel_size=10)
+    with mock.patch.object(
+        prod, "default_transform", return_value=(def_tr, 55, 47, "EPSG:32631")
+    ):
+        with mock.patch.object(prod, "crs", return_value="EPSG:32631"):
+            with mock.patch.object(prod, "load", side_effect=load):
+                tiles = list(prod.iter_tiles(RED, tile_size=16))
+                assert len(tiles) == 4 * 3
+                mosaic = xr.combine_by_coords(tiles).sortby("y", ascending=False)
+                xr.testing.assert_identical(mosaic.RED, full_xda)
+
+                # Overlapping tiles
+                tiles = prod.iter_tiles(RED, tile_size=16, overlap=2)
+                assert next(tiles).RED.shape == (1, 18, 18)
+                assert next(tiles).RED.shape == (1, 18, 20)
+
+
+def test_iter_tiles_custom(tmp_path):
+    """Test the tiles of a real (custom) product: windowed reads, nodata and indices per tile"""
+    # Synthetic stack with a nodata area
+    stack_path = tmp_path / "20200310T030415_TEST_STK.tif"
+    rng = np.random.default_rng(0)
+    stack_arr = rng.uniform(0.01, 0.5, (4, 47, 55)).astype(np.float32)
+    stack_arr[:, 5:9, 10:20] = -9999
+    with rasterio.open(
+        stack_path,
+        "w",
+        driver="GTiff",
+        width=55,
+        height=47,
+        count=4,
+        dtype="float32",
+        nodata=-9999,
+        crs="EPSG:32631",
+        transform=rasterio.transform.from_origin(300003.0, 4800007.0, 10, 10),
+    ) as stack_ds:
+        stack_ds.write(stack_arr)
+
+    prod = READER.open(
+        stack_path,
+        custom=True,
+        sensor_type=SensorType.OPTICAL,
+        datetime="20200310T030415",
+        band_map={BLUE: 1, GREEN: 2, RED: 3, NIR: 4},
+        pixel_size=10,
+        remove_tmp=True,
+    )
+    bands = [RED, NIR, NDVI]
+    full_xds = prod.load(bands)
+
+    with mock.patch.object(prod, "_read_band", wraps=prod._read_band) as read_mock:
+        tiles = list(prod.iter_tiles(bands, tile_size=16))
+
+    # Only the windows of the tiles are read
+    assert len(tiles) == 4 * 3
+    assert read_mock.call_count == 2 * len(tiles)
+    assert all(
+        call.kwargs.get("window") is not None for call in read_mock.call_args_list
+    )
+
+    # The tiles (cleaned, with the index computed per tile) mosaic back to the full load
+    mosaic = xr.combine_by_coords(tiles, combine_attrs="drop_conflicts").sortby(
+        "y", ascending=False
+    )
+    for band in bands:
+        np.testing.assert_allclose(mosaic[band].data, full_xds[band].data, rtol=1e-6)
+    assert np.isnan(mosaic[RED].data[0, 5:9, 10:20]).all()
+    assert np.isnan(mosaic[NDVI].data[0, 5:9, 10:20]).all()
+
+
+def test_constellation_single_listing(tmp_path):
+    """Test that the constellations are recognized by listing the product files only once"""
+    # Combined regex
+    combined = Reader._combine([re.compile(r"a\d"), re.compile(r"b\w+\.xml")])
+    assert combined.match("a1")
+    assert combined.match("bcd.xml")
+    assert not combined.match("c1")
+
+    # Fake products (only their metadata files)
+    l8_name = "LC08_L1TP_200030_20201220_20210310_02_T1"
+    l8_path = tmp_path / l8_name
+    l8_path.mkdir()
+    (l8_path / f"{l8_name}_MTL.txt").touch()
+    (l8_path / f"{l8_name}_B1.TIF").touch()
+
+    s2_path = (
+        tmp_path / "S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE"
+    )
+    granule_path = s2_path / "GRANULE" / "L1C_T30TTK_A027018_20200824T111345"
+    granule_path.mkdir(parents=True)
+    (s2_path / "MTD_MSIL1C.xml").touch()
+    (granule_path / "MTD_TL.xml").touch()
+
+    for prod_path, const in [(l8_path, Constellation.L8), (s2_path, Constellation.S2)]:
+        with mock.patch.object(
+            pathlib.Path, "glob", autospec=True, side_effect=pathlib.Path.glob
+        ) as glob_mock:
+            with mock.patch.object(
+                pathlib.Path, "iterdir", autospec=True, side_effect=pathlib.Path.iterdir
+            ) as iterdir_mock:
+                assert READER._get_constellation(prod_path) == const
+
+        # Each nesting level is listed at most once
+        glob_patterns = [call.args[1] for call in glob_mock.call_args_list]
+        assert len(glob_patterns) == len(set(glob_patterns))
+        assert iterdir_mock.call_count <= 1
+
+
+def test_lazy_init_errors(bare_product):
+    """Test that the errors raised when finishing a lazy initialization are not hidden"""
+    prod = bare_product(Product, _is_initialized=False, name="lazy_product")
+
+    with mock.patch.object(
+        prod, "_finish_init", side_effect=AttributeError("no attribute 'mtd'")
+    ):
+        with pytest.raises(RuntimeError, match="lazy_product: no attribute 'mtd'"):
+            prod.condensed_name
+
+    # Missing attributes of initialized products are still AttributeErrors
+    prod._is_initialized = True
+    with pytest.raises(AttributeError):
+        prod.missing_attribute
+
+
+def test_descriptor_round_trip(tmp_path):
+    """Test the reconstruction of a product from its (pickled) descriptor"""
+    # Synthetic stack
+    stack_path = tmp_path / "stack.tif"
+    with rasterio.open(
+        stack_path,
+        "w",
+        driver="GTiff",
+        dtype="uint16",
+        count=3,
+        width=20,
+        height=10,
+        crs="EPSG:32631",
+        transform=rasterio.transform.from_origin(300000, 4800000, 10, 10),
+        nodata=0,
+    ) as stack_ds:
+        stack_ds.write(np.arange(1, 601, dtype=np.uint16).reshape(3, 10, 20))
+
+    prod = READER.open(
+        stack_path,
+        custom=True,
+        datetime="20200310T030415",
+        sensor_type="OPTICAL",
+        band_map={BLUE: 1, GREEN: 2, RED: 3},
+        output_path=tmp_path / "output",
+    )
+    desc = pickle.loads(pickle.dumps(prod.to_descriptor()))
+    prod_desc = READER.from_descriptor(desc)
+
+    assert prod_desc.condensed_name == prod.condensed_name
+    assert prod_desc.crs() == prod.crs()
+    ci.assert_geom_equal(prod_desc.extent(), prod.extent())
+    xr.testing.assert_equal(
+        prod_desc.load(RED, to_reflectance=False)[RED],
+        prod.load(RED, to_reflectance=False)[RED],
+    )
+
+    # Only descriptors of EOReader products, as dicts
+    with pytest.raises(InvalidTypeError):
+        READER.from_descriptor(str(desc))
+    with pytest.raises(InvalidTypeError):
+        READER.from_descriptor({**desc, "class": "subprocess.Popen"})
+
+
+def test_s2_invalid_pixels_masks(bare_product):
+    """Test the bit-packed (PB < 4.0) and the lazy (PB >= 4.0) S2 invalid pixels masks"""
+
+    def get_xda(arr: np.ndarray, pixel_size: float = 10.0) -> xr.DataArray:
+        nof_pixels = arr.shape[-1]
+        return xr.DataArray(
+            arr,
+            coords={
+                "band": np.arange(1, arr.shape[0] + 1),
+                "y": 4800000 - pixel_size * (np.arange(nof_pixels) + 0.5),
+                "x": 300000 + pixel_size * (np.arange(nof_pixels) + 0.5),
+            },
+            dims=["band", "y", "x"],
+        ).rio.write_crs("EPSG:32631")
+
+    def get_gdf(*boxes, gml_id: str = "") -> gpd.GeoDataFrame:
+        # Boxes in pixels (col_min, row_min, col_max, row_max) on the 10 m grid
+        return gpd.GeoDataFrame(
+            {"gml_id": [gml_id] * len(boxes)},
+            geometry=[
+                box(
+                    300000 + 10 * col_min,
+                    4800000 - 10 * row_max,
+                    300000 + 10 * col_max,
+                    4800000 - 10 * row_min,
+                )
+                for col_min, row_min, col_max, row_max in boxes
+            ],
+            crs="EPSG:32631",
+        )
+
+    prod = bare_product(
+        S2Product,
+        _mask_true=1,
+        _mask_false=0,
+        bands={
+            BLUE: SimpleNamespace(id="02", gsd=10),
+            GREEN: SimpleNamespace(id="03", gsd=10),
+            VRE_1: SimpleNamespace(id="05", gsd=20),
+        },
+    )
+    band_arr = get_xda(np.ones((1, 20, 20), dtype=np.float32))
+
+    # -- PB < 4.0: the masks of the bands of a resolution group are packed in one array
+    # BLUE: detectors covering the 15 first columns, GREEN: the 10 first ones
+    footprints = {"02": (0, 0, 15, 20), "03": (0, 0, 10, 20)}
+
+    def read_mask_lt_4_0(mask_id, band_id):
+        if mask_id == S2GmlMasks.FOOTPRINT:
+            return get_gdf(footprints[band_id])
+        elif mask_id == S2GmlMasks.DEFECT and band_id == "03":
+            return get_gdf((2, 2, 4, 4))
+        else:
+            return get_gdf()
+
+    expected = {}
+    for band_id, col_max in [("02", 15), ("03", 10)]:
+        expected[band_id] = np.zeros((20, 20), dtype=bool)
+        expected[band_id][:, col_max:] = True
+    expected["03"][2:4, 2:4] = True
+
+    with mock.patch.object(
+        prod, "_read_mask_lt_4_0", side_effect=read_mask_lt_4_0
+    ) as read_mock:
+        for band in [BLUE, GREEN, BLUE, GREEN]:
+            clean_arr = prod._manage_invalid_pixels_lt_4_0(band_arr, band)
+            np.testing.assert_array_equal(
+                np.isnan(clean_arr.data[0]), expected[prod.bands[band].id]
+            )
+
+        # Each band is rasterized only once, in the same packed array
+        assert read_mock.call_count == 2 * 5
+        masks = prod._get_invalid_pixels_masks(10, 20, 20, tuple(band_arr.rio.bounds()))
+        np.testing.assert_array_equal(
+            masks["mask"], expected["02"] * np.uint8(1) | expected["03"] * np.uint8(2)
+        )
+
+    # -- PB >= 4.0: the masks are combined lazily at their native resolution
+    detfoo = np.ones((1, 20, 20), dtype=np.uint8)
+    detfoo[..., 15:] = 0
+    qualit = np.zeros((5, 20, 20), dtype=np.uint8)
+    qualit[0, 2:4, 2:4] = 1
+    qualit[3, 10, 5:8] = 1
+
+    def open_mask_gt_4_0(mask_id, band_id, indexes=None):
+        if mask_id == S2Jp2Masks.DETFOO:
+            return get_xda(detfoo).chunk({"x": 8, "y": 8})
+        else:
+            return get_xda(qualit).chunk({"x": 8, "y": 8})
+
+    with mock.patch.object(
+        prod, "_open_mask_gt_4_0", side_effect=open_mask_gt_4_0
+    ) as open_mock:
+        # Native resolution
+        clean_arr = prod._manage_invalid_pixels_gt_4_0(band_arr.chunk(), BLUE)
+        assert dask.is_dask_collection(clean_arr.data)
+        np.testing.assert_array_equal(
+            np.isnan(clean_arr.data[0]), (detfoo[0] == 0) | qualit.any(axis=0)
+        )
+
+        # 20 m: same as resampling every layer before combining them
+        band_arr_20m = get_xda(np.ones((1, 10, 10), dtype=np.float32), 20.0)
+        clean_arr = prod._manage_invalid_pixels_gt_4_0(band_arr_20m.chunk(), BLUE)
+        assert dask.is_dask_collection(clean_arr.data)
+        layers = [
+            rasters.collocate(band_arr_20m, get_xda(layer[np.newaxis]))
+            for layer in np.concatenate([detfoo == 0, qualit])
+        ]
+        np.testing.assert_array_equal(
+            np.isnan(clean_arr.data[0]), np.any([layer[0] for layer in layers], axis=0)
+        )
+
+        # Windows: only the part of the mask covering the window is resampled
+        expected = get_xda(
+            ((detfoo[0] == 0) | qualit.any(axis=0))[np.newaxis].astype(np.uint8)
+        )
+        for pixel_size, rows, cols in [
+            (10.0, (3, 13), (5, 17)),
+            (20.0, (1, 4), (2, 9)),
+        ]:
+            nof_pixels = int(200 / pixel_size)
+            win_arr = get_xda(
+                np.ones((1, nof_pixels, nof_pixels), dtype=np.float32), pixel_size
+            ).isel(y=slice(*rows), x=slice(*cols))
+            with mock.patch.object(
+                rasters, "collocate", wraps=rasters.collocate
+            ) as collocate_mock:
+                clean_arr = prod._manage_invalid_pixels_gt_4_0(win_arr.chunk(), BLUE)
+            mask_arr = collocate_mock.call_args[0][1]
+            assert mask_arr.rio.width <= (cols[1] - cols[0]) * pixel_size / 10 + 2
+            assert mask_arr.rio.height <= (rows[1] - rows[0]) * pixel_size / 10 + 2
+            np.testing.assert_array_equal(
+                np.isnan(clean_arr.data[0]),
+                rasters.collocate(win_arr, expected).data[0].astype(bool),
+            )
+
+        # The masks of a band are opened only once
+        assert open_mock.call_count == 2
+
+
+def test_s3_resampler_reuse(tmp_path, bare_product):
+    """Test that the S3 resampling lookup tables are computed once and shared by all the bands"""
+    # Synthetic swath (300 m pixels, slightly rotated) around 3°E, 43°N
+    rows, cols = np.mgrid[0:30, 0:30].astype(np.float64)
+    x_utm = 500000 + 300 * cols + 10 * rows
+    y_utm = 4760000 - 300 * rows + 10 * cols
+    lon, lat = pyproj.Transformer.from_crs(
+        "EPSG:32631", "EPSG:4326", always_xy=True
+    ).transform(x_utm, y_utm)
+
+    def read_nc(geo_file, nc_name, squeeze=True):
+        arr = lat if nc_name == "latitude" else lon
+        return xr.DataArray(arr, dims=["y", "x"]).chunk()
+
+    def get_band(value: float) -> xr.DataArray:
+        band_arr = (value + rows + cols)[np.newaxis].astype(np.float32)
+        return xr.DataArray(band_arr, dims=["band", "y", "x"])
+
+    def get_out_path(filename):
+        out_path = tmp_path / filename
+        return out_path, out_path.exists()
+
+    def get_prod() -> S3OlciProduct:
+        prod = bare_product(
+            S3OlciProduct,
+            pixel_size=300,
+            condensed_name="S3_OLCI_test",
+            _geo_file="geo_coordinates.nc",
+            _lat_nc_name="latitude",
+            _lon_nc_name="longitude",
+            crs=mock.Mock(return_value=CRS.from_epsg(32631)),
+            extent=mock.Mock(
+                return_value=gpd.GeoDataFrame(
+                    geometry=[box(500300, 4751300, 508700, 4759700)], crs="EPSG:32631"
+                )
+            ),
+            _get_out_path=mock.Mock(side_effect=get_out_path),
+            _read_nc=mock.Mock(side_effect=read_nc),
+        )
+        return prod
+
+    prod = get_prod()
+    bands = {RED: get_band(1), GREEN: get_band(100)}
+    geocoded = prod._geocode_bands(bands)
+    geocoded_blue = prod._geocode(get_band(1000))
+
+    # Lat/lon read and lookup tables computed only once
+    assert prod._read_nc.call_count == 2
+    assert prod._get_resampler(None, Resampling.nearest) is prod._get_resampler(
+        None, Resampling.nearest
+    )
+
+    # Same as geocoding each band alone with a new product (reusing the written lookup tables)
+    other_prod = get_prod()
+    with mock.patch.object(
+        pyresample.kd_tree.XArrayResamplerNN, "get_neighbour_info"
+    ) as neighbour_mock:
+        for band, band_arr in bands.items():
+            xr.testing.assert_equal(other_prod._geocode(band_arr), geocoded[band])
+        neighbour_mock.assert_not_called()
+    assert geocoded_blue.shape == geocoded[RED].shape
+    assert np.isfinite(geocoded_blue.data).any()
+
+
+def test_s3_zipped_netcdf(tmp_path, bare_product):
+    """Test that the NetCDF files of archived S3 products are read from the archive without extracting it"""
+    # Small NetCDF file, zipped with and without compression
+    radiance = np.arange(20 * 30, dtype=np.float32).reshape(20, 30)
+    nc_path = tmp_path / "Oa08_radiance.nc"
+    xr.Dataset({"Oa08_radiance": (["rows", "columns"], radiance)}).to_netcdf(
+        nc_path, engine="h5netcdf"
+    )
+
+    nc_bytes = nc_path.read_bytes()
+    for compression, member_type, pooled in [
+        (zipfile.ZIP_STORED, io.BufferedReader, True),
+        (zipfile.ZIP_DEFLATED, io.BytesIO, False),
+    ]:
+        zip_path = tmp_path / f"S3A_OL_1_EFR_{compression}.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=compression) as zip_ds:
+            zip_ds.writestr(f"{zip_path.stem}.SEN3/xfdumanifest.xml", "<xfdu/>")
+            zip_ds.write(nc_path, f"{zip_path.stem}.SEN3/{nc_path.name}")
+
+        prod = bare_product(S3OlciProduct, path=AnyPath(zip_path), is_archived=True)
+
+        # Stored members are read from the archive, compressed ones decompressed in memory
+        nc_file = prod._open_nc_file("Oa08_radiance.nc")
+        assert isinstance(nc_file, member_type)
+
+        # Random accesses (backwards too) read the right bytes of the member
+        for offset, size in [(1000, 100), (10, 50), (len(nc_bytes) - 20, 100)]:
+            nc_file.seek(offset)
+            assert nc_file.read(size) == nc_bytes[offset : offset + size]
+
+        # Same values as the NetCDF file, with the archive opened only once
+        with mock.patch("zipfile.ZipFile", wraps=zipfile.ZipFile) as zip_mock:
+            nc = prod._read_nc("Oa08_radiance.nc", "Oa08_radiance")
+            prod._read_nc("Oa08_radiance.nc", "Oa08_radiance")
+        zip_mock.assert_not_called()
+        assert nc.dims == ("band", "y", "x")
+        np.testing.assert_array_equal(nc.data[0], radiance)
+
+        # The datasets over decompressed members are not kept in memory
+        handles = prod._get_nc_handles()
+        assert (handles.find(("dataset", "Oa08_radiance.nc")) is not None) == pooled
+
+        with pytest.raises(FileNotFoundError):
+            prod._open_nc_file("Oa01_radiance.nc")
+
+        handles.close()
+
+
+def test_slstr_tie_interpolation(tmp_path, bare_product):
+    """Test the block-wise tie point interpolation of the SLSTR SZA and the caching of its cosine"""
+    from scipy.interpolate import RectBivariateSpline
+
+    # Tie point grid (decreasing x, as in the products) and a finer image grid
+    tx = np.linspace(60000, -60000, 13)
+    ty = np.linspace(0, 100000, 11)
+    fx, fy = np.meshgrid(np.linspace(-55000, 55000, 37), np.linspace(0, 100000, 41))
+    sza_deg = 30 + np.add.outer(ty / 5000, np.abs(tx) / 8000)
+
+    def read_nc(nc_file, nc_name):
+        nc_arrays = {
+            "x_tx": np.tile(tx, (ty.size, 1)),
+            "y_tx": np.tile(ty[:, np.newaxis], (1, tx.size)),
+            "x_an": fx,
+            "y_an": fy,
+            "solar_zenith_tn": sza_deg,
+        }
+        return xr.DataArray(nc_arrays[nc_name][np.newaxis])
+
+    def get_out_path(filename):
+        out_path = tmp_path / filename
+        return out_path, out_path.exists()
+
+    prod = bare_product(
+        S3SlstrProduct,
+        _geom_file="geometry_t{view}.nc",
+        _sza_name="solar_zenith_t{view}",
+        _tmp_process=tmp_path,
+        _read_nc=mock.Mock(side_effect=read_nc),
+        _get_out_path=mock.Mock(side_effect=get_out_path),
+    )
+
+    # Interpolated by blocks of rows, as in one pass
+    spline = RectBivariateSpline(ty, tx[::-1], np.deg2rad(sza_deg)[:, ::-1])
+    with mock.patch(
+        "eoreader.products.optical.s3_slstr_product.TIE_INTERP_BLOCK_SIZE", 100
+    ):
+        cos_sza = prod._compute_cos_sza_img_grid("an")
+    np.testing.assert_allclose(cos_sza, np.cos(spline.ev(fy, fx)), rtol=1e-5)
+    assert cos_sza.dtype == np.float32
+
+    # The cosine is cached, the SZA grid is only saved on disk
+    assert prod._compute_cos_sza_img_grid("an") is cos_sza
+    assert (tmp_path / "sza_an.npy").is_file()
+    nof_reads = prod._read_nc.call_count
+    prod._compute_sza_img_grid("an")
+    assert prod._read_nc.call_count == nof_reads
+
+    # The image grids are not kept in memory
+    prod._read_img_grid("an")
+    assert prod._read_nc.call_count == nof_reads + 2
+
+
+def test_s1_interp_lut():
+    """Test the bilinear interpolation of the Sentinel-1 LUTs given as range vectors"""
+    from scipy.interpolate import RegularGridInterpolator
+
+    lines = np.array([0.0, 40.0, 100.0, 130.0])
+    pixels = np.array([0.0, 30.0, 90.0])
+    values = 500 + np.add.outer(lines, pixels**1.5)
+    vectors = [(pixels, lut) for lut in values]
+    rows = np.arange(20, 110)
+    cols = np.arange(5, 85)
+
+    lut = _interp_lut(lines, vectors, rows, cols)
+    assert lut.shape == (rows.size, cols.size)
+    assert lut.dtype == np.float32
+    rr, cc = np.meshgrid(rows, cols, indexing="ij")
+    np.testing.assert_allclose(
+        lut, RegularGridInterpolator((lines, pixels), values)((rr, cc)), rtol=1e-6
+    )
+
+    # Same values when interpolated by blocks
+    np.testing.assert_array_equal(
+        _interp_lut(lines, vectors, rows[30:40], cols), lut[30:40]
+    )
+
+    # Only one vector: the LUT is the same for every row
+    lut = _interp_lut(lines[:1], vectors[:1], rows, cols)
+    np.testing.assert_allclose(
+        lut, np.broadcast_to(np.interp(cols, *vectors[0]), lut.shape)
+    )
+
+
+def _s1_synthetic_annotations() -> dict:
+    """Synthetic annotation, calibration and noise XMLs of a 60x80 Sentinel-1 GRD band (10 m, north-up around 3°E, 43°N)"""
+    to_wgs84 = pyproj.Transformer.from_crs("EPSG:32631", "EPSG:4326", always_xy=True)
+    points = []
+    for line in [0, 30, 60]:
+        for pixel in [0, 40, 80]:
+            lon, lat = to_wgs84.transform(500000 + 10 * pixel, 4800000 - 10 * line)
+            points.append(
+                f"<geolocationGridPoint><line>{line}</line><pixel>{pixel}</pixel>"
+                f"<latitude>{lat}</latitude><longitude>{lon}</longitude>"
+                "<height>0</height><incidenceAngle>35</incidenceAngle>"
+                "</geolocationGridPoint>"
+            )
+    annotation = (
+        "<product><imageInformation><rangePixelSpacing>10</rangePixelSpacing>"
+        f"</imageInformation><geolocationGridPointList>{''.join(points)}"
+        "</geolocationGridPointList></product>"
+    )
+
+    calibration = "<calibration>"
+    for line, sigma0 in [(0, "400 420 440"), (60, "410 430 450")]:
+        calibration += (
+            f"<calibrationVector><line>{line}</line><pixel>0 40 80</pixel>"
+            f"<sigmaNought>{sigma0}</sigmaNought></calibrationVector>"
+        )
+    calibration += "</calibration>"
+
+    noise = (
+        "<noise><noiseRangeVector><line>0</line><pixel>0 80</pixel>"
+        "<noiseRangeLut>100 300</noiseRangeLut></noiseRangeVector>"
+        "<noiseRangeVector><line>60</line><pixel>0 80</pixel>"
+        "<noiseRangeLut>200 400</noiseRangeLut></noiseRangeVector>"
+        "<noiseAzimuthVector><firstAzimuthLine>0</firstAzimuthLine>"
+        "<lastAzimuthLine>59</lastAzimuthLine><firstRangeSample>0</firstRangeSample>"
+        "<lastRangeSample>39</lastRangeSample><line>0 59</line>"
+        "<noiseAzimuthLut>1 2</noiseAzimuthLut></noiseAzimuthVector></noise>"
+    )
+
+    return {
+        "": etree.fromstring(annotation),
+        "calibration": etree.fromstring(calibration),
+        "noise": etree.fromstring(noise),
+    }
+
+
+def _s1_synthetic_product(tmp_path, bare_product) -> S1Product:
+    """Sentinel-1 GRD product with a synthetic 60x80 VV band (bypassing the initialization)"""
+    annotations = _s1_synthetic_annotations()
+    prod = bare_product(
+        S1Product,
+        condensed_name="S1_GRD_test",
+        pixel_size=10,
+        bands={VV: SimpleNamespace(id="VV")},
+        _raw_no_data=0,
+        _read_pol_xml=mock.Mock(
+            side_effect=lambda band, folder="": annotations[folder]
+        ),
+    )
+
+    # Raw digital numbers
+    raw_path = tmp_path / "raw_vv.tif"
+    dn = (1000 + np.add.outer(np.arange(60) * 7, np.arange(80) * 3)).astype(np.uint16)
+    with rasterio.open(
+        raw_path, "w", driver="GTiff", width=80, height=60, count=1, dtype=np.uint16
+    ) as raw_ds:
+        raw_ds.write(dn, 1)
+    prod.get_raw_band_paths = mock.Mock(return_value={VV: raw_path})
+    return prod
+
+
+def test_s1_native_calibration(tmp_path, bare_product):
+    """Test the native Sentinel-1 geolocation grid and calibration (with thermal noise removal)"""
+    prod = _s1_synthetic_product(tmp_path, bare_product)
+
+    geoloc = prod._get_native_geolocation(VV)
+    assert geoloc["range_pixel_spacing"] == 10
+    np.testing.assert_array_equal(geoloc["line"], np.repeat([0, 30, 60], 3))
+    np.testing.assert_array_equal(geoloc["pixel"], np.tile([0, 40, 80], 3))
+    assert geoloc["latitude"].shape == geoloc["incidence_angle"].shape == (9,)
+
+    # Expected sigma0 (computed on the whole image in float64)
+    rows, cols = np.mgrid[0:60, 0:80].astype(np.float64)
+    dn = 1000 + rows * 7 + cols * 3
+    sigma0_lut = 400 + 20 * cols / 40 + 10 * rows / 60
+    noise = (100 + 200 * cols / 80 + 100 * rows / 60) * np.where(
+        cols < 40, 1 + rows / 59, 1
+    )
+    expected = (dn**2 - noise) / sigma0_lut**2
+
+    window = Window(10, 20, 50, 30)
+    sigma0 = prod._calibrate_native(VV, dn[20:50, 10:60].astype(np.float32), window)
+    assert sigma0.dtype == np.float32
+    np.testing.assert_allclose(sigma0, expected[20:50, 10:60], rtol=1e-5)
+
+
+def test_s1_native_pre_process(tmp_path, bare_product):
+    """Test the native Sentinel-1 pre-processing, geocoded and written on disk block by block"""
+    prod = _s1_synthetic_product(tmp_path, bare_product)
+    prod.crs = mock.Mock(return_value=CRS.from_epsg(32631))
+    prod._already_processed_path = mock.Mock(return_value=None)
+
+    written = {}
+
+    def write_sar_arr(out_path, arr, band, **kwargs):
+        written[out_path] = arr.compute()
+        return out_path
+
+    prod._write_sar_arr = mock.Mock(side_effect=write_sar_arr)
+
+    with tempenv.TemporaryEnvironment({"EOREADER_DEM_PATH": None}):
+        prod._pre_process_native("whole.tif", VV, pixel_size=10)
+        with mock.patch("eoreader.products.sar.sar_product.NATIVE_BLOCK_SIZE", 16):
+            prod._pre_process_native("blocks.tif", VV, pixel_size=10)
+
+    whole = written["whole.tif"]
+    assert whole.shape[1:] in [(60, 80), (61, 81)]
+    assert whole.dtype == np.float32
+    assert whole.name == "VV"
+    assert np.isfinite(whole.data[0, 5:-5, 5:-5]).all()
+
+    # Same output when computed by blocks
+    xr.testing.assert_allclose(written["blocks.tif"], whole)
+
+    # Bilinear interpolation of the calibrated raw image at the (line, pixel) of the output pixel centers
+    from scipy.interpolate import RegularGridInterpolator
+
+    with rasterio.open(tmp_path / "raw_vv.tif") as raw_ds:
+        sigma0 = prod._calibrate_native(
+            VV, raw_ds.read(1).astype(np.float32), Window(0, 0, 80, 60)
+        )
+    interp = RegularGridInterpolator((np.arange(60), np.arange(80)), sigma0)
+    sub = whole.isel(y=slice(5, -5), x=slice(5, -5))
+    xx, yy = np.meshgrid(sub.x, sub.y)
+    np.testing.assert_allclose(
+        sub.data[0],
+        10 * np.log10(interp(((4800000 - yy) / 10, (xx - 500000) / 10))),
+        rtol=1e-4,
+    )
+
+
+def test_sar_snap_batch(tmp_path, bare_product):
+    """Test that the missing polarisations are pre-processed in one SNAP execution and split per band"""
+    prod = bare_product(
+        S1Product,
+        condensed_name="S1_GRD_test",
+        _need_snap=True,
+        _snap_no_data=0,
+        pol_channels=[VV, VH],
+        bands={band: SimpleNamespace(id=band.value) for band in [VV, VH, VV_DSPK]},
+    )
+    prod.bands[VH_DSPK] = SimpleNamespace(id=VH_DSPK.value)
+    prod.crs = mock.Mock(return_value=CRS.from_epsg(32631))
+    prod.get_band_file_name = mock.Mock(
+        side_effect=lambda band, pixel_size, **kwargs: f"{band.name}.tif"
+    )
+    prod._is_existing = mock.Mock(
+        side_effect=lambda filename: (tmp_path / filename, False)
+    )
+    prod._restore_from_cache = mock.Mock(return_value=False)
+    prod._already_processed_path = mock.Mock(return_value=None)
+    prod._put_in_cache = mock.Mock()
+    prod._use_native_pre_process = mock.Mock(return_value=False)
+    prod._get_snap_pixel_size = mock.Mock(return_value=10)
+    prod._get_pp_graph = mock.Mock(return_value="pp_graph.xml")
+    prod._get_dem = mock.Mock(return_value=(SimpleNamespace(value="COPDEM"), ""))
+    prod._get_snap_path = mock.Mock(return_value="S1_GRD_test.zip")
+    prod._get_resolution = mock.Mock(return_value=(10, 0.0001))
+    prod._get_predictor = mock.Mock(return_value=3)
+
+    def run_snap(cmd_list, pols: list):
+        # Write one image per given polarisation (plus another band) in the output DIMAP
+        args = dict(arg[2:].split("=", 1) for arg in cmd_list if str(arg)[:2] == "-P")
+        dim_path = pathlib.Path(args["out"].strip('"'))
+        dim_path.touch()
+        data_path = dim_path.with_suffix(".data")
+        data_path.mkdir()
+        for img_name, value in [(f"Sigma0_{pol}", i + 1) for i, pol in enumerate(pols)]:
+            with rasterio.open(
+                data_path / f"{img_name}.img",
+                "w",
+                driver="GTiff",
+                width=4,
+                height=3,
+                count=1,
+                dtype=np.float32,
+                crs="EPSG:32631",
+                transform=rasterio.transform.from_origin(500000, 4800000, 10, 10),
+            ) as img_ds:
+                img_ds.write(np.full((3, 4), value, dtype=np.float32), 1)
+
+    band_list = [VV, VV_DSPK, VH_DSPK]
+    with tempenv.TemporaryEnvironment({"EOREADER_SAR_BATCH_POLARISATIONS": "1"}):
+        with mock.patch(
+            "eoreader.products.sar.sar_product.misc.run_cli",
+            side_effect=lambda cmd_list: run_snap(cmd_list, ["VV", "VH", "elev"]),
+        ) as run_cli_mock:
+            prod._pre_process_snap_batch(band_list, pixel_size=10)
+
+    # Only one SNAP execution for both polarisations
+    run_cli_mock.assert_called_once()
+    assert '-Pcalib_pola="VV,VH"' in run_cli_mock.call_args.args[0]
+    assert prod._put_in_cache.call_count == 2
+
+    # Each band written from its own image
+    for band, value in [(VV, 1), (VH, 2)]:
+        band_arr = utils.read(tmp_path / f"{band.name}.tif")
+        np.testing.assert_array_equal(band_arr.data, np.full((1, 3, 4), value))
+
+    # A missing polarisation is not mosaicked from the other images of the DIMAP
+    for tif_path in tmp_path.glob("*.tif"):
+        tif_path.unlink()
+    with tempenv.TemporaryEnvironment({"EOREADER_SAR_BATCH_POLARISATIONS": "1"}):
+        with mock.patch(
+            "eoreader.products.sar.sar_product.misc.run_cli",
+            side_effect=lambda cmd_list: run_snap(cmd_list, ["VV", "elev"]),
+        ):
+            with pytest.raises(FileNotFoundError, match="VH"):
+                prod._pre_process_snap_batch(band_list, pixel_size=10)
+
+
+def test_sar_cache_key(bare_product):
+    """Test that the disk cache keys of the SAR bands depend on their pre-processing"""
+    prod = bare_product(
+        S1Product,
+        name="S1_GRD_test",
+        condensed_name="S1_GRD_test",
+        _has_native_pre_process=mock.Mock(return_value=True),
+    )
+
+    with tempenv.TemporaryEnvironment({DEM_PATH: "dem_1.tif"}):
+        key = prod._get_cache_key("VV.tif")
+        assert key == prod._get_cache_key("VV.tif")
+        assert key != prod._get_cache_key("VV.tif", **{SAR_ENGINE: "native"})
+
+    with tempenv.TemporaryEnvironment({DEM_PATH: "dem_2.tif"}):
+        assert key != prod._get_cache_key("VV.tif")
+
+
+def test_sar_fill_na():
+    """Test that the SAR gap filling gives the same results on numpy and dask arrays"""
+    rows, cols = np.mgrid[0:60, 0:70]
+    band_arr = (rows + 2 * cols).astype(np.float32)
+    band_arr[20:24, 30:33] = np.nan  # Hole inside the footprint
+    band_arr[:, :3] = np.nan  # Border strip, within the limit of the valid data
+    band_arr[40:, 50:] = np.nan  # Corner outside the footprint
+    arr = xr.DataArray(band_arr[np.newaxis], dims=["band", "y", "x"])
+
+    for method in ["nearest", "idw"]:
+        filled = _fill_na(arr, method, 10)
+        filled_dask = _fill_na(arr.chunk({"y": 25, "x": 25}), method, 10)
+        xr.testing.assert_allclose(filled, filled_dask.compute())
+
+        # Only the hole is filled: the footprint is not extended
+        assert np.isfinite(filled.data[0, 20:24, 30:33]).all()
+        assert np.isnan(filled.data[0, :, :3]).all()
+        assert np.isnan(filled.data[0, 45:, 55:]).all()
+        valid = np.isfinite(band_arr)
+        np.testing.assert_array_equal(filled.data[0][valid], band_arr[valid])
+
+    with pytest.raises(ValueError):
+        _fill_na(arr, "cubic", 10)
+
+
+def _rpc_raw_image(raw_path) -> rasterio.rpc.RPC:
+    """Write a raw 200x200 image (without CRS) around 3°E, 43°N, shifted by 20 pixels in range every 1000 m, and return its RPCs"""
+    rpcs = rasterio.rpc.RPC(
+        height_off=0,
+        height_scale=500,
+        lat_off=43,
+        lat_scale=0.01,
+        line_off=100,
+        line_scale=100,
+        long_off=3,
+        long_scale=0.01,
+        samp_off=100,
+        samp_scale=100,
+        line_num_coeff=[0, 0, -1] + [0] * 17,
+        line_den_coeff=[1] + [0] * 19,
+        samp_num_coeff=[0, 1, 0, 0.1] + [0] * 16,
+        samp_den_coeff=[1] + [0] * 19,
+    )
+    raw_arr = 10 + np.add.outer(np.sin(np.arange(200) / 7), np.cos(np.arange(200) / 5))
+    with rasterio.open(
+        raw_path,
+        "w",
+        driver="GTiff",
+        width=200,
+        height=200,
+        count=1,
+        dtype=np.float32,
+        rpcs=rpcs,
+    ) as raw_ds:
+        raw_ds.write(raw_arr.astype(np.float32), 1)
+    return rpcs
+
+
+def test_tiled_orthorectification(tmp_path, bare_product):
+    """Test that orthorectifying tile by tile gives the same result as in one tile, even with a strong relief"""
+    raw_path = tmp_path / "raw.tif"
+    rpcs = _rpc_raw_image(raw_path)
+
+    # DEM with a 1500 m hill in the middle of the image
+    dem_path = tmp_path / "dem.tif"
+    lon, lat = np.meshgrid(
+        np.linspace(2.985, 3.015, 150), np.linspace(43.015, 42.985, 150)
+    )
+    dem = 1500 * np.exp(-((lon - 3) ** 2 + (lat - 43) ** 2) / 0.0015**2)
+    with rasterio.open(
+        dem_path,
+        "w",
+        driver="GTiff",
+        width=150,
+        height=150,
+        count=1,
+        dtype=np.float32,
+        crs="EPSG:4326",
+        transform=rasterio.transform.from_bounds(
+            2.985, 42.985, 3.015, 43.015, 150, 150
+        ),
+    ) as dem_ds:
+        dem_ds.write(dem.astype(np.float32), 1)
+
+    prod = bare_product(
+        Product,
+        condensed_name="VHR_test",
+        pixel_size=10,
+        band_resampling=Resampling.bilinear,
+        bands={},
+        _raw_nodata=0,
+        crs=mock.Mock(return_value=CRS.from_epsg(32631)),
+        _get_raw_crs=mock.Mock(return_value=CRS.from_epsg(4326)),
+        _get_rpc_dem_path=mock.Mock(side_effect=str),
+    )
+
+    ortho_arrs = {}
+    for tile_size in [10000, 32]:
+        ortho_path = tmp_path / f"ortho_{tile_size}.tif"
+        with tempenv.TemporaryEnvironment({TILE_SIZE: str(tile_size)}):
+            prod._orthorectify(
+                raw_path, rpcs, dem_path, {ortho_path: [1]}, driver="GTiff"
+            )
+        with rasterio.open(ortho_path) as ortho_ds:
+            ortho_arrs[tile_size] = ortho_ds.read(1, masked=True)
+
+    # Same footprint and values (GDAL's approximate transformer gives small differences)
+    whole, tiled = ortho_arrs[10000], ortho_arrs[32]
+    assert whole.count() > 0.5 * whole.size
+    np.testing.assert_array_equal(whole.mask, tiled.mask)
+    np.testing.assert_allclose(tiled.compressed(), whole.compressed(), atol=0.05)
+
+    # The back-projection errors are raised (not silently written as nodata tiles)
+    # and the datasets opened by the threads are closed anyway
+    opened = []
+    rio_open = rasterio.open
+
+    def open_ds(*args, **kwargs):
+        opened.append(rio_open(*args, **kwargs))
+        return opened[-1]
+
+    with (
+        mock.patch("rasterio.transform.RPCTransformer") as rpc_tr_mock,
+        mock.patch("rasterio.open", side_effect=open_ds),
+    ):
+        rpc_tr_mock.return_value.rowcol.side_effect = RuntimeError("RPC error")
+        with pytest.raises(RuntimeError, match="RPC error"):
+            prod._orthorectify(
+                raw_path, rpcs, dem_path, {tmp_path / "error.tif": [1]}, driver="GTiff"
+            )
+    assert {str(raw_path), str(dem_path)} <= {ds.name for ds in opened}
+    assert all(ds.closed for ds in opened)
+    rpc_tr_mock.return_value.close.assert_called()
+
+    # VHR products use the RPCs given by the user
+    vhr_prod = bare_product(
+        VhrProduct,
+        _get_dem_path=mock.Mock(return_value=str(dem_path)),
+        _get_tile_path=mock.Mock(return_value=raw_path),
+        _orthorectify=mock.Mock(),
+    )
+    vhr_prod._orthorectify_tile({tmp_path / "vhr.tif": [1]}, rpcs=rpcs)
+    assert vhr_prod._orthorectify.call_args.kwargs["rpcs"] is rpcs
+
+    # ... and cannot be orthorectified without RPCs
+    no_rpc_path = tmp_path / "no_rpc.tif"
+    with rasterio.open(
+        no_rpc_path, "w", driver="GTiff", width=2, height=2, count=1, dtype=np.uint8
+    ) as no_rpc_ds:
+        no_rpc_ds.write(np.ones((2, 2), dtype=np.uint8), 1)
+    vhr_prod._get_tile_path = mock.Mock(return_value=no_rpc_path)
+    with pytest.raises(InvalidProductError):
+        vhr_prod._orthorectify_tile({tmp_path / "vhr.tif": [1]})
+
+
+def test_sv1_default_transform(tmp_path, bare_product):
+    """Test that the default grid of non orthorectified SuperView-1 products is computed from the RPCs of their tile"""
+    mux_path = tmp_path / "MUX.tiff"
+    rpcs = _rpc_raw_image(mux_path)
+
+    # Flat DEM
+    dem_path = str(tmp_path / "dem.tif")
+    with rasterio.open(
+        dem_path,
+        "w",
+        driver="GTiff",
+        width=10,
+        height=10,
+        count=1,
+        dtype=np.float32,
+        crs="EPSG:4326",
+        transform=rasterio.transform.from_bounds(2.98, 42.98, 3.02, 43.02, 10, 10),
+    ) as dem_ds:
+        dem_ds.write(np.full((10, 10), 200, dtype=np.float32), 1)
+
+    prod = bare_product(
+        Sv1Product,
+        condensed_name="SV1_L1B_test",
+        pixel_size=10,
+        product_type=Sv1ProductType.L1B,
+        _proj_prod_type=[Sv1ProductType.L1B],
+        crs=mock.Mock(return_value=CRS.from_epsg(32631)),
+        get_default_band=mock.Mock(return_value=RED),
+        _get_path=mock.Mock(return_value=mux_path),
+        _get_band_folder=mock.Mock(return_value=tmp_path),
+        _get_out_path=mock.Mock(
+            side_effect=lambda filename: (tmp_path / filename, False)
+        ),
+        _get_dem_path=mock.Mock(return_value=dem_path),
+        _get_rpc_dem_path=mock.Mock(side_effect=str),
+        _get_raw_crs=mock.Mock(return_value=CRS.from_epsg(4326)),
+    )
+
+    tr, width, height, crs = prod.default_transform()
+    prod._get_path.assert_called_once_with("MUX", "tiff")
+    assert crs == CRS.from_epsg(32631)
+    assert (tr, width, height) == prod._get_ortho_grid(
+        mux_path, rpcs=rpcs, dem_path=dem_path, pixel_size=10
+    )
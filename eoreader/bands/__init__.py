@@ -96,7 +96,11 @@ from eoreader.bands.indices import (
     TCWET,
     SCI,
     compute_index,
+    compute_indices,
     get_eoreader_indices,
+    get_index,
+    INDEX_REGISTRY,
+    SpectralIndex,
 )
 
 
@@ -112,6 +116,10 @@ __all__ += [
     "TCWET",
     "SCI",
     "compute_index",
+    "compute_indices",
+    "get_index",
+    "INDEX_REGISTRY",
+    "SpectralIndex",
 ]
 
 # Spyndex indices
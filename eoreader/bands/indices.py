@@ -19,9 +19,11 @@ Set of usual spectral indices.
 **Note**: This is easier to manage indices as raw functions in a file rather than stored in a class
 """
 
-import contextlib
+import ast
 import inspect
 import logging
+import numbers
+import operator
 import re
 import sys
 from functools import wraps
@@ -48,6 +50,7 @@ from eoreader.bands.band_names import (
     SpectralBandNames,
 )
 from eoreader.bands.mappings import EOREADER_TO_SPYNDEX_DICT, SPYNDEX_TO_EOREADER_DICT
+from eoreader.exceptions import InvalidIndexError
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 np.seterr(divide="ignore", invalid="ignore")
@@ -72,6 +75,284 @@ EOREADER_DERIVATIVES = {
 }
 
 
+# Constants set by EOReader for some Spyndex indices
+SPYNDEX_CONSTANTS = {
+    "SAVI": {"L": 0.5},
+    "EVI": {"g": 2.5, "C1": 6.0, "C2": 7.5, "L": 1.0},
+}
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+class SpectralIndex:
+    """
+    Spectral index, compiled once with its known band dependencies.
+
+    Spyndex indices (and their EOReader derivatives) are parsed and compiled from their formula,
+    EOReader indices are implemented as functions in this module.
+
+    .. code-block:: python
+
+        >>> from eoreader.bands import INDEX_REGISTRY
+        >>> ndvi = INDEX_REGISTRY["NDVI"]
+        >>> ndvi.needed_bands
+        [<SpectralBandNames.NIR: 'NIR'>, <SpectralBandNames.RED: 'RED'>]
+        >>> ndvi.get_memory_cost((10980, 10980)) / 1024**3
+        1.7965
+    """
+
+    def __init__(
+        self,
+        name: str,
+        formula: str = None,
+        symbols: dict = None,
+        function: Callable = None,
+    ) -> None:
+        self.name = name
+        """ Index name """
+
+        self.formula = formula
+        """ Index formula (with Spyndex symbols), :code:`None` for EOReader functions """
+
+        self.function = function
+        """ Index function, :code:`None` for indices defined by a formula """
+
+        self.is_derivative = symbols is not None
+        """ Is this index an EOReader derivative of a Spyndex index (with its own band mapping)? """
+
+        self.expression = None
+        """ Parsed expression of the formula """
+
+        self.code = None
+        """ Compiled formula """
+
+        self.variables = []
+        """ Symbols used in the formula """
+
+        if formula is not None:
+            self.expression = ast.parse(formula, mode="eval").body
+            self.code = compile(formula, f"<{name}>", "eval")
+            self.variables = list(
+                dict.fromkeys(
+                    node.id
+                    for node in ast.walk(self.expression)
+                    if isinstance(node, ast.Name)
+                )
+            )
+
+        if self.is_derivative:
+            self.symbols = symbols
+        else:
+            self.symbols = {
+                variable: SPYNDEX_TO_EOREADER_DICT[variable]
+                for variable in self.variables
+                if variable in SPYNDEX_TO_EOREADER_DICT
+            }
+        """ Band symbols: {symbol: band} """
+
+        if function is not None:
+            self.needed_bands = _get_function_needed_bands(function)
+        else:
+            self.needed_bands = list(dict.fromkeys(self.symbols.values()))
+        """ Bands needed to compute the index """
+
+        self.parameters = [
+            variable for variable in self.variables if variable not in self.symbols
+        ]
+        """ Non-band parameters of the formula (i.e. :code:`L` for SAVI) """
+
+    def __call__(self, bands: dict, **kwargs):
+        """
+        Compute the index, without any parsing.
+
+        Args:
+            bands (dict): Band dictionary
+            **kwargs: Kwargs (i.e. parameters of the index)
+
+        Returns:
+            Computed index (same type as the data of the bands)
+        """
+        if self.function is not None:
+            return self.function(bands)
+
+        band_symbols, parameters = self._get_symbols(bands, **kwargs)
+        namespace = {symbol: bands[band].data for symbol, band in band_symbols.items()}
+        namespace.update(parameters)
+        return eval(self.code, {}, namespace)
+
+    def _get_symbols(self, bands: dict, **kwargs) -> tuple[dict, dict]:
+        """
+        Get the bands and parameters corresponding to the symbols of the formula.
+
+        Args:
+            bands (dict): Band dictionary
+            **kwargs: Kwargs (i.e. parameters of the index)
+
+        Returns:
+            tuple[dict, dict]: Band symbols as {symbol: band} and parameters as {symbol: value}
+        """
+        if self.is_derivative:
+            band_symbols = self.symbols
+            available_params = {}
+        else:
+            loaded_symbols = {
+                EOREADER_TO_SPYNDEX_DICT[band]: band
+                for band in bands
+                if band in EOREADER_TO_SPYNDEX_DICT
+            }
+            # Workaround for: https://github.com/awesome-spectral-indices/awesome-spectral-indices/issues/74
+            if "T1" in loaded_symbols:
+                loaded_symbols.setdefault("T", loaded_symbols["T1"])
+
+            band_symbols = {
+                variable: loaded_symbols[variable]
+                for variable in self.variables
+                if variable in loaded_symbols
+            }
+            available_params = kwargs.copy()
+            available_params.update(SPYNDEX_CONSTANTS.get(self.name, {}))
+
+        parameters = {}
+        for variable in self.variables:
+            if variable in band_symbols:
+                if band_symbols[variable] not in bands:
+                    raise InvalidIndexError(
+                        f"Missing band {band_symbols[variable]} to compute {self.name}."
+                    )
+            elif variable in available_params:
+                parameters[variable] = available_params[variable]
+            else:
+                raise InvalidIndexError(
+                    f"Missing parameter '{variable}' to compute {self.name}."
+                )
+
+        return band_symbols, parameters
+
+    def normalize(self, bands: dict, namespace: dict, **kwargs) -> ast.expr:
+        """
+        Get the expression of the index, normalized to be evaluated with other indices.
+
+        The symbols of the formula are replaced by the names of the bands (added to the namespace)
+        and the scalar parameters by their values, so that the same sub-expression has the same representation across indices.
+        Commutative operands are sorted for the same reason.
+
+        Args:
+            bands (dict): Band dictionary
+            namespace (dict): Namespace ({name: array}) to complete
+            **kwargs: Kwargs (i.e. parameters of the index)
+
+        Returns:
+            ast.expr: Normalized expression of the index
+        """
+        band_symbols, parameters = self._get_symbols(bands, **kwargs)
+
+        def _normalize(node: ast.AST) -> ast.AST:
+            if isinstance(node, ast.Name):
+                if node.id in band_symbols:
+                    band = band_symbols[node.id]
+                    name = f"{type(band).__name__}.{band.name}"
+                    namespace[name] = bands[band].data
+                    return ast.Name(id=name, ctx=ast.Load())
+                elif isinstance(parameters[node.id], numbers.Number):
+                    return ast.Constant(value=parameters[node.id])
+                else:
+                    name = f"{self.name}.{node.id}"
+                    namespace[name] = parameters[node.id]
+                    return ast.Name(id=name, ctx=ast.Load())
+            elif isinstance(node, ast.BinOp):
+                left = _normalize(node.left)
+                right = _normalize(node.right)
+                if isinstance(node.op, (ast.Add, ast.Mult)) and ast.dump(
+                    left
+                ) > ast.dump(right):
+                    left, right = right, left
+                return ast.BinOp(left=left, op=node.op, right=right)
+            elif isinstance(node, ast.UnaryOp):
+                return ast.UnaryOp(op=node.op, operand=_normalize(node.operand))
+            elif isinstance(node, ast.Constant):
+                return node
+            else:
+                raise InvalidIndexError(
+                    f"Unsupported expression in the formula of {self.name}: {ast.dump(node)}"
+                )
+
+        return _normalize(self.expression)
+
+    @property
+    def nof_temporaries(self) -> int:
+        """
+        Maximum number of temporary arrays alive at the same time while computing the index
+        (Ershov number of the expression).
+
+        Returns:
+            int: Number of temporary arrays
+        """
+        if self.expression is None:
+            # Function: the output and one temporary
+            return 2
+
+        def _ershov(node: ast.AST) -> int:
+            if isinstance(node, ast.BinOp):
+                left = _ershov(node.left)
+                right = _ershov(node.right)
+                return max(left, right) if left != right else left + 1
+            elif isinstance(node, ast.UnaryOp):
+                return max(_ershov(node.operand), 1)
+            else:
+                return 0
+
+        return max(_ershov(self.expression), 1)
+
+    def get_memory_cost(self, shape: tuple, dtype=np.float32) -> int:
+        """
+        Estimate the peak memory needed to compute this index (needed bands and temporary arrays)
+
+        Args:
+            shape (tuple): Shape of the bands
+            dtype: Data type of the bands (:code:`float32` by default)
+
+        Returns:
+            int: Memory cost (in bytes)
+        """
+        return (
+            (len(self.needed_bands) + self.nof_temporaries)
+            * int(np.prod(shape))
+            * np.dtype(dtype).itemsize
+        )
+
+    def __repr__(self) -> str:
+        return f"SpectralIndex({self.name}: {self.formula if self.formula else self.function.__name__})"
+
+
+def _get_function_needed_bands(function: Callable) -> list:
+    """
+    Get the bands needed by an EOReader index function, by parsing its source code.
+
+    Args:
+        function (Callable): Index function
+
+    Returns:
+        list: Needed bands
+    """
+    code = inspect.getsource(inspect.unwrap(function))
+    return list(
+        dict.fromkeys(
+            getattr(SpectralBandNames, band)
+            for band in re.findall(r"bands\[(\w+)\]", code)
+        )
+    )
+
+
 def _idx_fct(function: Callable) -> Callable:
     """
     Decorator of index functions
@@ -101,6 +382,7 @@ def _idx_fct(function: Callable) -> Callable:
 
 def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
     """
+    Compute one spectral index.
 
     Args:
         index (str): Index name (as a string)
@@ -110,53 +392,124 @@ def compute_index(index: str, bands: dict, **kwargs) -> xr.DataArray:
     Returns:
         xr.DataArray: Computed index
     """
+    return compute_indices([index], bands, **kwargs)[index]
 
-    def _compute_params(_bands, **_kwargs):
-        prms = {}
-        for key, value in _bands.items():
-            with contextlib.suppress(KeyError):
-                prms[EOREADER_TO_SPYNDEX_DICT[key]] = value.data
-        prms.update(_kwargs)
-
-        return prms
-
-    if hasattr(spyndex.indices, index):
-        parameters = _compute_params(bands, **kwargs)
-
-        if index == "SAVI":
-            parameters["L"] = 0.5
-        elif index == "EVI":
-            parameters["g"] = 2.5
-            parameters["C1"] = 6.0
-            parameters["C2"] = 7.5
-            parameters["L"] = 1.0
-
-        # Try / except is a workaround for: https://github.com/awesome-spectral-indices/awesome-spectral-indices/issues/74
-        try:
-            index_arr = spyndex.computeIndex(index, parameters)
-        except Exception as ex:
-            if "T1" in parameters:
-                parameters.update({"T": parameters["T1"]})
-                index_arr = spyndex.computeIndex(index, parameters)
-            else:
-                raise ex
-    elif index in EOREADER_DERIVATIVES:
-        idx_name = EOREADER_DERIVATIVES[index][0]
-        params = {
-            key: bands[value].data
-            for key, value in EOREADER_DERIVATIVES[index][1].items()
-        }
-        index_arr = spyndex.computeIndex(idx_name, params)
-    else:
-        index_arr = eval(index)(bands)
 
-    # TODO: check if metadata is kept with spyndex
+def compute_indices(index_list: list, bands: dict, **kwargs) -> dict:
+    """
+    Compute several spectral indices at once.
+
+    The formulas of all the indices are evaluated together,
+    so that their common sub-expressions (i.e. :code:`N - R` or :code:`N + R`) are computed only once.
+    If the bands are dask arrays, the indices share the same dask graph.
+
+    .. code-block:: python
+
+        >>> from eoreader.bands import compute_indices, NIR, RED, BLUE
+        >>> compute_indices(["NDVI", "SAVI", "EVI"], {NIR: nir, RED: red, BLUE: blue})
+        {'NDVI': <xarray.DataArray 'NDVI' ...>, 'SAVI': <xarray.DataArray 'SAVI' ...>, 'EVI': <xarray.DataArray 'EVI' ...>}
+
+    Args:
+        index_list (list): Index names (as strings)
+        bands (dict): Band dictionary
+        **kwargs: Kwargs (i.e. parameters of the indices)
+
+    Returns:
+        dict: Computed indices as {index_name: xr.DataArray}
+    """
+    namespace = {}
+    expressions = {}
+    index_arrays = {}
+    for index in index_list:
+        if index in expressions or index in index_arrays:
+            continue
+
+        spectral_index = get_index(index)
+        if spectral_index.function is not None:
+            index_arrays[index] = spectral_index(bands)
+        elif len(index_list) == 1:
+            # Nothing to share
+            index_arrays[index] = spectral_index(bands, **kwargs)
+        else:
+            expressions[index] = spectral_index.normalize(bands, namespace, **kwargs)
+
+    # Count the sub-expressions to keep only the shared ones in memory
+    sub_expr_count = {}
+    for expression in expressions.values():
+        for node in ast.walk(expression):
+            if isinstance(node, (ast.BinOp, ast.UnaryOp)):
+                key = ast.dump(node)
+                sub_expr_count[key] = sub_expr_count.get(key, 0) + 1
+
+    sub_expr_cache = {}
+    for index, expression in expressions.items():
+        index_arrays[index] = _evaluate_expression(
+            expression, namespace, sub_expr_cache, sub_expr_count
+        )
 
     # Take the first band as a template for xarray
     first_xda = list(bands.values())[0]
-    out_xda = first_xda.copy(data=index_arr)
 
-    return rasters.set_metadata(out_xda, first_xda, new_name=index)
+    out_dict = {}
+    for index in index_list:
+        index_arr = index_arrays[index]
+        if isinstance(index_arr, xr.DataArray):
+            index_arr = index_arr.data
+
+        # Don't upcast the bands (float32 bands should give float32 indices)
+        if (
+            np.issubdtype(first_xda.dtype, np.floating)
+            and np.issubdtype(index_arr.dtype, np.floating)
+            and index_arr.dtype != first_xda.dtype
+        ):
+            index_arr = index_arr.astype(first_xda.dtype)
+
+        out_xda = first_xda.copy(data=index_arr)
+        out_dict[index] = rasters.set_metadata(out_xda, first_xda, new_name=index)
+
+    return out_dict
+
+
+def _evaluate_expression(
+    node: ast.expr, namespace: dict, sub_expr_cache: dict, sub_expr_count: dict
+):
+    """
+    Evaluate a normalized expression, reusing the already computed shared sub-expressions.
+
+    Args:
+        node (ast.expr): Expression
+        namespace (dict): Namespace (band name: array)
+        sub_expr_cache (dict): Already computed shared sub-expressions
+        sub_expr_count (dict): Number of occurrences of every sub-expression
+
+    Returns:
+        Evaluated expression (array or scalar)
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    elif isinstance(node, ast.Name):
+        return namespace[node.id]
+
+    key = ast.dump(node)
+    if key in sub_expr_cache:
+        return sub_expr_cache[key]
+
+    if isinstance(node, ast.BinOp):
+        out = _BIN_OPS[type(node.op)](
+            _evaluate_expression(node.left, namespace, sub_expr_cache, sub_expr_count),
+            _evaluate_expression(node.right, namespace, sub_expr_cache, sub_expr_count),
+        )
+    else:
+        out = _UNARY_OPS[type(node.op)](
+            _evaluate_expression(
+                node.operand, namespace, sub_expr_cache, sub_expr_count
+            )
+        )
+
+    if sub_expr_count.get(key, 0) > 1:
+        sub_expr_cache[key] = out
+
+    return out
 
 
 @_idx_fct
@@ -253,6 +606,16 @@ def SCI(bands: dict) -> xr.DataArray:
     return 3 * bands[GREEN] - bands[RED] - 100
 
 
+# Gather the EOReader functions before their names are overwritten by strings (see the end of the file)
+EOREADER_FUNCTIONS = {
+    name: function
+    for name, function in inspect.getmembers(
+        sys.modules[__name__], predicate=inspect.isfunction
+    )
+    if name[0].isupper()
+}
+
+
 def get_all_index_names() -> list:
     """
     Get all index names contained in this file
@@ -277,14 +640,7 @@ def get_eoreader_indices() -> list:
     Returns:
         list: list of all EOReader indices
     """
-    eoreader_indices = []
-
-    functions = inspect.getmembers(sys.modules[__name__], predicate=inspect.isfunction)
-
-    for name, fct in functions:
-        # Do not gather this fct nor da.true_divide
-        if name[0].isupper():
-            eoreader_indices.append(fct.__name__)
+    eoreader_indices = list(EOREADER_FUNCTIONS.keys())
 
     # Add derivatives
     for index, deriv_list in EOREADER_DERIVATIVES.items():
@@ -346,31 +702,7 @@ def get_needed_bands(index: str) -> list:
     Returns:
         list: Needed bands for the index function
     """
-    if is_eoreader_idx(index):
-        if index in EOREADER_DERIVATIVES:
-            return list(EOREADER_DERIVATIVES[index][1].values())
-        else:
-            # Get source code from this fct
-            code = inspect.getsource(eval(index))
-
-            # Parse band's signature
-            b_regex = r"spb\.\w+"
-
-            return [
-                getattr(SpectralBandNames, b.split(".")[-1])
-                for b in re.findall(b_regex, code)
-            ]
-    elif is_spyndex_idx(index):
-        # Don't need gamma etc.
-        return [
-            SPYNDEX_TO_EOREADER_DICT.get(band)
-            for band in getattr(spyndex.indices, index).bands
-            if SPYNDEX_TO_EOREADER_DICT.get(band) is not None
-        ]
-    else:
-        raise NotImplementedError(
-            f"Non existing index, please chose a spectral indice among {get_all_index_names()}"
-        )
+    return list(get_index(index).needed_bands)
 
 
 def get_all_needed_bands() -> dict:
@@ -429,6 +761,58 @@ def is_index(index) -> bool:
     return str(index) in get_all_index_names()
 
 
+def get_index(index: str) -> SpectralIndex:
+    """
+    Get a compiled spectral index from the registry
+
+    .. code-block:: python
+
+        >>> get_index(NDVI)
+        SpectralIndex(NDVI: (N-R)/(N+R))
+
+    Args:
+        index (str): Index name (as a string)
+
+    Returns:
+        SpectralIndex: Compiled spectral index
+    """
+    try:
+        return INDEX_REGISTRY[str(index)]
+    except KeyError:
+        raise NotImplementedError(
+            f"Non existing index, please chose a spectral indice among {get_all_index_names()}"
+        ) from None
+
+
+def _get_index_registry() -> dict:
+    """
+    Compile all the spectral indices (Spyndex, EOReader derivatives and EOReader functions)
+
+    Returns:
+        dict: Compiled spectral indices as {index_name: SpectralIndex}
+    """
+    registry = {
+        index: SpectralIndex(index, formula=getattr(spyndex.indices, index).formula)
+        for index in get_spyndex_indices()
+    }
+
+    for index, (spyndex_idx, symbols) in EOREADER_DERIVATIVES.items():
+        if hasattr(spyndex.indices, spyndex_idx):
+            registry[index] = SpectralIndex(
+                index,
+                formula=getattr(spyndex.indices, spyndex_idx).formula,
+                symbols=symbols,
+            )
+
+    for index, function in EOREADER_FUNCTIONS.items():
+        registry[index] = SpectralIndex(index, function=function)
+
+    return registry
+
+
+INDEX_REGISTRY = _get_index_registry()
+""" Registry of all the compiled spectral indices """
+
 NEEDED_BANDS = get_all_needed_bands()
 
 # Set all indices
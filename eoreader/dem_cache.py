@@ -0,0 +1,406 @@
+# Copyright 2025, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Process-wide DEM tile cache.
+
+The DEM (often a huge global VRT or a remote file) is split into a regular grid of tiles.
+Each tile is read only once from the DEM and stored as a local :code:`float32` GeoTiff in a :py:class:`DiskCache`
+(the EOReader disk cache if :code:`EOREADER_CACHE_DIR` is set, a temporary directory otherwise),
+so that neighbouring products share their DEM tiles instead of reading the DEM again.
+
+The products extract their bounding box from these tiles into a small local COG,
+used for their DEM, SLOPE and HILLSHADE bands and for the RPC orthorectification.
+
+The DEM tile cache is disabled by default. Set :code:`EOREADER_DEM_TILE_CACHE` to :code:`1` to enable it.
+"""
+
+import atexit
+import contextlib
+import logging
+import math
+import os
+import shutil
+import tempfile
+import threading
+from typing import Union
+
+import numpy as np
+import rasterio
+from rasterio import shutil as rio_shutil
+from rasterio import warp, windows
+from rasterio.crs import CRS
+from rasterio.errors import RasterioIOError
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME
+from eoreader.disk_cache import DiskCache, get_disk_cache
+from eoreader.env_vars import CACHE_MAX_SIZE, DEM_TILE_CACHE
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+DEFAULT_DEM_TILE_SIZE = 2048
+""" Default size of the DEM tiles (in DEM pixels) """
+
+
+class DemTileCache:
+    """
+    Spatial index of the tiles of a DEM, backed by a local cache of these tiles.
+
+    The tiles are a regular grid over the DEM pixels, identified by their (row, col) in this grid.
+
+    .. code-block:: python
+
+        >>> from eoreader.dem_cache import DemTileCache
+        >>> from eoreader.disk_cache import DiskCache
+        >>> dem_cache = DemTileCache("/path/to/dem.vrt", DiskCache("/path/to/cache"))
+        >>> dem_cache.get_tile_ids((300000, 4800000, 310000, 4810000), "EPSG:32631")
+        [(23, 70), (23, 71)]
+        >>> dem_cache.extract((300000, 4800000, 310000, 4810000), "EPSG:32631", "/path/to/subset.tif")
+    """
+
+    def __init__(
+        self,
+        dem_path: AnyPathStrType,
+        disk_cache: DiskCache,
+        tile_size: int = DEFAULT_DEM_TILE_SIZE,
+    ) -> None:
+        self.dem_path = str(dem_path)
+        """ DEM path """
+
+        self.disk_cache = disk_cache
+        """ Disk cache storing the tiles """
+
+        self.tile_size = tile_size
+        """ Size of the tiles (in DEM pixels) """
+
+        with rasterio.open(self.dem_path) as dem_ds:
+            self.crs = dem_ds.crs
+            """ DEM CRS """
+
+            self.transform = dem_ds.transform
+            """ DEM transform """
+
+            self.width = dem_ds.width
+            """ DEM width """
+
+            self.height = dem_ds.height
+            """ DEM height """
+
+            self.nodata = dem_ds.nodata
+            """ DEM nodata """
+
+        self._tile_locks = {}
+        self._tile_locks_lock = threading.Lock()
+
+    def _get_window(
+        self, bounds: tuple, bounds_crs: Union[CRS, str], margin: int = 0
+    ) -> Union[windows.Window, None]:
+        """
+        Get the DEM window covering the given bounds (snapped on the DEM pixels), with a margin.
+
+        Args:
+            bounds (tuple): Bounds (left, bottom, right, top)
+            bounds_crs (Union[CRS, str]): CRS of the bounds
+            margin (int): Margin (in DEM pixels)
+
+        Returns:
+            Union[windows.Window, None]: DEM window, None if the bounds are outside the DEM
+        """
+        dem_bounds = warp.transform_bounds(
+            bounds_crs, self.crs, *bounds, densify_pts=21
+        )
+        win = windows.from_bounds(*dem_bounds, transform=self.transform)
+        col_min = max(0, math.floor(win.col_off) - margin)
+        row_min = max(0, math.floor(win.row_off) - margin)
+        col_max = min(self.width, math.ceil(win.col_off + win.width) + margin)
+        row_max = min(self.height, math.ceil(win.row_off + win.height) + margin)
+        if col_min >= col_max or row_min >= row_max:
+            return None
+
+        return windows.Window(col_min, row_min, col_max - col_min, row_max - row_min)
+
+    def get_tile_ids(
+        self, bounds: tuple, bounds_crs: Union[CRS, str], margin: int = 0
+    ) -> list:
+        """
+        Get the IDs of the tiles intersecting the given bounds.
+
+        Args:
+            bounds (tuple): Bounds (left, bottom, right, top)
+            bounds_crs (Union[CRS, str]): CRS of the bounds
+            margin (int): Margin (in DEM pixels)
+
+        Returns:
+            list: IDs of the tiles, as (row, col)
+        """
+        win = self._get_window(bounds, bounds_crs, margin)
+        if win is None:
+            return []
+
+        return [
+            (row, col)
+            for row in range(
+                win.row_off // self.tile_size,
+                (win.row_off + win.height - 1) // self.tile_size + 1,
+            )
+            for col in range(
+                win.col_off // self.tile_size,
+                (win.col_off + win.width - 1) // self.tile_size + 1,
+            )
+        ]
+
+    def get_tile_window(self, tile_id: tuple) -> windows.Window:
+        """
+        Get the DEM window of a tile.
+
+        Args:
+            tile_id (tuple): Tile ID, as (row, col)
+
+        Returns:
+            windows.Window: DEM window of the tile
+        """
+        row, col = tile_id
+        row_off = row * self.tile_size
+        col_off = col * self.tile_size
+        return windows.Window(
+            col_off,
+            row_off,
+            min(self.tile_size, self.width - col_off),
+            min(self.tile_size, self.height - row_off),
+        )
+
+    def _get_tile_key(self, tile_id: tuple) -> str:
+        """Get the disk cache key of a tile"""
+        return DiskCache.get_key("DEM tile", self.dem_path, self.tile_size, *tile_id)
+
+    def get_tile(self, tile_id: tuple) -> AnyPathType:
+        """
+        Get the path of a cached tile, reading it from the DEM if not already cached.
+
+        Args:
+            tile_id (tuple): Tile ID, as (row, col)
+
+        Returns:
+            AnyPathType: Path of the cached tile
+        """
+        key = self._get_tile_key(tile_id)
+        tile_path = self.disk_cache.get(key, ".tif")
+        if tile_path is not None:
+            return tile_path
+
+        # Only read a tile once per process
+        with self._tile_locks_lock:
+            tile_lock = self._tile_locks.setdefault(key, threading.Lock())
+
+        with tile_lock:
+            tile_path = self.disk_cache.get(key, ".tif")
+            if tile_path is None:
+                tile_path = self._fetch_tile(tile_id, key)
+
+        return tile_path
+
+    def _fetch_tile(self, tile_id: tuple, key: str) -> AnyPathType:
+        """
+        Read a tile from the DEM and store it in the disk cache.
+
+        Args:
+            tile_id (tuple): Tile ID, as (row, col)
+            key (str): Disk cache key of the tile
+
+        Returns:
+            AnyPathType: Path of the cached tile
+        """
+        LOGGER.debug(f"Reading the DEM tile {tile_id} from {self.dem_path}")
+        tile_win = self.get_tile_window(tile_id)
+        with rasterio.open(self.dem_path) as dem_ds:
+            tile_arr = dem_ds.read(1, window=tile_win, out_dtype=np.float32)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "tile.tif")
+            with rasterio.open(
+                tmp_path,
+                "w",
+                driver="GTiff",
+                dtype="float32",
+                count=1,
+                width=tile_win.width,
+                height=tile_win.height,
+                crs=self.crs,
+                transform=windows.transform(tile_win, self.transform),
+                nodata=self.nodata,
+                tiled=True,
+                blockxsize=256,
+                blockysize=256,
+                compress="lzw",
+                predictor=3,
+            ) as tile_ds:
+                tile_ds.write(tile_arr, 1)
+
+            tile_path = self.disk_cache.put(tmp_path, key)
+
+        if tile_path is None:
+            raise OSError(f"Cannot store the DEM tile {tile_id} in the disk cache.")
+
+        return tile_path
+
+    def extract(
+        self,
+        bounds: tuple,
+        bounds_crs: Union[CRS, str],
+        out_path: AnyPathStrType,
+        margin: int = 16,
+    ) -> None:
+        """
+        Extract the DEM over the given bounds (with a margin) as a :code:`float32` COG,
+        mosaicking the cached tiles.
+
+        Args:
+            bounds (tuple): Bounds (left, bottom, right, top)
+            bounds_crs (Union[CRS, str]): CRS of the bounds
+            out_path (AnyPathStrType): Output path
+            margin (int): Margin (in DEM pixels)
+        """
+        out_win = self._get_window(bounds, bounds_crs, margin)
+        if out_win is None:
+            raise ValueError(f"The wanted bounds are outside the DEM {self.dem_path}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, "subset.tif")
+            with rasterio.open(
+                tmp_path,
+                "w",
+                driver="GTiff",
+                dtype="float32",
+                count=1,
+                width=out_win.width,
+                height=out_win.height,
+                crs=self.crs,
+                transform=windows.transform(out_win, self.transform),
+                nodata=self.nodata,
+                tiled=True,
+                blockxsize=512,
+                blockysize=512,
+                compress="lzw",
+                BIGTIFF="IF_NEEDED",
+            ) as out_ds:
+                for tile_id in self.get_tile_ids(bounds, bounds_crs, margin):
+                    tile_win = self.get_tile_window(tile_id)
+                    inter = windows.intersection(tile_win, out_win)
+                    tile_arr = self._read_tile(
+                        tile_id,
+                        windows.Window(
+                            inter.col_off - tile_win.col_off,
+                            inter.row_off - tile_win.row_off,
+                            inter.width,
+                            inter.height,
+                        ),
+                    )
+                    out_ds.write(
+                        tile_arr,
+                        1,
+                        window=windows.Window(
+                            inter.col_off - out_win.col_off,
+                            inter.row_off - out_win.row_off,
+                            inter.width,
+                            inter.height,
+                        ),
+                    )
+
+            rio_shutil.copy(
+                tmp_path,
+                str(out_path),
+                driver="COG",
+                compress="lzw",
+                predictor=3,
+                BIGTIFF="IF_NEEDED",
+            )
+
+    def _read_tile(self, tile_id: tuple, window: windows.Window) -> np.ndarray:
+        """
+        Read a window of a cached tile (fetching the tile again if evicted in the meantime).
+
+        Args:
+            tile_id (tuple): Tile ID, as (row, col)
+            window (windows.Window): Window to read, relative to the tile
+
+        Returns:
+            np.ndarray: Tile array
+        """
+        try:
+            with rasterio.open(str(self.get_tile(tile_id))) as tile_ds:
+                return tile_ds.read(1, window=window)
+        except RasterioIOError:
+            LOGGER.debug(f"DEM tile {tile_id} evicted in the meantime. Reading it again.")
+            with rasterio.open(
+                str(self._fetch_tile(tile_id, self._get_tile_key(tile_id)))
+            ) as tile_ds:
+                return tile_ds.read(1, window=window)
+
+
+def is_dem_tile_cache_enabled() -> bool:
+    """
+    Is the DEM tile cache enabled (with :code:`EOREADER_DEM_TILE_CACHE`)?
+
+    Returns:
+        bool: True if the DEM tile cache is enabled
+    """
+    return os.getenv(DEM_TILE_CACHE, "0").lower() in ("1", "true")
+
+
+def get_dem_tile_cache(dem_path: AnyPathStrType) -> Union[DemTileCache, None]:
+    """
+    Get the process-wide tile cache of the given DEM.
+
+    The tiles are stored in the EOReader disk cache if :code:`EOREADER_CACHE_DIR` is set,
+    in a temporary directory (removed at the end of the process) otherwise.
+
+    Args:
+        dem_path (AnyPathStrType): DEM path
+
+    Returns:
+        Union[DemTileCache, None]: DEM tile cache, or :code:`None` if disabled
+    """
+    if not is_dem_tile_cache_enabled():
+        return None
+
+    with _DEM_TILE_CACHES_LOCK:
+        disk_cache = get_disk_cache()
+        if disk_cache is None:
+            disk_cache = _get_tmp_disk_cache()
+
+        key = (str(dem_path), str(disk_cache.root))
+        if key not in _DEM_TILE_CACHES:
+            _DEM_TILE_CACHES[key] = DemTileCache(dem_path, disk_cache)
+        return _DEM_TILE_CACHES[key]
+
+
+_DEM_TILE_CACHES = {}
+_DEM_TILE_CACHES_LOCK = threading.Lock()
+_TMP_DISK_CACHE = []
+
+
+def _get_tmp_disk_cache() -> DiskCache:
+    """Get the temporary disk cache of the DEM tiles (only one per process)"""
+    if not _TMP_DISK_CACHE:
+        max_size = None
+        with contextlib.suppress(ValueError, TypeError):
+            max_size = int(float(os.getenv(CACHE_MAX_SIZE)))
+
+        tmp_dir = tempfile.mkdtemp(prefix="eoreader_dem_tiles_")
+        atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+        _TMP_DISK_CACHE.append(DiskCache(tmp_dir, max_size))
+
+    return _TMP_DISK_CACHE[0]
@@ -0,0 +1,336 @@
+# Copyright 2025, SERTIT-ICube - France, https://sertit.unistra.fr/
+# This file is part of eoreader project
+#     https://github.com/sertit/eoreader
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent on-disk cache, shared between products and processes.
+
+It stores the files computed by EOReader (clean bands, spectral indices, pre-processed SAR bands...)
+under a key derived from everything that makes their content unique (product, band, pixel size, window, cleaning method...),
+so that they can be retrieved even if the product is opened again with another output directory.
+
+The cache is disabled by default. Set :code:`EOREADER_CACHE_DIR` to a local directory to enable it.
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Union
+
+from sertit import AnyPath, path
+from sertit.types import AnyPathStrType, AnyPathType
+
+from eoreader import EOREADER_NAME, __version__
+from eoreader.env_vars import CACHE_DIR, CACHE_MAX_SIZE
+
+LOGGER = logging.getLogger(EOREADER_NAME)
+
+LOCK_EXT = ".lock"
+TMP_EXT = ".tmp"
+DEFAULT_LOCK_TIMEOUT = 600
+""" Default time (in seconds) after which a lock is considered as stale """
+
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache with a size-bounded LRU eviction.
+
+    - Files are stored as :code:`<root>/<key[:2]>/<key><ext>`
+    - Writes are atomic (copy to a temporary file then rename it)
+    - Lock files protect the writes and the eviction against concurrent workers
+    - When the cache exceeds its maximum size, the least recently used files are removed
+
+    .. code-block:: python
+
+        >>> from eoreader.disk_cache import DiskCache
+        >>> disk_cache = DiskCache("/path/to/cache", max_size=50e9)
+        >>> key = disk_cache.get_key("S2A_MSIL1C_20200824T110631", "NDVI", 20)
+        >>> disk_cache.put("/path/to/ndvi.tif", key)
+        >>> disk_cache.get(key, ".tif")
+        '/path/to/cache/3f/3f6a...tif'
+    """
+
+    def __init__(
+        self,
+        root: AnyPathStrType,
+        max_size: int = None,
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+    ) -> None:
+        if path.is_cloud_path(root):
+            raise ValueError(
+                f"The disk cache should be stored on a local directory, not on the cloud: {root}"
+            )
+
+        self.root = AnyPath(root)
+        """ Root directory of the cache """
+
+        self.max_size = max_size
+        """ Maximum size of the cache (in bytes). Unbounded if :code:`None`. """
+
+        self.lock_timeout = lock_timeout
+        """ Time (in seconds) after which a lock is considered as stale """
+
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def get_key(*parts) -> str:
+        """
+        Compute a key from all the given parts (converted to string) and from EOReader's version,
+        so that the files written by another version of EOReader are never retrieved.
+
+        Args:
+            *parts: Everything that makes the cached content unique
+
+        Returns:
+            str: Key (hexadecimal SHA256 digest)
+        """
+        return hashlib.sha256(
+            "|".join(str(part) for part in (__version__, *parts)).encode("utf-8")
+        ).hexdigest()
+
+    def get_path(self, key: str, ext: str = "") -> AnyPathType:
+        """
+        Get the path of a cache entry (existing or not)
+
+        Args:
+            key (str): Entry key
+            ext (str): Entry extension (i.e. :code:`.tif`)
+
+        Returns:
+            AnyPathType: Entry path
+        """
+        return self.root / key[:2] / f"{key}{ext}"
+
+    def get(self, key: str, ext: str = "") -> Union[AnyPathType, None]:
+        """
+        Get the path of an existing cache entry and mark it as recently used.
+
+        Args:
+            key (str): Entry key
+            ext (str): Entry extension (i.e. :code:`.tif`)
+
+        Returns:
+            Union[AnyPathType, None]: Entry path if existing, :code:`None` otherwise
+        """
+        entry_path = self.get_path(key, ext)
+        try:
+            # Update the modification time, used as the last access time for the LRU eviction
+            os.utime(entry_path)
+        except FileNotFoundError:
+            entry_path = None
+
+        return entry_path
+
+    def restore(self, key: str, dst_path: AnyPathStrType) -> bool:
+        """
+        Restore a cache entry to the given path (hard link if possible, copy otherwise).
+
+        Args:
+            key (str): Entry key
+            dst_path (AnyPathStrType): Where to restore the entry
+
+        Returns:
+            bool: True if the entry has been restored
+        """
+        dst_path = AnyPath(dst_path)
+        entry_path = self.get(key, dst_path.suffix)
+        if entry_path is None:
+            return False
+
+        os.makedirs(dst_path.parent, exist_ok=True)
+        tmp_path = dst_path.with_name(f".{dst_path.name}.{uuid.uuid4().hex}{TMP_EXT}")
+        try:
+            try:
+                os.link(entry_path, tmp_path)
+            except OSError:
+                # Different file systems or links not supported
+                shutil.copyfile(entry_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+        except FileNotFoundError:
+            # Entry evicted in the meantime
+            return False
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+
+        LOGGER.debug(f"{dst_path.name} restored from the disk cache.")
+        return True
+
+    def put(self, src_path: AnyPathStrType, key: str) -> Union[AnyPathType, None]:
+        """
+        Store a file in the cache (atomically) and evict the least recently used entries if needed.
+
+        Args:
+            src_path (AnyPathStrType): Path of the file to store
+            key (str): Entry key
+
+        Returns:
+            Union[AnyPathType, None]: Entry path or :code:`None` if the file cannot be stored
+        """
+        src_path = AnyPath(src_path)
+        entry_path = self.get_path(key, src_path.suffix)
+        os.makedirs(entry_path.parent, exist_ok=True)
+
+        try:
+            with self.lock(key):
+                if not entry_path.exists():
+                    tmp_path = entry_path.with_name(
+                        f".{entry_path.name}.{uuid.uuid4().hex}{TMP_EXT}"
+                    )
+                    try:
+                        shutil.copyfile(src_path, tmp_path)
+                        os.replace(tmp_path, entry_path)
+                    finally:
+                        with contextlib.suppress(FileNotFoundError):
+                            os.remove(tmp_path)
+        except (OSError, TimeoutError) as exc:
+            LOGGER.debug(f"Cannot store {src_path.name} in the disk cache: {exc}")
+            return None
+
+        self.evict()
+        return entry_path
+
+    def _entries(self) -> list:
+        """
+        Get all the entries of the cache (discarding lock and temporary files)
+
+        Returns:
+            list: List of (path, size, last access time)
+        """
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith((LOCK_EXT, TMP_EXT)):
+                    continue
+                entry_path = os.path.join(dirpath, filename)
+                with contextlib.suppress(FileNotFoundError):
+                    stat = os.stat(entry_path)
+                    entries.append((entry_path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def size(self) -> int:
+        """
+        Get the current size of the cache
+
+        Returns:
+            int: Size of the cache (in bytes)
+        """
+        return sum(entry[1] for entry in self._entries())
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in its maximum size.
+        """
+        if self.max_size is None:
+            return
+
+        try:
+            with self.lock("eviction"):
+                entries = self._entries()
+                cache_size = sum(entry[1] for entry in entries)
+
+                # Oldest first
+                for entry_path, entry_size, _ in sorted(entries, key=lambda e: e[2]):
+                    if cache_size <= self.max_size:
+                        break
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(entry_path)
+                        cache_size -= entry_size
+                        LOGGER.debug(
+                            f"{path.get_filename(entry_path)} evicted from the disk cache."
+                        )
+        except TimeoutError:
+            LOGGER.debug("Disk cache eviction skipped: the cache is locked.")
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache
+        """
+        for entry_path, _, _ in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry_path)
+
+    @contextlib.contextmanager
+    def lock(self, key: str):
+        """
+        Lock a cache entry, to prevent other workers (threads or processes) writing it at the same time.
+
+        Stale locks (older than :code:`lock_timeout`) are broken.
+
+        Args:
+            key (str): Entry key
+
+        Raises:
+            TimeoutError: If the lock cannot be acquired before :code:`lock_timeout`
+        """
+        lock_path = str(self.root / f"{key}{LOCK_EXT}")
+        start = time.monotonic()
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                with contextlib.suppress(FileNotFoundError):
+                    if time.time() - os.path.getmtime(lock_path) > self.lock_timeout:
+                        LOGGER.debug(f"Breaking stale lock {lock_path}")
+                        os.remove(lock_path)
+                        continue
+
+                if time.monotonic() - start > self.lock_timeout:
+                    raise TimeoutError(f"Cannot acquire {lock_path}") from None
+                time.sleep(0.1)
+
+        try:
+            yield
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(lock_path)
+
+
+def get_disk_cache() -> Union[DiskCache, None]:
+    """
+    Get the disk cache set by the environment variables :code:`EOREADER_CACHE_DIR` and :code:`EOREADER_CACHE_MAX_SIZE`.
+
+    Returns:
+        Union[DiskCache, None]: Disk cache, or :code:`None` if disabled
+    """
+    cache_dir = os.getenv(CACHE_DIR)
+    if not cache_dir:
+        return None
+
+    if path.is_cloud_path(cache_dir):
+        LOGGER.warning(
+            f"The disk cache should be stored on a local directory, not on the cloud ({cache_dir}). Disabling it."
+        )
+        return None
+
+    max_size = None
+    with contextlib.suppress(ValueError, TypeError):
+        max_size = int(float(os.getenv(CACHE_MAX_SIZE)))
+
+    return _get_disk_cache(cache_dir, max_size)
+
+
+_DISK_CACHES = {}
+
+
+def _get_disk_cache(cache_dir: str, max_size: int) -> DiskCache:
+    """Only create one disk cache object per configuration"""
+    if (cache_dir, max_size) not in _DISK_CACHES:
+        _DISK_CACHES[(cache_dir, max_size)] = DiskCache(cache_dir, max_size)
+    return _DISK_CACHES[(cache_dir, max_size)]
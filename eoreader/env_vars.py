@@ -24,6 +24,26 @@ DSPK_GRAPH = "EOREADER_DSPK_GRAPH"
 SAR_DEF_PIXEL_SIZE = "EOREADER_SAR_DEFAULT_PIXEL_SIZE"
 """Environment variable for SAR default pixel size, used for SNAP orthorectification to override default pixel size."""
 
+SAR_PREPROCESS_ENGINE = "EOREADER_SAR_PREPROCESS_ENGINE"
+"""
+Environment variable for choosing the engine used to pre-process the SAR products (calibration and geocoding):
+
+- :code:`snap` (default): use SNAP's :code:`gpt`
+- :code:`native`: use EOReader's in-process pipeline (without SNAP nor Java), only available for Sentinel-1 GRD products.
+  It calibrates (:code:`sigma0`, in dB), removes the thermal noise and geocodes the bands with the geolocation grid of the product,
+  corrected from the terrain if :code:`EOREADER_DEM_PATH` is set.
+
+Can be overloaded with the :code:`sar_engine` keyword.
+"""
+
+SAR_BATCH_POLARISATIONS = "EOREADER_SAR_BATCH_POLARISATIONS"
+"""
+If set to :code:`1`, all the missing polarisations needed by a :code:`load` call are pre-processed in one SNAP graph execution
+(calibrating all of them at once), instead of one execution per polarisation re-reading the product and the DEM each time.
+Your custom pre-processing graph (:code:`EOREADER_PP_GRAPH`) must handle a list of polarisations in :code:`calib_pola`.
+Default is :code:`0`.
+"""
+
 DEM_PATH = "EOREADER_DEM_PATH"
 """Environment variable for overriding default DEM path"""
 
@@ -121,3 +141,53 @@ FIX_MAXAR = "EOREADER_FIX_MAXAR"
 Fix faulty Maxar product (corrupted shapes in metadata). 
 This requires an alteration of the raw data, hence the possibility to block it by setting this environment variable to 0.
 """
+
+CACHE_DIR = "EOREADER_CACHE_DIR"
+"""
+Root (local) directory of the persistent disk cache, shared between products and processes.
+If set, the clean bands, spectral indices and pre-processed SAR bands are stored in it
+and retrieved from it even if the product is opened again with another output directory.
+The entries written by another version of EOReader are never retrieved.
+Disabled by default.
+"""
+
+CACHE_MAX_SIZE = "EOREADER_CACHE_MAX_SIZE"
+"""
+Maximum size of the disk cache (in bytes, i.e. :code:`50e9` for 50 GB).
+When exceeded, the least recently used files are evicted. Unbounded by default.
+Only used if :code:`EOREADER_CACHE_DIR` is set.
+"""
+
+PARALLEL_BANDS_LOADING = "EOREADER_PARALLEL_BANDS_LOADING"
+"""
+If set to :code:`1`, the optical bands are opened, cleaned and written concurrently,
+in a thread pool sized from the number of available cores (see :code:`SERTIT_UTILS_MAX_CORES`).
+This overlaps I/O, decoding and writing of the bands. Can be overloaded with the :code:`parallel_bands` keyword.
+Default is :code:`0`.
+"""
+
+WRITE_BEHIND = "EOREADER_WRITE_BEHIND"
+"""
+If set to :code:`1`, the intermediary files (clean bands and spectral indices) are written on disk in background threads,
+so that :code:`load` returns as soon as the arrays are computed.
+Call :code:`prod.flush()` to wait for the pending writes (this is automatically done when the product is closed).
+Default is :code:`0`.
+"""
+
+LAZY_INIT = "EOREADER_LAZY_INIT"
+"""
+If set to :code:`1`, the products are initialized lazily: only the name, the datetime and the constellation are computed when opening the product.
+The other attributes (product type, band mapping, pixel size, condensed name...) are computed on first access,
+and the temporary/output folders are only created when something needs to be written.
+Can be overridden per product by passing :code:`lazy=True/False` to :code:`Reader().open`.
+Default is :code:`0`.
+"""
+
+DEM_TILE_CACHE = "EOREADER_DEM_TILE_CACHE"
+"""
+If set to :code:`1`, the DEM is read tile by tile and its tiles are cached locally (process-wide, and between processes if :code:`EOREADER_CACHE_DIR` is set),
+so that neighbouring products read each DEM tile only once.
+Each product then extracts its bounding box from these tiles into a small local DEM, used for its DEM, SLOPE and HILLSHADE bands and its RPC orthorectification.
+The tiles are evicted according to :code:`EOREADER_CACHE_MAX_SIZE`.
+Default is :code:`0`.
+"""
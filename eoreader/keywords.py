@@ -23,12 +23,15 @@ __all__ = [
     "SLSTR_VIEW",
     "CLEAN_OPTICAL",
     "SAR_INTERP_NA",
+    "SAR_ENGINE",
     "DEM_KW",
     "SLOPE_KW",
     "HILLSHADE_KW",
     "ICEYE_USE_SLC",
     "TO_REFLECTANCE",
     "ASSOCIATED_BANDS",
+    "PARALLEL_BANDS",
+    "WRITE_INTERMEDIARY",
 ]
 
 SLSTR_RAD_ADJUST = "slstr_radiance_adjustment"
@@ -50,6 +53,15 @@ SAR_INTERP_NA = "sar_interpolate_na"
 """
 Interpolate nodata pixels that can be found inside the footprint
 (coming from null values that are not really nodata but that are not processed by the Terrain Correction step)
+
+- :code:`True`: linear interpolation along the rows, then along the columns (on the whole array)
+- :code:`"nearest"` or :code:`"idw"` (inverse distance weighting): fill the holes within 10 pixels of valid data, block by block (with a fixed memory, and only spending time on the blocks with holes)
+"""
+
+SAR_ENGINE = "sar_engine"
+"""
+Engine used to pre-process the SAR products (:code:`snap` or :code:`native`), used to overload the :code:`EOREADER_SAR_PREPROCESS_ENGINE` environment variable.
+Please see :code:`eoreader.products.sar.sar_product.SarEngine`.
 """
 
 DEM_KW = "dem"
@@ -82,6 +94,18 @@ ASSOCIATED_BANDS = "associated_bands"
 Associated spectral band to the wanted mask, used for Sentinel-2 and Sentinel-2 Theia, for masks that are band-specific.
 """
 
+PARALLEL_BANDS = "parallel_bands"
+"""
+Open, clean and write the optical bands concurrently (in a thread pool sized from the number of available cores).
+Used to overload the :code:`EOREADER_PARALLEL_BANDS_LOADING` environment variable.
+"""
+
+WRITE_INTERMEDIARY = "write_intermediary"
+"""
+Write the intermediary files (clean bands and spectral indices) on disk (default is :code:`True`).
+Disabled when loading a product tile by tile with :code:`iter_tiles`.
+"""
+
 
 def _prune_keywords(additional_keywords: list = None, **kwargs) -> dict:
     """
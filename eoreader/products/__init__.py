@@ -187,6 +187,7 @@ from .optical.s3_slstr_product import (
 __all__ += [
     "SarProduct",
     "SarProductType",
+    "SarEngine",
     "SnapDems",
     "CosmoProduct",
     "CosmoProductType",
@@ -222,7 +223,7 @@ __all__ += [
     "CapellaProductType",
     "CapellaSensorMode",
 ]
-from .sar.sar_product import SarProduct, SarProductType, SnapDems
+from .sar.sar_product import SarEngine, SarProduct, SarProductType, SnapDems
 from .sar.cosmo_product import CosmoProduct, CosmoProductType
 from .sar.csg_product import CsgProduct, CsgSensorMode
 from .sar.csk_product import CskProduct, CskSensorMode
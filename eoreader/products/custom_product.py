@@ -27,7 +27,6 @@ import xarray as xr
 from lxml import etree
 from lxml.builder import E
 from rasterio import crs
-from rasterio.enums import Resampling
 from sertit import misc, path, rasters, types
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
@@ -123,10 +122,16 @@ class CustomProduct(Product):
         self.custom_condensed_name = kwargs.pop(CustomFields.CONDENSED_NAME.value, None)
         """ Custom condensed name. Overrides computed custom name. """
 
+        # Lazy initialization is managed by the super class (it is not a custom field)
+        lazy = kwargs.pop("lazy", None)
+
         # Initialization from the super class
         # (Custom products are managing constellation on their own)
         super_kwargs = kwargs.copy()
         super_kwargs.pop("constellation", None)
+        if lazy is not None:
+            super_kwargs["lazy"] = lazy
+
         super().__init__(
             product_path, archive_path, output_path, remove_tmp, **super_kwargs
         )
@@ -418,12 +423,12 @@ class CustomProduct(Product):
             xr.DataArray: Band xarray
 
         """
-        return utils.read(
+        return self._read_stack_band(
             band_path,
+            band,
             pixel_size=pixel_size,
             size=size,
             resampling=kwargs.pop("resampling", self.band_resampling),
-            indexes=[self.bands[band].id],
             as_type=np.float32,
             **kwargs,
         )
@@ -455,12 +460,17 @@ class CustomProduct(Product):
 
         band_paths = self.get_band_paths(bands, pixel_size, **kwargs)
 
-        # Open bands and get array (resampled if needed)
+        # Open bands and get array (resampled if needed), reading the stack only once
         band_arrays = {}
-        for band_name, band_path in band_paths.items():
-            band_arrays[band_name] = self._read_band(
-                band_path, band=band_name, pixel_size=pixel_size, size=size, **kwargs
-            )
+        with self._stacked_reading(band_paths):
+            for band_name, band_path in band_paths.items():
+                band_arrays[band_name] = self._read_band(
+                    band_path,
+                    band=band_name,
+                    pixel_size=pixel_size,
+                    size=size,
+                    **kwargs,
+                )
 
         return band_arrays
 
@@ -486,54 +496,20 @@ class CustomProduct(Product):
 
         return sun_az, sun_zen
 
-    def _compute_hillshade(
-        self,
-        dem_path: str = "",
-        pixel_size: Union[float, tuple] = None,
-        size: Union[list, tuple] = None,
-        resampling: Resampling = Resampling.bilinear,
-    ) -> AnyPathType:
+    def _get_hillshade_sun_angles(self) -> (float, float):
         """
-        Compute Hillshade mask
+        Get the sun angles (azimuth, zenith) used to compute the hillshade.
 
-        Args:
-            dem_path (str): DEM path, using EUDEM/MERIT DEM if none
-            pixel_size (Union[float, tuple]): Pixel size in meters. If not specified, use the product pixel size.
-            resampling (Resampling): Resampling method
-            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
         Returns:
-            AnyPathType: Hillshade mask path
+            (float, float): Sun azimuth and zenith angles, in degrees
         """
         sun_az, sun_zen = self.get_mean_sun_angles()
-        if sun_az is not None and sun_zen is not None:
-            # Warp DEM
-            warped_dem_path = self._warp_dem(dem_path, pixel_size, size, resampling)
-
-            # Get Hillshade path
-            hillshade_name = (
-                f"{self.condensed_name}_HILLSHADE_{path.get_filename(dem_path)}.tif"
-            )
-
-            hillshade_path, hillshade_exists = self._get_out_path(hillshade_name)
-            if hillshade_exists:
-                LOGGER.debug(
-                    "Already existing hillshade DEM for %s. Skipping process.",
-                    self.name,
-                )
-            else:
-                LOGGER.debug("Computing hillshade DEM for %s", self.name)
-
-                # Compute hillshade
-                hillshade = rasters.hillshade(warped_dem_path, sun_az, sun_zen)
-                hillshade = utils.write_path_in_attrs(hillshade, hillshade_path)
-                utils.write(hillshade, hillshade_path)
-
-        else:
+        if sun_az is None or sun_zen is None:
             raise InvalidProductError(
                 f"You should provide {CustomFields.SUN_AZ.value} and {CustomFields.SUN_ZEN.value} data to compute hillshade!"
             )
 
-        return hillshade_path
+        return sun_az, sun_zen
 
     def _has_cloud_band(self, band: BandNames) -> bool:
         """
@@ -27,6 +27,7 @@ import numpy as np
 import xarray as xr
 from lxml import etree
 from rasterio import crs as riocrs
+from rasterio import rpc
 from sertit.misc import ListEnum
 from sertit.types import AnyPathType
 
@@ -444,24 +445,20 @@ class Gs2Product(DimapV1Product):
         prefix = "DE2_MS4_" if self.band_combi == Gs2BandCombination.PM4 else "DE2_"
         return self._get_path(prefix, "dim")
 
-    def _get_ortho_path(self, **kwargs) -> AnyPathType:
+    def _get_rpcs(self, **kwargs) -> rpc.RPC:
         """
-        Get the orthorectified path of the bands.
+        Get the RPCs of the VHR tile.
 
         Returns:
-            AnyPathType: Orthorectified path
+            rpc.RPC: RPCs of the tile
         """
-        if self.product_type in self._proj_prod_type:
-            # Compute RPCSs
-            if self.is_archived:
-                rpcs_file = io.BytesIO(self._read_archived_file(r".*_RPC\.txt"))
-            else:
-                rpcs_file = self.path.joinpath(self.name + "_RPC.txt")
-
-            rpcs = utils.open_rpc_file(rpcs_file)
+        # Compute RPCSs
+        if self.is_archived:
+            rpcs_file = io.BytesIO(self._read_archived_file(r".*_RPC\.txt"))
         else:
-            rpcs = None
-        return super()._get_ortho_path(rpcs=rpcs, **kwargs)
+            rpcs_file = self.path.joinpath(self.name + "_RPC.txt")
+
+        return utils.open_rpc_file(rpcs_file)
 
     def get_quicklook_path(self) -> str:
         """
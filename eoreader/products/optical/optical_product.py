@@ -16,7 +16,9 @@
 """Super class for optical products"""
 
 import logging
+import os
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import unique
 from typing import Union
@@ -26,8 +28,7 @@ import numpy as np
 import rasterio
 import xarray as xr
 from rasterio import crs as riocrs
-from rasterio.enums import Resampling
-from sertit import AnyPath, path, rasters
+from sertit import AnyPath, rasters
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
 
@@ -40,7 +41,8 @@ from eoreader.bands import (
     is_thermal_band,
     to_str,
 )
-from eoreader.keywords import CLEAN_OPTICAL, TO_REFLECTANCE
+from eoreader.env_vars import PARALLEL_BANDS_LOADING
+from eoreader.keywords import CLEAN_OPTICAL, PARALLEL_BANDS, TO_REFLECTANCE
 from eoreader.products.product import OrbitDirection, Product, SensorType
 
 LOGGER = logging.getLogger(EOREADER_NAME)
@@ -306,69 +308,168 @@ class OpticalProduct(Product):
             dict: Dictionary {band_name, band_xarray}
 
         """
-        # Open bands and get array (resampled if needed)
-        band_arrays = {}
-        for band, band_path in band_paths.items():
-            # Read band
-            LOGGER.debug(f"Read {band.name}")
-            band_arr = self._read_band(
-                band_path, band=band, pixel_size=pixel_size, size=size, **kwargs
-            )
+        # Read the bands stored in the same stack only once
+        with self._stacked_reading(band_paths):
+            # Open bands and get array (resampled if needed)
+            band_arrays = {}
+            band_paths = list(band_paths.items())
+            nof_workers = self._get_nof_band_workers(len(band_paths), **kwargs)
+
+            if nof_workers <= 1:
+                for band, band_path in band_paths:
+                    band_arrays[band] = self._open_band(
+                        band, band_path, pixel_size=pixel_size, size=size, **kwargs
+                    )
+                    # The first band gives the pixel size to the following ones
+                    if not pixel_size:
+                        pixel_size = band_arrays[band].rio.resolution()[0]
+            else:
+                if not pixel_size:
+                    # The first band gives the pixel size to the following ones
+                    band, band_path = band_paths.pop(0)
+                    band_arrays[band] = self._open_band(
+                        band, band_path, pixel_size=pixel_size, size=size, **kwargs
+                    )
+                    pixel_size = band_arrays[band].rio.resolution()[0]
+
+                LOGGER.debug(
+                    f"Opening {len(band_paths)} bands with {nof_workers} threads"
+                )
+                with ThreadPoolExecutor(max_workers=nof_workers) as executor:
+                    futures = {
+                        band: executor.submit(
+                            self._open_band,
+                            band,
+                            band_path,
+                            pixel_size=pixel_size,
+                            size=size,
+                            **kwargs,
+                        )
+                        for band, band_path in band_paths
+                    }
+
+                    # Keep the bands order
+                    for band, future in futures.items():
+                        band_arrays[band] = future.result()
+
+        return band_arrays
+
+    def _get_nof_band_workers(self, nof_bands: int, **kwargs) -> int:
+        """
+        Get the number of threads used to open the bands.
+
+        Parallel loading is opt-in, either with the :code:`parallel_bands` keyword
+        or with the :code:`EOREADER_PARALLEL_BANDS_LOADING` environment variable.
+
+        Args:
+            nof_bands (int): Number of bands to open
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            int: Number of threads
+        """
+        parallel = kwargs.get(
+            PARALLEL_BANDS,
+            os.getenv(PARALLEL_BANDS_LOADING, "0").lower() in ("1", "true"),
+        )
+        if not parallel or nof_bands <= 1:
+            return 1
+
+        return max(1, min(nof_bands, utils.get_max_cores()))
 
-            if not pixel_size:
-                pixel_size = band_arr.rio.resolution()[0]
+    def _open_band(
+        self,
+        band: BandNames,
+        band_path: AnyPathType,
+        pixel_size: float = None,
+        size: Union[list, tuple] = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Open one band from disk, clean it and write the clean band on disk.
+
+        Args:
+            band (BandNames): Band to open
+            band_path (AnyPathType): Band path
+            pixel_size (float): Band pixel size in meters
+            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            xr.DataArray: Band array
+        """
+        # Try to retrieve the clean band from the disk cache before reading the raw band
+        if pixel_size:
             clean_band_path = self.get_band_path(
                 band, pixel_size=pixel_size, writable=True, **kwargs
             )
-            # If raw data, clean it!
-            if AnyPath(band_path).name != clean_band_path.name:
-                # Clean pixels
-                cleaning_method = CleanMethod.from_value(
-                    kwargs.get(CLEAN_OPTICAL, DEF_CLEAN_METHOD)
+            if AnyPath(
+                band_path
+            ).name != clean_band_path.name and self._restore_from_cache(
+                clean_band_path, **kwargs
+            ):
+                band_path = clean_band_path
+
+        # Read band
+        LOGGER.debug(f"Read {band.name}")
+        band_arr = self._read_band(
+            band_path, band=band, pixel_size=pixel_size, size=size, **kwargs
+        )
+
+        if not pixel_size:
+            pixel_size = band_arr.rio.resolution()[0]
+        clean_band_path = self.get_band_path(
+            band, pixel_size=pixel_size, writable=True, **kwargs
+        )
+        # If raw data, clean it!
+        if AnyPath(band_path).name != clean_band_path.name:
+            # Clean pixels
+            cleaning_method = CleanMethod.from_value(
+                kwargs.get(CLEAN_OPTICAL, DEF_CLEAN_METHOD)
+            )
+            if cleaning_method == CleanMethod.RAW:
+                pass
+            elif cleaning_method == CleanMethod.NODATA:
+                LOGGER.debug(f"Manage nodata for band {band.name}")
+                band_arr = self._manage_nodata(
+                    band_arr, band=band, pixel_size=pixel_size, **kwargs
                 )
-                if cleaning_method == CleanMethod.RAW:
-                    pass
-                elif cleaning_method == CleanMethod.NODATA:
-                    LOGGER.debug(f"Manage nodata for band {band.name}")
-                    band_arr = self._manage_nodata(
-                        band_arr, band=band, pixel_size=pixel_size, **kwargs
-                    )
-                else:
-                    LOGGER.debug(f"Manage invalid pixels for band {band.name}")
-                    band_arr = self._manage_invalid_pixels(
-                        band_arr, band=band, pixel_size=pixel_size, **kwargs
-                    )
-                band_arr.attrs["cleaning_method"] = cleaning_method.value
-
-                # Manage reflectance
-                # (after cleaning -> don't alter pixel value before managing nodata)
-                if kwargs.get(TO_REFLECTANCE, True):
-                    LOGGER.debug(f"Converting {band.name} to reflectance")
-                    band_arr = self._to_reflectance(band_arr, band_path, band)
-
-                    # b_min = band_arr.min().data
-                    # if b_min < 0:
-                    #     LOGGER.debug(
-                    #         f"Reflectance array has negative values ({b_min} < 0): clipping negative reflectances to 0."
-                    #     )
-                    # Negative reflectances should be discarded: https://labo.obs-mip.fr/multitemp/can-surface-reflectance-be-negative
-                    # NB: Reflectances > 1 are valid, see https://forum.step.esa.int/t/toa-range-in-sentinel-2-images-between-0-an-1/3168
-                    band_arr = band_arr.clip(min=0, keep_attrs=True)
-
-                # Write on disk
-                try:
-                    band_arr = utils.write_path_in_attrs(band_arr, clean_band_path)
-                    utils.write(
-                        band_arr.rename(f"{to_str(band)[0]} CLEAN"), clean_band_path
-                    )
-                except Exception:
-                    # Not important if we cannot write it
-                    LOGGER.debug(f"Cannot write {clean_band_path} on disk.")
+            else:
+                LOGGER.debug(f"Manage invalid pixels for band {band.name}")
+                band_arr = self._manage_invalid_pixels(
+                    band_arr, band=band, pixel_size=pixel_size, **kwargs
+                )
+            band_arr.attrs["cleaning_method"] = cleaning_method.value
 
-            # Save band array
-            band_arrays[band] = band_arr
+            # Manage reflectance
+            # (after cleaning -> don't alter pixel value before managing nodata)
+            if kwargs.get(TO_REFLECTANCE, True):
+                LOGGER.debug(f"Converting {band.name} to reflectance")
+                band_arr = self._to_reflectance(band_arr, band_path, band)
+
+                # b_min = band_arr.min().data
+                # if b_min < 0:
+                #     LOGGER.debug(
+                #         f"Reflectance array has negative values ({b_min} < 0): clipping negative reflectances to 0."
+                #     )
+                # Negative reflectances should be discarded: https://labo.obs-mip.fr/multitemp/can-surface-reflectance-be-negative
+                # NB: Reflectances > 1 are valid, see https://forum.step.esa.int/t/toa-range-in-sentinel-2-images-between-0-an-1/3168
+                band_arr = band_arr.clip(min=0, keep_attrs=True)
+
+            # Write on disk
+            try:
+                band_arr = utils.write_path_in_attrs(band_arr, clean_band_path)
+                clean_arr = self._write_intermediary(
+                    band_arr.rename(f"{to_str(band)[0]} CLEAN"),
+                    clean_band_path,
+                    **kwargs,
+                )
+                band_arr = band_arr.copy(data=clean_arr.data)
+            except Exception:
+                # Not important if we cannot write it
+                LOGGER.debug(f"Cannot write {clean_band_path} on disk.")
 
-        return band_arrays
+        return band_arr
 
     @abstractmethod
     def _read_band(
@@ -518,53 +619,14 @@ class OpticalProduct(Product):
         """
         return None, None, None
 
-    def _compute_hillshade(
-        self,
-        dem_path: str = "",
-        pixel_size: Union[float, tuple] = None,
-        size: Union[list, tuple] = None,
-        resampling: Resampling = Resampling.bilinear,
-    ) -> AnyPathType:
+    def _get_hillshade_sun_angles(self) -> (float, float):
         """
-        Compute Hillshade mask
-
-        Args:
-            dem_path (str): DEM path, using EUDEM/MERIT DEM if none
-            pixel_size (Union[float, tuple]): Pixel size in meters. If not specified, use the product pixel size.
-            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
-            resampling (Resampling): Resampling method
+        Get the sun angles (azimuth, zenith) used to compute the hillshade.
 
         Returns:
-            AnyPathType: Hillshade mask path
-
+            (float, float): Sun azimuth and zenith angles, in degrees
         """
-        # Warp DEM
-        warped_dem_path = self._warp_dem(dem_path, pixel_size, size, resampling)
-
-        # Get Hillshade path
-        hillshade_name = (
-            f"{self.condensed_name}_HILLSHADE_{path.get_filename(dem_path)}.tif"
-        )
-
-        hillshade_path, hillshade_exists = self._get_out_path(hillshade_name)
-        if hillshade_exists:
-            LOGGER.debug(
-                "Already existing hillshade DEM for %s. Skipping process.", self.name
-            )
-        else:
-            LOGGER.debug("Computing hillshade DEM for %s", self.name)
-
-            # Get angles
-            mean_azimuth_angle, mean_zenith_angle = self.get_mean_sun_angles()
-
-            # Compute hillshade
-            hillshade = rasters.hillshade(
-                warped_dem_path, mean_azimuth_angle, mean_zenith_angle
-            )
-            hillshade = utils.write_path_in_attrs(hillshade, hillshade_path)
-            utils.write(hillshade, hillshade_path)
-
-        return hillshade_path
+        return self.get_mean_sun_angles()
 
     @abstractmethod
     def _open_clouds(
@@ -760,6 +822,21 @@ class OpticalProduct(Product):
 
         return suffix
 
+    def _get_cache_key_sensor_specific_parts(self, **kwargs) -> list:
+        """
+        Get the sensor-specific processing options that alter the content of the cached files.
+
+        Args:
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            list: Sensor-specific parts of the disk cache key
+        """
+        cleaning_method = CleanMethod.from_value(
+            kwargs.get(CLEAN_OPTICAL, DEF_CLEAN_METHOD)
+        )
+        return [cleaning_method.value, kwargs.get(TO_REFLECTANCE, True)]
+
     @cache
     def _sun_earth_distance(self) -> float:
         """
@@ -475,12 +475,12 @@ class PlanetProduct(OpticalProduct):
 
             # Manage the case if we open a stack (native DIMAP bands)
             else:
-                band_arr = utils.read(
+                band_arr = self._read_stack_band(
                     band_path,
+                    band,
                     pixel_size=pixel_size,
                     size=size,
                     resampling=resampling,
-                    indexes=[self.bands[band].id],
                     **kwargs,
                 )
 
@@ -22,6 +22,7 @@ import logging
 import os
 import re
 import tempfile
+import threading
 import zipfile
 from collections import defaultdict, namedtuple
 from datetime import datetime
@@ -85,6 +86,9 @@ from eoreader.utils import simplify
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+_MASKS_LOCK = threading.Lock()
+"""Lock protecting the cached bit-packed masks (the bands can be loaded in parallel)"""
+
 
 @unique
 class S2ProductType(ListEnum):
@@ -426,7 +430,7 @@ class S2Product(OpticalProduct):
         """
         def_band = self.bands[self.get_default_band()].id
         if self._processing_baseline < 4.0:
-            det_footprint = self._open_mask_lt_4_0(S2GmlMasks.FOOTPRINT, def_band)
+            det_footprint = self._read_mask_lt_4_0(S2GmlMasks.FOOTPRINT, def_band)
             footprint_gs = det_footprint.dissolve().convex_hull
             footprint = gpd.GeoDataFrame(
                 geometry=footprint_gs.geometry, crs=footprint_gs.crs
@@ -1371,9 +1375,111 @@ class S2Product(OpticalProduct):
         Returns:
             xr.DataArray: Cleaned band array
         """
+        mask = self._get_invalid_pixels_mask_lt_4_0(band_arr, band)
+        return self._set_nodata_mask(band_arr, mask)
+
+    def _get_invalid_pixels_mask_lt_4_0(
+        self, band_arr: xr.DataArray, band: BandNames
+    ) -> np.ndarray:
+        """
+        Get the invalid pixels mask of a band (PB < 4.0), rasterized only once per grid.
+
+        The masks of the bands sharing the same native resolution are packed as the bits of the same uint8 array.
+
+        Args:
+            band_arr (xr.DataArray): Band array
+            band (BandNames): Band name as an SpectralBandNames
+
+        Returns:
+            np.ndarray: Invalid pixels mask (2D boolean array)
+        """
+        # Group the bands by native resolution: their masks are packed as the bits of the same array
+        band_id = self.bands[band].id
+        group = sorted(
+            {
+                band_obj.id
+                for band_obj in self.bands.values()
+                if band_obj is not None and band_obj.gsd == self.bands[band].gsd
+            }
+        )
+        bit = np.uint8(1 << group.index(band_id))
+
+        # Invalid pixels masks of this resolution group, on the grid of the wanted band
+        masks = self._get_invalid_pixels_masks(
+            self.bands[band].gsd,
+            band_arr.rio.width,
+            band_arr.rio.height,
+            tuple(band_arr.rio.bounds()),
+        )
+
+        # Compute the mask of this band only once
+        if not masks["computed"] & bit:
+            mask = self._rasterize_invalid_pixels_lt_4_0(band_arr, band_id)
+            with _MASKS_LOCK:
+                masks["mask"] |= mask * bit
+                masks["computed"] |= bit
+
+        return (masks["mask"] & bit) > 0
+
+    @cache
+    def _get_invalid_pixels_masks(
+        self, gsd: float, width: int, height: int, bounds: tuple
+    ) -> dict:
+        """
+        Get the (cached) invalid pixels masks of the bands of one resolution group, on one grid.
+
+        The masks are lazily filled (each band is computed when it is loaded for the first time)
+        and stored as the bits of one uint8 array.
+
+        One array (one byte per pixel of the grid) is kept per resolution group and per loaded grid,
+        i.e. one per window or tile for windowed loads, until :code:`prod.clear()`.
+
+        Args:
+            gsd (float): Native resolution of the bands of the group
+            width (int): Width of the grid
+            height (int): Height of the grid
+            bounds (tuple): Bounds of the grid
+
+        Returns:
+            dict: Bit-packed masks (:code:`mask`) and bits of the already computed bands (:code:`computed`)
+        """
+        return {
+            "mask": np.zeros((height, width), dtype=np.uint8),
+            "computed": np.uint8(0),
+        }
+
+    @cache
+    def _read_mask_lt_4_0(
+        self, mask_id: S2GmlMasks, band_id: str = None
+    ) -> gpd.GeoDataFrame:
+        """
+        Open S2 mask (GML files stored in QI_DATA/qi) as :code:`gpd.GeoDataFrame`, parsing it only once per product.
+
+        Args:
+            mask_id (S2GmlMasks): Mask name, such as DEFECT, NODATA, SATURA...
+            band_id (str): Band ID, such as :code:`03` (for clouds: 00)
+
+        Returns:
+            gpd.GeoDataFrame: Mask as a vector
+        """
+        return self._open_mask_lt_4_0(mask_id, band_id)
+
+    def _rasterize_invalid_pixels_lt_4_0(
+        self, band_arr: xr.DataArray, band_id: str
+    ) -> np.ndarray:
+        """
+        Rasterize the invalid pixels of a band (PB < 4.0) on the grid of the given array.
+
+        Args:
+            band_arr (xr.DataArray): Band array
+            band_id (str): Band ID, such as :code:`03`
+
+        Returns:
+            np.ndarray: Invalid pixels mask (2D uint8 array)
+        """
         # Get detector footprint to deduce the outside nodata
-        nodata_det = self._open_mask_lt_4_0(
-            S2GmlMasks.FOOTPRINT, band
+        nodata_det = self._read_mask_lt_4_0(
+            S2GmlMasks.FOOTPRINT, band_id
         )  # Detector nodata -> pixels that are outside the detectors
 
         if len(nodata_det) > 0:
@@ -1393,21 +1499,21 @@ class S2Product(OpticalProduct):
             mask = np.where(band_arr == s2_nodata, 1, 0).astype(np.uint8)
 
         #  Load masks and merge them into the nodata
-        nodata_pix = self._open_mask_lt_4_0(
-            S2GmlMasks.NODATA, band
+        nodata_pix = self._read_mask_lt_4_0(
+            S2GmlMasks.NODATA, band_id
         )  # Pixel nodata, not pixels that are outside the detectors !!!
         if len(nodata_pix) > 0:
             # Discard pixels corrected during crosstalk
             nodata_pix = nodata_pix[nodata_pix.gml_id == "QT_NODATA_PIXELS"]
         nodata_pix = pd.concat(
-            [nodata_pix, self._open_mask_lt_4_0(S2GmlMasks.DEFECT, band)]
+            [nodata_pix, self._read_mask_lt_4_0(S2GmlMasks.DEFECT, band_id)]
         )
         nodata_pix = pd.concat(
-            [nodata_pix, self._open_mask_lt_4_0(S2GmlMasks.SATURATION, band)]
+            [nodata_pix, self._read_mask_lt_4_0(S2GmlMasks.SATURATION, band_id)]
         )
 
         # Technical quality mask
-        tecqua = self._open_mask_lt_4_0(S2GmlMasks.QUALITY, band)
+        tecqua = self._read_mask_lt_4_0(S2GmlMasks.QUALITY, band_id)
         if len(tecqua) > 0:
             # Do not take into account ancillary data
             tecqua = tecqua[tecqua.gml_id.isin(["MSI_LOST", "MSI_DEG"])]
@@ -1418,7 +1524,8 @@ class S2Product(OpticalProduct):
             mask_pix = self._rasterize(band_arr, nodata_pix)
             mask = mask | mask_pix
 
-        return self._set_nodata_mask(band_arr, mask)
+        mask = np.asarray(mask, dtype=np.uint8)
+        return mask.reshape(mask.shape[-2:])
 
     def _manage_invalid_pixels_gt_4_0(
         self,
@@ -1440,36 +1547,54 @@ class S2Product(OpticalProduct):
         Returns:
             xr.DataArray: Cleaned band array
         """
-        # Get detector footprint to deduce the outside nodata
-        nodata = self._open_mask_gt_4_0(
-            S2Jp2Masks.DETFOO,
-            band,
-            pixel_size=pixel_size,
-            size=(band_arr.rio.width, band_arr.rio.height),
-            **kwargs,
-        ).data
+        # Lazy mask, shared by every load of this band
+        mask = self._read_invalid_pixels_gt_4_0(self.bands[band].id)
 
-        nodata = np.where(nodata == 0, 1, 0).astype(np.uint8)
+        # Resample the mask (lazily) on the grid of the band if needed,
+        # only reading the part of the mask covering the band (i.e. for windowed loads or tiles)
+        if (
+            mask.rio.width != band_arr.rio.width
+            or mask.rio.height != band_arr.rio.height
+            or mask.rio.bounds() != band_arr.rio.bounds()
+        ):
+            res = np.max(np.abs(mask.rio.resolution()))
+            left, bottom, right, top = band_arr.rio.bounds()
+            mask = mask.rio.clip_box(left - res, bottom - res, right + res, top + res)
+            mask = rasters.collocate(band_arr, mask, Resampling.nearest)
+
+        return self._set_nodata_mask(band_arr, mask)
+
+    @cache
+    def _read_invalid_pixels_gt_4_0(self, band_id: str) -> xr.DataArray:
+        """
+        Read the invalid pixels mask of a band (PB >= 4.0) at its native resolution, lazily.
+
+        The DETFOO and QUALIT masks are combined bitwise chunk by chunk (as a dask array).
+        The combined mask is cached per band, so that every load of this band reads and resamples (the needed part of) the same mask.
+
+        Args:
+            band_id (str): Band ID, such as :code:`03`
+
+        Returns:
+            xr.DataArray: Invalid pixels mask (uint8 array)
+        """
+        # Get detector footprint to deduce the outside nodata
+        nodata = self._open_mask_gt_4_0(S2Jp2Masks.DETFOO, band_id)
 
-        # Manage quality mask
-        # TODO: Optimize it -> very slow (why?)
         # Technical quality mask: Only keep MSI_LOST (band 3) and MSI_DEG (band 4)
         # Defective pixels (band 5)
         # Nodata pixels (band 6)
         # Saturated pixels (band 8)
         quality = self._open_mask_gt_4_0(
-            S2Jp2Masks.QUALIT,
-            band,
-            pixel_size=pixel_size,
-            size=(band_arr.rio.width, band_arr.rio.height),
-            indexes=[3, 4, 5, 6, 8],
-            **kwargs,
-        ).data
+            S2Jp2Masks.QUALIT, band_id, indexes=[3, 4, 5, 6, 8]
+        )
 
-        # Compute mask
-        mask = (nodata + np.sum(quality, axis=0)) > 0
+        # Combine the masks bitwise (lazily if chunked)
+        mask_arr = (nodata.data == 0).astype(np.uint8)
+        for layer in quality.data:
+            mask_arr = mask_arr | layer
 
-        return self._set_nodata_mask(band_arr, mask)
+        return nodata.copy(data=mask_arr)
 
     def _manage_nodata_lt_4_0(
         self,
@@ -1491,8 +1616,8 @@ class S2Product(OpticalProduct):
             xr.DataArray: Cleaned band array
         """
         # Get detector footprint to deduce the outside nodata
-        nodata_det = self._open_mask_lt_4_0(
-            S2GmlMasks.FOOTPRINT, band
+        nodata_det = self._read_mask_lt_4_0(
+            S2GmlMasks.FOOTPRINT, self.bands[band].id
         )  # Detector nodata, -> pixels that are outside the detectors
 
         if len(nodata_det) > 0:
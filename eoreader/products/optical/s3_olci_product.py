@@ -498,29 +498,65 @@ class S3OlciProduct(S3Product):
         Returns:
             dict: Dictionary containing {band: path}
         """
-        band_str = band if isinstance(band, str) else band.name
+        return self._preprocess_bands(
+            [band],
+            pixel_size=pixel_size,
+            to_reflectance=to_reflectance,
+            subdataset=subdataset,
+            **kwargs,
+        )[band]
 
-        pp_path = self._get_preprocessed_band_path(
-            band, pixel_size=pixel_size, writable=False
-        )
+    def _preprocess_bands(
+        self,
+        bands: list,
+        pixel_size: float = None,
+        to_reflectance: bool = True,
+        subdataset: str = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Pre-process several S3 OLCI bands:
+        - Convert radiance to reflectance
+        - Geocode (all the bands at once, as they share the same grid)
+
+        Args:
+            bands (list): Bands to preprocess (quality flags or others are accepted)
+            pixel_size (float): Pixl size
+            to_reflectance (bool): Convert band to reflectance
+            subdataset (str): Subdataset
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            dict: Dictionary containing {band: path}
+        """
+        pp_paths = {}
+        band_arrs = {}
+        for band in bands:
+            band_str = band if isinstance(band, str) else band.name
 
-        if not pp_path.is_file():
             pp_path = self._get_preprocessed_band_path(
-                band, pixel_size=pixel_size, writable=True
+                band, pixel_size=pixel_size, writable=False
             )
 
+            if pp_path.is_file():
+                pp_paths[band] = pp_path
+                continue
+
             # Get band regex
+            band_subdataset = subdataset
             if isinstance(band, BandNames):
                 band_name = self.bands[band].name
-                if not subdataset:
-                    subdataset = self._replace(self._radiance_subds, band=band_name)
+                if not band_subdataset:
+                    band_subdataset = self._replace(
+                        self._radiance_subds, band=band_name
+                    )
                 filename = self._replace(self._radiance_file, band=band_name)
             else:
                 filename = band
 
             # Get raw band
             band_arr = self._read_nc(
-                filename, subdataset, dtype=kwargs.get("dtype", np.float32)
+                filename, band_subdataset, dtype=kwargs.get("dtype", np.float32)
             )
 
             # Convert radiance to reflectances if needed
@@ -529,15 +565,25 @@ class S3OlciProduct(S3Product):
                 LOGGER.debug(f"Converting {band_str} to reflectance")
                 band_arr = self._rad_2_refl(band_arr, band)
 
+            band_arrs[band] = band_arr
+
+        if band_arrs:
             # Geocode
-            LOGGER.debug(f"Geocoding {band_str}")
-            band_arr = self._geocode(band_arr, pixel_size=pixel_size, **kwargs)
+            LOGGER.debug(
+                f"Geocoding {', '.join(band if isinstance(band, str) else band.name for band in band_arrs)}"
+            )
+            band_arrs = self._geocode_bands(band_arrs, pixel_size=pixel_size, **kwargs)
 
             # Write on disk
-            band_arr = utils.write_path_in_attrs(band_arr, pp_path)
-            utils.write(band_arr, pp_path, dtype=kwargs.get("dtype", np.float32))
+            for band, band_arr in band_arrs.items():
+                pp_path = self._get_preprocessed_band_path(
+                    band, pixel_size=pixel_size, writable=True
+                )
+                band_arr = utils.write_path_in_attrs(band_arr, pp_path)
+                utils.write(band_arr, pp_path, dtype=kwargs.get("dtype", np.float32))
+                pp_paths[band] = pp_path
 
-        return pp_path
+        return pp_paths
 
     def _rad_2_refl(
         self, band_arr: xr.DataArray, band: BandNames = None
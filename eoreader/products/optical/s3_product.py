@@ -25,12 +25,14 @@ import contextlib
 import io
 import logging
 import re
+import struct
+import threading
 import warnings
 import zipfile
 from abc import abstractmethod
 from datetime import datetime
 from enum import unique
-from typing import Union
+from typing import Callable, Union
 
 import geopandas as gpd
 import numpy as np
@@ -57,6 +59,199 @@ from eoreader.utils import simplify
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+_NN_LUTS = ["valid_input_index", "valid_output_index", "index_array"]
+"""Lookup tables of the nearest neighbour resampler"""
+
+_RANGE_BUFFER_SIZE = 2**20
+"""Size of the buffer used to read cloud NetCDF files by ranges (1 MB)"""
+
+_NC_HANDLES_LOCK = threading.Lock()
+"""Lock used to create the pool of opened NetCDF files of the products"""
+
+
+@contextlib.contextmanager
+def _silence_pyresample():
+    """Silence the (very verbose) warnings of pyresample"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        logging.captureWarnings(True)
+        default_logger = logging.getLogger()
+        old_lvl = default_logger.getEffectiveLevel()
+        default_logger.setLevel(logging.ERROR)
+        try:
+            yield
+        finally:
+            logging.captureWarnings(False)
+            default_logger.setLevel(old_lvl)
+
+
+class _CloudRangeFile(io.RawIOBase):
+    """Read-only file object over a S3 object, reading only the requested byte ranges (with HTTP range requests)"""
+
+    def __init__(self, cloud_path: AnyPathType) -> None:
+        self._client = cloud_path.client.client
+        self._bucket = cloud_path.bucket
+        self._key = cloud_path.key
+        self._size = self._client.head_object(Bucket=self._bucket, Key=self._key)[
+            "ContentLength"
+        ]
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        if self._pos >= self._size:
+            return 0
+
+        end = min(self._pos + len(buffer), self._size) - 1
+        data = self._client.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={self._pos}-{end}"
+        )["Body"].read()
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def _open_cloud_file(cloud_path: AnyPathType) -> io.IOBase:
+    """
+    Open a cloud file without downloading it (if possible)
+
+    Args:
+        cloud_path (AnyPathType): Cloud path
+
+    Returns:
+        io.IOBase: File object
+    """
+    if hasattr(cloud_path, "bucket") and hasattr(cloud_path.client, "client"):
+        # S3-compatible storage: read only the needed ranges
+        return io.BufferedReader(
+            _CloudRangeFile(cloud_path), buffer_size=_RANGE_BUFFER_SIZE
+        )
+    else:
+        # Other storages: read the whole file
+        return io.BytesIO(cloud_path.read_bytes())
+
+
+class _ZipMemberFile(io.RawIOBase):
+    """
+    Read-only file object over a member stored without compression in a zip archive,
+    reading only the requested byte ranges of the archive.
+
+    The archive file object is shared: the reads must be done under the lock of the :code:`_NcHandles`.
+    """
+
+    def __init__(self, zip_ds: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> None:
+        self._fp = zip_ds.fp
+
+        # The data starts after the local file header, whose name and extra field lengths may differ from the central directory ones
+        self._fp.seek(zinfo.header_offset)
+        header = self._fp.read(30)
+        if header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local file header for {zinfo.filename}")
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+
+        self._offset = zinfo.header_offset + 30 + name_len + extra_len
+        self._size = zinfo.compress_size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        if self._pos >= self._size:
+            return 0
+
+        self._fp.seek(self._offset + self._pos)
+        data = self._fp.read(min(len(buffer), self._size - self._pos))
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+class _NcHandles:
+    """Pool of the files opened by a product, kept open to be reused"""
+
+    def __init__(self) -> None:
+        self.handles = {}
+        self.lock = threading.RLock()
+
+    def get(self, key, open_fct: Callable):
+        """
+        Get the handle stored under the given key, opening it if needed
+
+        Args:
+            key: Key of the handle
+            open_fct (Callable): Function opening the handle
+
+        Returns:
+            Opened handle
+        """
+        with self.lock:
+            if key not in self.handles:
+                self.handles[key] = open_fct()
+            return self.handles[key]
+
+    def find(self, key):
+        """
+        Get the handle stored under the given key, if any
+
+        Args:
+            key: Key of the handle
+
+        Returns:
+            Opened handle or None
+        """
+        with self.lock:
+            return self.handles.get(key)
+
+    def add(self, key, handle) -> None:
+        """
+        Store an opened handle under the given key
+
+        Args:
+            key: Key of the handle
+            handle: Opened handle
+        """
+        with self.lock:
+            self.handles[key] = handle
+
+    def close(self) -> None:
+        """Close all the handles (the last opened first)"""
+        with self.lock:
+            for handle in reversed(list(self.handles.values())):
+                with contextlib.suppress(Exception):
+                    handle.close()
+            self.handles = {}
+
 
 @unique
 class S3ProductType(ListEnum):
@@ -421,21 +616,44 @@ class S3Product(OpticalProduct):
             dict: Dictionary containing the path of each queried band
         """
         band_paths = {}
+        bands_to_preprocess = []
         for band in band_list:
             # Get clean band path
             clean_band = self.get_band_path(band, pixel_size=pixel_size, **kwargs)
             if clean_band.is_file():
                 band_paths[band] = clean_band
             else:
-                # Pre-process the wanted band (does nothing if existing)
-                band_paths[band] = self._preprocess(
-                    band,
-                    pixel_size=pixel_size,
-                    **kwargs,
+                bands_to_preprocess.append(band)
+
+        # Pre-process the wanted bands (does nothing if existing)
+        if bands_to_preprocess:
+            band_paths.update(
+                self._preprocess_bands(
+                    bands_to_preprocess, pixel_size=pixel_size, **kwargs
                 )
+            )
 
         return band_paths
 
+    def _preprocess_bands(
+        self, bands: list, pixel_size: float = None, **kwargs
+    ) -> dict:
+        """
+        Pre-process several S3 bands (see :code:`_preprocess`).
+
+        Args:
+            bands (list): Bands to preprocess
+            pixel_size (float): Pixel size
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            dict: Dictionary containing {band: path}
+        """
+        return {
+            band: self._preprocess(band, pixel_size=pixel_size, **kwargs)
+            for band in bands
+        }
+
     # pylint: disable=W0613
     def _read_band(
         self,
@@ -596,11 +814,109 @@ class S3Product(OpticalProduct):
         Returns:
             xr.DataArray: Geocoded DataArray
         """
+        return self._geocode_bands(
+            {None: band_arr},
+            suffix=suffix,
+            pixel_size=pixel_size,
+            resampling=resampling,
+            **kwargs,
+        )[None]
+
+    def _geocode_bands(
+        self,
+        band_arrs: dict,
+        suffix: str = None,
+        pixel_size: float = None,
+        resampling: Resampling = Resampling.nearest,
+        **kwargs,
+    ) -> dict:
+        """
+        Geocode several Sentinel-3 bands sharing the same grid (using cartesian coordinates),
+        applying the resampling lookup tables only once on the stacked bands.
+
+        Args:
+            band_arrs (dict): Band arrays, as :code:`{band: band_arr}`
+            suffix (str): Suffix (for the grid)
+            pixel_size (float): Pixel size
+            kwargs: Other arguments
+
+        Returns:
+            dict: Geocoded DataArrays, as :code:`{band: band_arr}`
+        """
         rs_methods = [Resampling.nearest, Resampling.bilinear]
         assert resampling in rs_methods, (
             f"resampling method ({resampling}) should be chosen among {rs_methods}"
         )
 
+        # Stack the bands (with the same dtype) to resample them at once
+        bands = list(band_arrs.keys())
+        dtype = np.result_type(*[band_arr.dtype for band_arr in band_arrs.values()])
+        stack = [band_arr.squeeze().astype(dtype) for band_arr in band_arrs.values()]
+        stack = stack[0] if len(stack) == 1 else xr.concat(stack, dim="bands")
+
+        # Determine nodata (should work at least with uint8, uint32, float32)
+        nodata = rasters.get_nodata_value_from_dtype(dtype)
+
+        resampler = self._get_resampler(suffix, resampling)
+        with _silence_pyresample():
+            # Resampling Nearest
+            if resampling == Resampling.nearest:
+                # From 08/2019, still true in 01/2025
+                # https://github.com/pytroll/pyresample/issues/206#issuecomment-520971930
+                # XArrayResamplerNN is using "pykdtree which is faster than scipy and uses OpenMP, but is not dask or multi-process friendly otherwise"
+                # Workaround is to force dask computation with multithreads scheduler
+                stack_resampled = resampler.get_sample_from_neighbour_info(
+                    stack, fill_value=nodata
+                ).load(scheduler="threads")
+
+            # Resampling Bilinear
+            else:
+                # XArrayBilinearResampler is dask-compatible
+                stack_resampled = resampler.resample(
+                    stack, nprocs=utils.get_max_cores(), fill_value=nodata
+                )
+
+        geocoded_arrs = {}
+        for idx, band in enumerate(bands):
+            band_arr = band_arrs[band]
+
+            # Convert to wanted dtype and shape
+            if "bands" in stack_resampled.dims:
+                band_arr_resampled = stack_resampled.isel(bands=idx, drop=True)
+            else:
+                band_arr_resampled = stack_resampled
+            band_arr_resampled = band_arr_resampled.astype(np.float32).expand_dims(
+                dim={"band": 1}, axis=0
+            )
+
+            # Write array data
+            band_arr_resampled.rio.write_crs(self.crs(), inplace=True)
+            band_arr_resampled.rio.update_attrs(band_arr.attrs, inplace=True)
+            band_arr_resampled.rio.update_encoding(band_arr.encoding, inplace=True)
+            geocoded_arrs[band] = band_arr_resampled
+
+        return geocoded_arrs
+
+    @cache
+    def _get_resampler(
+        self, suffix: str = None, resampling: Resampling = Resampling.nearest
+    ) -> Union[XArrayResamplerNN, XArrayBilinearResampler]:
+        """
+        Get the resampler from the swath (given by the suffix) to the product grid, with its lookup tables computed only once.
+
+        The lookup tables are written in the temporary folder of the product
+        to be reused by every band (and the next sessions if the output is kept).
+
+        Args:
+            suffix (str): Suffix (for the grid)
+            resampling (Resampling): Resampling method (nearest or bilinear)
+
+        Returns:
+            Union[XArrayResamplerNN, XArrayBilinearResampler]: Resampler with its lookup tables
+        """
+        import dask
+        from dask import array as da
+
         # Open lat/lon arrays
         geo_file = self._replace(self._geo_file, suffix=suffix)
         lon_nc_name = self._replace(self._lon_nc_name, suffix=suffix)
@@ -616,17 +932,7 @@ class S3Product(OpticalProduct):
         # Create corresponding UTM area
         suffix_str = " " + suffix if suffix else ""
 
-        # Determine nodata (should work at least with uint8, uint32, float32)
-        nodata = rasters.get_nodata_value_from_dtype(band_arr.dtype)
-
-        # Filter warnings
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            logging.captureWarnings(True)
-            default_logger = logging.getLogger()
-            old_lvl = default_logger.getEffectiveLevel()
-            default_logger.setLevel(logging.ERROR)
-
+        with _silence_pyresample():
             # Create area definition
             area_def = create_area_def(
                 area_id=f"{self.condensed_name}_grid{suffix_str}",
@@ -638,15 +944,32 @@ class S3Product(OpticalProduct):
             # Resampling Nearest
             if resampling == Resampling.nearest:
                 resampler = XArrayResamplerNN(swath_def, area_def, self.pixel_size * 3)
-                resampler.get_neighbour_info()
 
-                # From 08/2019, still true in 01/2025
-                # https://github.com/pytroll/pyresample/issues/206#issuecomment-520971930
-                # XArrayResamplerNN is using "pykdtree which is faster than scipy and uses OpenMP, but is not dask or multi-process friendly otherwise"
-                # Workaround is to force dask computation with multithreads scheduler
-                band_arr_resampled = resampler.get_sample_from_neighbour_info(
-                    band_arr.squeeze(), fill_value=nodata
-                ).load(scheduler="threads")
+                # Load resampling info if existing
+                cache_file, exists = self._get_out_path(
+                    f"{self.condensed_name}_nearest_resampling_luts{suffix_str}.npz"
+                )
+                if exists:
+                    with np.load(str(cache_file)) as luts:
+                        for lut in _NN_LUTS:
+                            setattr(resampler, lut, da.from_array(luts[lut]))
+                else:
+                    # Compute the neighbours only once (the kd-tree query is lazy and would be computed for every band otherwise)
+                    resampler.get_neighbour_info()
+                    luts = dict(
+                        zip(
+                            _NN_LUTS,
+                            dask.compute(
+                                *[getattr(resampler, lut) for lut in _NN_LUTS],
+                                scheduler="threads",
+                            ),
+                        )
+                    )
+                    for lut, lut_arr in luts.items():
+                        setattr(resampler, lut, da.from_array(lut_arr))
+
+                    # Save resampling info
+                    np.savez(str(cache_file), **luts)
 
             # Resampling Bilinear
             else:
@@ -659,30 +982,13 @@ class S3Product(OpticalProduct):
                 )
                 if exists:
                     resampler.load_resampling_info(cache_file)
+                else:
+                    resampler.get_bil_info()
 
-                # XArrayBilinearResampler is dask-compatible
-                resampler.resample(
-                    band_arr.squeeze(), nprocs=utils.get_max_cores(), fill_value=nodata
-                )
-
-                # Save resampling info if needed
-                if not exists:
+                    # Save resampling info
                     resampler.save_resampling_info(cache_file)
 
-            logging.captureWarnings(False)
-            default_logger.setLevel(old_lvl)
-
-        # Convert to wanted dtype and shape
-        band_arr_resampled = band_arr_resampled.astype(np.float32).expand_dims(
-            dim={"band": 1}, axis=0
-        )
-
-        # Write array data
-        band_arr_resampled.rio.write_crs(self.crs(), inplace=True)
-        band_arr_resampled.rio.update_attrs(band_arr.attrs, inplace=True)
-        band_arr_resampled.rio.update_encoding(band_arr.encoding, inplace=True)
-
-        return band_arr_resampled
+        return resampler
 
     def _get_condensed_name(self) -> str:
         """
@@ -773,6 +1079,92 @@ class S3Product(OpticalProduct):
 
         return mtd_el, {}
 
+    def _get_nc_handles(self) -> "_NcHandles":
+        """
+        Get the pool of the NetCDF files (and archive) opened by this product, in order to open each file only once.
+
+        Stored as an attribute and not cached, as :code:`clear()` would drop the pool without closing its handles.
+
+        Returns:
+            _NcHandles: Pool of opened handles
+        """
+        with _NC_HANDLES_LOCK:
+            if getattr(self, "_nc_handles", None) is None:
+                self._nc_handles = _NcHandles()
+            return self._nc_handles
+
+    def close(self) -> None:
+        """Close the opened NetCDF files before cleaning the product"""
+        with contextlib.suppress(Exception):
+            self._get_nc_handles().close()
+        super().close()
+
+    def _open_nc_file(self, filename: str) -> Union[str, io.IOBase]:
+        """
+        Open the NetCDF file corresponding to the given filename.
+
+        Only the needed byte ranges are read:
+
+        - archived products: the archive is opened once and only the wanted member is read.
+          Members stored without compression are read lazily (by ranges, directly from the archive),
+          but compressed members (i.e. deflated) cannot be read by ranges and are entirely decompressed in memory.
+        - cloud products (S3-compatible): the file is read by HTTP range requests
+
+        Args:
+            filename (str): Filename (set a wildcard ('*') in the beginning if needed, this function doesn't do that!)
+
+        Returns:
+            Union[str, io.IOBase]: Path to the NetCDF file if on disk, file object otherwise
+        """
+        handles = self._get_nc_handles()
+
+        if self.is_archived:
+
+            def open_archive():
+                if path.is_cloud_path(self.path):
+                    on_disk = _open_cloud_file(self.path)
+                else:
+                    on_disk = self.path
+                return zipfile.ZipFile(on_disk, "r")
+
+            zip_ds = handles.get("archive", open_archive)
+            regex = re.compile(f".*/{filename}")
+            try:
+                member = next(filter(regex.match, zip_ds.namelist()))
+            except StopIteration as exc:
+                raise FileNotFoundError(
+                    f"Non existing file {filename} in {self.path}"
+                ) from exc
+
+            zinfo = zip_ds.getinfo(member)
+            if zinfo.compress_type == zipfile.ZIP_STORED and not zinfo.flag_bits & 0x1:
+                # Stored members are read directly from the archive: only the wanted ranges are read
+                # (zip_ds.open(member) cannot be used: before Python 3.12, seeking backwards in it reads the member again from its start)
+                return io.BufferedReader(
+                    _ZipMemberFile(zip_ds, zinfo), buffer_size=_RANGE_BUFFER_SIZE
+                )
+            else:
+                # Compressed members cannot be read by ranges (seeking backwards in a deflated stream decompresses it again from its start):
+                # decompress this member (and only this one) in memory
+                LOGGER.debug(
+                    f"{member} is compressed in {self.path.name}: it is entirely decompressed in memory"
+                )
+                return io.BytesIO(zip_ds.read(member))
+        else:
+            try:
+                nc_path = next(self.path.glob(f"{filename}*"))
+            except StopIteration as exc:
+                raise FileNotFoundError(
+                    f"Non existing file {filename} in {self.path}"
+                ) from exc
+
+            if path.is_cloud_path(nc_path):
+                # Cloud paths: instead of downloading them, read the needed ranges and directly open the xr.Dataset
+                return _open_cloud_file(nc_path)
+            else:
+                # Classic paths
+                return str(nc_path)
+
     def _read_nc(
         self,
         filename: Union[str, BandNames],
@@ -785,9 +1177,9 @@ class S3Product(OpticalProduct):
 
         NetCDF files are supposed to be at the root of this product.
 
-        Returns a string as it is meant to be opened by rasterio or directly a xr.DataArray (if archived)
-
-        Caches the file if needed (rasterio does not seem to be able to open a netcdf stored in the cloud).
+        The NetCDF files (and the archive) are opened only once per product and kept open until :code:`prod.close()`.
+        Archived and cloud products are not downloaded: only the byte ranges of the wanted variable are read
+        (except for the compressed archive members, which are entirely decompressed in memory for each read and not kept open).
 
         Args:
             filename (Union[str, BandNames]): Filename or band (set a wildcard ('*') in the beginning if needed, this function doesn't do that!)
@@ -798,68 +1190,50 @@ class S3Product(OpticalProduct):
         Returns:
             xr.DataArray: NetCDF file as a xr.DataArray
         """
-        bytes_file = None
-        nc_path = None
-
         # Try to convert to spb if existing
         with contextlib.suppress(TypeError):
             filename = SpectralBandNames.convert_from(filename)[0]
 
-        # Get raw band path
-        if self.is_archived:
-            if path.is_cloud_path(self.path):
-                # Download the whole product (sadly)
-                on_disk = io.BytesIO(self.path.read_bytes())
-            else:
-                on_disk = self.path
-
-            # Cannot read zipped+netcdf files -> we are forced to dezip them
-            with zipfile.ZipFile(on_disk, "r") as zip_ds:
-                filenames = [f.filename for f in zip_ds.filelist]
-                regex = re.compile(f".*/{filename}")
-                bytes_file = zip_ds.read(list(filter(regex.match, filenames))[0])
-        else:
-            try:
-                nc_path = next(self.path.glob(f"{filename}*"))
-            except StopIteration as exc:
-                raise FileNotFoundError(
-                    f"Non existing file {filename} in {self.path}"
-                ) from exc
-
-            if path.is_cloud_path(nc_path):
-                # Cloud paths: instead of downloading them, read them as bytes and directly open the xr.Dataset
-                bytes_file = nc_path.read_bytes()
-            else:
-                # Classic paths
-                nc_path = str(nc_path)
+        def open_dataset(nc_file):
+            with warnings.catch_warnings():
+                # Ignore UserWarning: Duplicate dimension names present: dimensions {'bands'} appear more than once in dims=('bands', 'bands').
+                # We do not yet support duplicate dimension names, but we do allow initial construction of the object.
+                # We recommend you rename the dims immediately to become distinct, as most xarray functionality is likely to fail silently if you do not.
+                # To rename the dimensions you will need to set the ``.dims`` attribute of each variable, ``e.g. var.dims=('x0', 'x1')``.
+                warnings.simplefilter("ignore", category=UserWarning)
+
+                # Open the netcdf file as a dataset
+                # mask_and_scale=True => offset and scale are automatically applied!
+                return xr.open_dataset(
+                    nc_file,
+                    mask_and_scale=True,
+                    engine="h5netcdf",
+                )
 
-        # Open the netcdf file as a dataset (from bytes)
-        # mask_and_scale=True => offset and scale are automatically applied!
-        with warnings.catch_warnings():
+        # The file objects are shared: read the data under the lock
+        handles = self._get_nc_handles()
+        with handles.lock, warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NotGeoreferencedWarning)
-            if bytes_file:
-                with io.BytesIO(bytes_file) as bf:
-                    # We need to load the dataset as we will do some operations and bf will close
-                    nc = xr.open_dataset(bf, mask_and_scale=True)
-                    if subdataset:
-                        nc = getattr(nc, subdataset)
-
-                    nc.load()
-            else:
-                with warnings.catch_warnings():
-                    # Ignore UserWarning: Duplicate dimension names present: dimensions {'bands'} appear more than once in dims=('bands', 'bands').
-                    # We do not yet support duplicate dimension names, but we do allow initial construction of the object.
-                    # We recommend you rename the dims immediately to become distinct, as most xarray functionality is likely to fail silently if you do not.
-                    # To rename the dimensions you will need to set the ``.dims`` attribute of each variable, ``e.g. var.dims=('x0', 'x1')``.
-                    warnings.simplefilter("ignore", category=UserWarning)
-
-                    # No need to load here
-                    nc = xr.open_dataset(
-                        nc_path, mask_and_scale=True, engine="h5netcdf"
-                    )
+            key = ("dataset", str(filename))
+            netcdf_ds = handles.find(key)
+            pooled = netcdf_ds is not None
+            if not pooled:
+                nc_file = self._open_nc_file(filename)
+                netcdf_ds = open_dataset(nc_file)
+
+                # Don't keep the datasets over decompressed members: they would stay in memory until the product is closed
+                pooled = not isinstance(nc_file, io.BytesIO)
+                if pooled:
+                    handles.add(key, netcdf_ds)
+
+            try:
+                nc = netcdf_ds[subdataset] if subdataset else netcdf_ds
 
-                if subdataset:
-                    nc = nc[subdataset]
+                # Only load the wanted variable (without loading it in the pooled dataset)
+                nc = nc.copy(deep=False).load()
+            finally:
+                if not pooled:
+                    netcdf_ds.close()
 
         # Convert to dataarray if not already the case
         if not isinstance(nc, xr.DataArray):
@@ -87,6 +87,9 @@ SLSTR_ABC_BANDS = ["S4", "S5", "S6"]
 SLSTR_F_BANDS = ["F1"]
 SLSTR_I_BANDS = ["S7", "S8", "S9", "F1", "F2"]
 
+# Number of pixels interpolated at once from the tie point grid
+TIE_INTERP_BLOCK_SIZE = 2**20
+
 # Link band names to their physical quantity (radiance vs brightness temperature)
 SLSTR_RAD_BANDS = SLSTR_A_BANDS + SLSTR_ABC_BANDS
 SLSTR_BT_BANDS = SLSTR_I_BANDS
@@ -695,6 +698,8 @@ class S3SlstrProduct(S3Product):
         """
         Convert an image sampled on the tie point grid (tx) to the wanted gris, given by the suffix
 
+        The interpolation is evaluated by blocks of rows (in float32) to limit the memory usage.
+
         Args:
             tie_arr (xr.Dataset): Image sampled on the tie point grid (tx)
             suffix: Suffix of the new grid
@@ -703,21 +708,10 @@ class S3SlstrProduct(S3Product):
             np.ndarray: Array resampled to the wanted grid as a numpy array
         """
         # Load tie point grid
-        tie_cart_file = "cartesian_tx.nc"
-        tx_nc_name = "x_tx"
-        ty_nc_name = "y_tx"
-
-        # WARNING: RectBivariateSpline must have increasing values
-        tx = np.squeeze(self._read_nc(tie_cart_file, tx_nc_name).data)[0, ::-1]
-        ty = np.squeeze(self._read_nc(tie_cart_file, ty_nc_name).data)[:, 0]
+        tx, ty = self._read_tie_grid()
 
         # Load fill image grid (cartesian)
-        geo_file = f"cartesian_{suffix}.nc"
-        fx_nc_name = f"x_{suffix}"
-        fy_nc_name = f"y_{suffix}"
-
-        fx = np.squeeze(self._read_nc(geo_file, fx_nc_name))
-        fy = np.squeeze(self._read_nc(geo_file, fy_nc_name))
+        fx, fy = self._read_img_grid(suffix)
 
         # Interpolate via Spline (as extrapolation is possible and the grid is very sparse along the rows)
         # Import scipy here (long import)
@@ -727,12 +721,57 @@ class S3SlstrProduct(S3Product):
         no_nan_arr = np.nan_to_num(np.squeeze(tie_arr).data[:, ::-1])
         spline_interp = RectBivariateSpline(ty, tx, no_nan_arr)
 
-        # Interpolate and set nodata back
-        img_arr = spline_interp.ev(fy, fx)
+        # Interpolate by blocks of rows
+        img_arr = np.empty(fx.shape, dtype=np.float32)
+        nof_rows = max(1, TIE_INTERP_BLOCK_SIZE // fx.shape[-1])
+        for row in range(0, fx.shape[0], nof_rows):
+            rows = slice(row, row + nof_rows)
+            img_arr[rows] = spline_interp.ev(fy[rows], fx[rows])
+
+        # Set nodata back
         img_arr[img_arr == 0] = np.nan
 
         return img_arr
 
+    @cache
+    def _read_tie_grid(self) -> (np.ndarray, np.ndarray):
+        """
+        Read the tie point grid (tx) coordinates, only once per product
+
+        Returns:
+            (np.ndarray, np.ndarray): X and Y tie point coordinates (increasing)
+        """
+        tie_cart_file = "cartesian_tx.nc"
+        tx_nc_name = "x_tx"
+        ty_nc_name = "y_tx"
+
+        # WARNING: RectBivariateSpline must have increasing values
+        tx = np.squeeze(self._read_nc(tie_cart_file, tx_nc_name).data)[0, ::-1]
+        ty = np.squeeze(self._read_nc(tie_cart_file, ty_nc_name).data)[:, 0]
+
+        return tx, ty
+
+    def _read_img_grid(self, suffix: str) -> (np.ndarray, np.ndarray):
+        """
+        Read the image grid coordinates (cartesian) given by the suffix.
+
+        Not cached: these float64 grids are only needed to compute the (cached) cosine of the SZA
+
+        Args:
+            suffix (str): Suffix of the grid
+
+        Returns:
+            (np.ndarray, np.ndarray): X and Y image coordinates
+        """
+        geo_file = f"cartesian_{suffix}.nc"
+        fx_nc_name = f"x_{suffix}"
+        fy_nc_name = f"y_{suffix}"
+
+        fx = np.squeeze(self._read_nc(geo_file, fx_nc_name).data)
+        fy = np.squeeze(self._read_nc(geo_file, fy_nc_name).data)
+
+        return fx, fy
+
     # def _bt_2_rad(self, band_arr: xr.DataArray, band: BandNames = None) -> xr.DataArray:
     #     """
     #     Convert brightness temperature to radiance
@@ -782,25 +821,14 @@ class S3SlstrProduct(S3Product):
         Returns:
             dict: Dictionary containing {band: path}
         """
-        rad_2_refl_path, rad_2_refl_exists = self._get_out_path(
-            f"rad_2_refl_{band.name}_{suffix}.npy"
-        )
-        if not rad_2_refl_exists:
-            # Open SZA array (resampled to band_arr size)
-            sza = self._compute_sza_img_grid(suffix)
+        # Open cos(SZA) array (resampled to band_arr size), shared by all the bands of this grid
+        cos_sza = self._compute_cos_sza_img_grid(suffix)
 
-            # Open solar flux (resampled to band_arr size)
-            e0 = self._compute_e0(band, suffix)
+        # Open solar flux
+        e0 = self._compute_e0(band, suffix)
 
-            # Compute rad_2_refl coeff
-            rad_2_refl_coeff = (np.pi / e0 / np.cos(sza)).astype(np.float32)
-
-            # Write on disk
-            np.save(str(rad_2_refl_path), rad_2_refl_coeff)
-
-        else:
-            # Open rad_2_refl_coeff (resampled to band_arr size)
-            rad_2_refl_coeff = utils.load_np(rad_2_refl_path, self._tmp_process)
+        # Compute rad_2_refl coeff
+        rad_2_refl_coeff = np.float32(np.pi / e0) / cos_sza
 
         return band_arr * rad_2_refl_coeff
 
@@ -862,10 +890,24 @@ class S3SlstrProduct(S3Product):
 
         return band_arr
 
+    @cache
+    def _compute_cos_sza_img_grid(self, suffix) -> np.ndarray:
+        """
+        Compute the cosine of the Sun Zenith Angle resampled to the image grid (from the tie point grid), only once per grid
+
+        Args:
+            suffix (str): Suffix
+        Returns:
+            np.ndarray: Cosine of the resampled Sun Zenith Angle as a numpy array
+        """
+        return np.cos(self._compute_sza_img_grid(suffix)).astype(np.float32)
+
     def _compute_sza_img_grid(self, suffix) -> np.ndarray:
         """
         Compute Sun Zenith Angle (in radian) resampled to the image grid (from the tie point grid)
 
+        Not cached in memory (only its cosine is, see :code:`_compute_cos_sza_img_grid`), but saved on disk.
+
         Args:
             suffix (str): Suffix
         Returns:
@@ -890,6 +932,7 @@ class S3SlstrProduct(S3Product):
 
         return sza_img
 
+    @cache
     def _compute_e0(self, band: BandNames, suffix: str) -> np.ndarray:
         """
         Compute the solar spectral flux in mW / (m^2 * sr * nm)
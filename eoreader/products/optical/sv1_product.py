@@ -36,7 +36,7 @@ from sertit.misc import ListEnum
 from sertit.types import AnyPathType
 from shapely.geometry import box
 
-from eoreader import DATETIME_FMT, EOREADER_NAME, cache, utils
+from eoreader import DATETIME_FMT, EOREADER_NAME, cache
 from eoreader.bands import (
     BLUE,
     GREEN,
@@ -627,6 +627,46 @@ class Sv1Product(VhrProduct):
 
         return tile_path
 
+    def _get_default_ortho_grid(
+        self, default_band: BandNames, **kwargs
+    ) -> Union[tuple, None]:
+        """
+        Compute the orthorectified grid of the default band from the RPCs of its tile (PAN or MUX), without orthorectifying it.
+
+        Args:
+            default_band (BandNames): Default band
+            kwargs: Additional arguments
+
+        Returns:
+            Union[tuple, None]: Transform, width and height of the orthorectified grid,
+            None if the default band doesn't need to be orthorectified or is already orthorectified
+        """
+        if (
+            self.product_type not in self._proj_prod_type
+            or self._get_utm_band_path(
+                band=default_band.name, pixel_size=self.pixel_size
+            ).is_file()
+            or self._get_out_path(f"{self.condensed_name}_ortho.tif")[1]
+        ):
+            return None
+
+        tile_path = self._get_tile_path(band=default_band)
+        with rasterio.open(str(tile_path)) as ds:
+            rpcs = ds.rpcs
+
+        if not rpcs:
+            raise InvalidProductError(
+                "Your projected VHR data doesn't have any RPC. "
+                "EOReader cannot orthorectify it!"
+            )
+
+        return self._get_ortho_grid(
+            tile_path,
+            rpcs=rpcs,
+            dem_path=self._get_rpc_dem_path(self._get_dem_path(**kwargs)),
+            pixel_size=self.pixel_size,
+        )
+
     def _get_ortho_path(self, **kwargs) -> AnyPathType:
         """
         Get the orthorectified path of the bands.
@@ -648,15 +688,20 @@ class Sv1Product(VhrProduct):
 
                 # Reproject and write on disk data
                 dem_path = self._get_dem_path(**kwargs)
-                tile = utils.read(self._get_tile_path(**kwargs))
+                tile_path = self._get_tile_path(**kwargs)
 
                 # TODO: change this when available in rioxarray
                 # See https://github.com/corteva/rioxarray/issues/837
-                with rasterio.open(str(self._get_tile_path(**kwargs))) as ds:
+                with rasterio.open(str(tile_path)) as ds:
                     rpcs = ds.rpcs
-
-                self._reproject(
-                    tile, rpcs=rpcs, dem_path=dem_path, ortho_path=ortho_path, **kwargs
+                    indexes = list(ds.indexes)
+
+                self._orthorectify(
+                    tile_path,
+                    rpcs=rpcs,
+                    dem_path=dem_path,
+                    ortho_paths={ortho_path: indexes},
+                    **kwargs,
                 )
 
         else:
@@ -24,10 +24,12 @@ from abc import abstractmethod
 from typing import Union
 
 import affine
+import geopandas as gpd
 import rasterio
 import xarray as xr
+from rasterio import rpc
 from rasterio.crs import CRS
-from sertit import AnyPath, rasters
+from sertit import AnyPath, path, rasters, vectors
 from sertit.types import AnyPathStrType, AnyPathType
 
 from eoreader import EOREADER_NAME, utils
@@ -127,54 +129,136 @@ class VhrProduct(OpticalProduct):
         """
         return self._get_default_utm_band(self.pixel_size, **kwargs)
 
-    def _get_ortho_path(self, **kwargs) -> AnyPathType:
+    def _get_rpcs(self, **kwargs) -> rpc.RPC:
         """
-        Get the orthorectified path of the bands.
+        Get the RPCs of the VHR tile.
 
         Returns:
-            AnyPathType: Orthorectified path
+            rpc.RPC: RPCs of the tile
         """
-        if self.product_type in self._proj_prod_type:
-            ortho_name = f"{self.condensed_name}_ortho.tif"
+        # TODO: change this when available in rioxarray
+        # See https://github.com/corteva/rioxarray/issues/837
+        if kwargs.get("rpcs"):
+            rpcs = kwargs["rpcs"]
+        else:
+            with rasterio.open(str(self._get_tile_path())) as ds:
+                rpcs = ds.rpcs
 
-            ortho_path, ortho_exists = self._get_out_path(ortho_name)
-            if not ortho_exists:
-                LOGGER.info(
-                    "Manually orthorectified stack not given by the user. "
-                    "Reprojecting whole stack, this may take a while. "
-                    "(Might be inaccurate on steep terrain, depending on the DEM pixel size)."
-                )
+        if not rpcs:
+            raise InvalidProductError(
+                "Your projected VHR data doesn't have any RPC. "
+                "EOReader cannot orthorectify it!"
+            )
 
-                # Reproject and write on disk data
-                dem_path = self._get_dem_path(**kwargs)
+        return rpcs
 
-                with rasterio.open(str(self._get_tile_path())) as ds:
-                    tags = ds.tags()
+    def _orthorectify_tile(self, ortho_paths: dict, **kwargs) -> None:
+        """
+        Orthorectify the VHR tile (only the needed bands), tile by tile.
 
-                    # TODO: change this when available in rioxarray
-                    # See https://github.com/corteva/rioxarray/issues/837
-                    rpcs = kwargs.pop("rpcs") if "rpcs" in kwargs else ds.rpcs
+        Args:
+            ortho_paths (dict): Output paths and the (1-based) indexes of the tile bands to write in each of them
+            kwargs: Other arguments used to load bands
+        """
+        # Get the RPCs (the ones given by the user if any) before removing them from kwargs
+        rpcs = self._get_rpcs(**kwargs)
+        kwargs.pop("rpcs", None)
+        dem_path = self._get_dem_path(**kwargs)
+        tile_path = self._get_tile_path()
+        with rasterio.open(str(tile_path)) as ds:
+            tags = ds.tags()
+
+        self._orthorectify(
+            tile_path,
+            rpcs=rpcs,
+            dem_path=dem_path,
+            ortho_paths=ortho_paths,
+            tags=tags,
+            **kwargs,
+        )
 
-                if not rpcs:
-                    raise InvalidProductError(
-                        "Your projected VHR data doesn't have any RPC. "
-                        "EOReader cannot orthorectify it!"
-                    )
+    def _get_band_ortho_paths(self, band_list: list, **kwargs) -> dict:
+        """
+        Get the orthorectified paths of the given bands, orthorectifying only the missing ones.
 
-                tile = utils.read(self._get_tile_path())
-                self._reproject(
-                    tile,
-                    rpcs=rpcs,
-                    dem_path=dem_path,
-                    ortho_path=ortho_path,
-                    tags=tags,
-                    **kwargs,
+        If the whole stack has already been orthorectified (or given by the user), use it instead.
+
+        Args:
+            band_list (list): List of the wanted bands
+            kwargs: Other arguments used to load bands
+
+        Returns:
+            dict: Dictionary containing the orthorectified path of each queried band
+        """
+        if self.ortho_path:
+            return dict.fromkeys(band_list, self.ortho_path)
+
+        if self.product_type not in self._proj_prod_type:
+            self.ortho_path = self._get_tile_path()
+            return dict.fromkeys(band_list, self.ortho_path)
+
+        # Whole stack already orthorectified
+        stack_ortho_path, stack_ortho_exists = self._get_out_path(
+            f"{self.condensed_name}_ortho.tif"
+        )
+        if stack_ortho_exists:
+            self.ortho_path = stack_ortho_path
+            return dict.fromkeys(band_list, self.ortho_path)
+
+        # Only orthorectify the window if given (with its own cache key)
+        window = kwargs.get("window")
+        bounds = self._get_ortho_bounds(window)
+        win_suffix = f"_{utils.get_window_suffix(window)}" if bounds is not None else ""
+
+        # Orthorectify only the missing bands, in one pass
+        ortho_paths = {}
+        to_ortho = {}
+        for band in band_list:
+            # A whole orthorectified band can always be used
+            ortho_path, ortho_exists = self._get_out_path(
+                f"{self.condensed_name}_{band.name}_ortho.tif"
+            )
+            if not ortho_exists and win_suffix:
+                ortho_path, ortho_exists = self._get_out_path(
+                    f"{self.condensed_name}_{band.name}{win_suffix}_ortho.tif"
                 )
+            ortho_paths[band] = ortho_path
+            if not ortho_exists:
+                to_ortho[ortho_path] = [self.bands[band].id]
 
-        else:
-            ortho_path = self._get_tile_path()
+        if to_ortho:
+            LOGGER.info(
+                "Manually orthorectified stack not given by the user. "
+                f"Orthorectifying {len(to_ortho)} band(s){' (only in the given window)' if win_suffix else ''}, this may take a while. "
+                "(Might be inaccurate on steep terrain, depending on the DEM pixel size)."
+            )
+            self._orthorectify_tile(to_ortho, bounds=bounds, **kwargs)
 
-        return ortho_path
+        return ortho_paths
+
+    def _get_ortho_bounds(self, window) -> Union[tuple, None]:
+        """
+        Get the bounds (in the product CRS) of the window to orthorectify.
+
+        Only vector windows (paths or GeoDataFrames) can be orthorectified on demand:
+        pixel windows cannot be located before the orthorectification.
+
+        Args:
+            window: Window given by the user
+
+        Returns:
+            Union[tuple, None]: Bounds of the window, None if the whole tile needs to be orthorectified
+        """
+        if window is None:
+            return None
+
+        if path.is_path(window):
+            window = vectors.read(window)
+
+        if isinstance(window, gpd.GeoDataFrame):
+            return tuple(window.to_crs(self.crs()).total_bounds)
+
+        return None
 
     def get_band_paths(
         self, band_list: list, pixel_size: float = None, **kwargs
@@ -204,11 +288,9 @@ class VhrProduct(OpticalProduct):
         Returns:
             dict: Dictionary containing the path of each queried band
         """
-        if not self.ortho_path:
-            self.ortho_path = self._get_ortho_path(**kwargs)
-
         # Processed path names
         band_paths = {}
+        missing_bands = []
         for band in band_list:
             # Get clean band path
             clean_band = self.get_band_path(band, pixel_size=pixel_size, **kwargs)
@@ -221,13 +303,14 @@ class VhrProduct(OpticalProduct):
                 )
                 if not reproj_path.is_file():
                     # Then for original data
-                    band_path = self.ortho_path
+                    missing_bands.append(band)
                 else:
-                    band_path = reproj_path
+                    band_paths[band] = reproj_path
 
-                band_paths[band] = band_path
+        if missing_bands:
+            band_paths.update(self._get_band_ortho_paths(missing_bands, **kwargs))
 
-        return band_paths
+        return {band: band_paths[band] for band in band_list}
 
     def _read_band(
         self,
@@ -299,12 +382,12 @@ class VhrProduct(OpticalProduct):
             # Manage the case if we open a stack (native DIMAP bands)
             else:
                 # Read band
-                band_arr = utils.read(
+                band_arr = self._read_stack_band(
                     band_path,
+                    band,
                     pixel_size=pixel_size,
                     size=size,
                     resampling=resampling,
-                    indexes=[self.bands[band].id],
                     **kwargs,
                 )
 
@@ -513,12 +596,53 @@ class VhrProduct(OpticalProduct):
 
         """
         default_band = self.get_default_band()
+
+        # Don't orthorectify the whole default band only to get its grid
+        ortho_grid = self._get_default_ortho_grid(default_band, **kwargs)
+        if ortho_grid is not None:
+            tr, width, height = ortho_grid
+            return tr, width, height, self.crs()
+
+        # Never use windowed orthorectified bands here
         def_path = self.get_band_paths(
-            [default_band], pixel_size=self.pixel_size, **kwargs
+            [default_band],
+            pixel_size=self.pixel_size,
+            **{key: val for key, val in kwargs.items() if key != "window"},
         )[default_band]
         with rasterio.open(str(def_path)) as dst:
             return dst.transform, dst.width, dst.height, dst.crs
 
+    def _get_default_ortho_grid(
+        self, default_band: BandNames, **kwargs
+    ) -> Union[tuple, None]:
+        """
+        Compute the orthorectified grid of the default band from the RPCs, without orthorectifying it.
+
+        Args:
+            default_band (BandNames): Default band
+            kwargs: Additional arguments
+
+        Returns:
+            Union[tuple, None]: Transform, width and height of the orthorectified grid,
+            None if the default band doesn't need to be orthorectified or is already orthorectified
+        """
+        if (
+            self.ortho_path
+            or self.product_type not in self._proj_prod_type
+            or self._get_out_path(
+                f"{self.condensed_name}_{default_band.name}_ortho.tif"
+            )[1]
+            or self._get_out_path(f"{self.condensed_name}_ortho.tif")[1]
+        ):
+            return None
+
+        return self._get_ortho_grid(
+            self._get_tile_path(),
+            rpcs=self._get_rpcs(**kwargs),
+            dem_path=self._get_rpc_dem_path(self._get_dem_path(**kwargs)),
+            pixel_size=self.pixel_size,
+        )
+
     @abstractmethod
     def _get_tile_path(self) -> AnyPathType:
         """
@@ -22,12 +22,17 @@ import contextlib
 import datetime as dt
 import functools
 import gc
+import inspect
 import logging
 import os
 import platform
 import shutil
 import tempfile
+import threading
+import uuid
 from abc import abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from enum import unique
 from io import BytesIO
 from typing import Union
@@ -58,8 +63,9 @@ from sertit import (
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType, AnyPathType
 from sertit.vectors import WGS84
+from shapely.geometry import box
 
-from eoreader import EOREADER_NAME, cache, utils
+from eoreader import EOREADER_NAME, __version__, cache, utils
 from eoreader.bands import (
     DEM,
     HILLSHADE,
@@ -67,7 +73,7 @@ from eoreader.bands import (
     PAN,
     SLOPE,
     BandNames,
-    compute_index,
+    compute_indices,
     indices,
     is_clouds,
     is_dem,
@@ -79,11 +85,15 @@ from eoreader.bands import (
     to_band,
     to_str,
 )
+from eoreader.dem_cache import get_dem_tile_cache
+from eoreader.disk_cache import DiskCache, get_disk_cache
 from eoreader.env_vars import (
     CI_EOREADER_BAND_FOLDER,
     DEM_PATH,
+    LAZY_INIT,
     LEGACY_BAND_NAME_RESOLUTION,
     TILE_SIZE,
+    WRITE_BEHIND,
 )
 from eoreader.exceptions import (
     InvalidBandError,
@@ -92,7 +102,7 @@ from eoreader.exceptions import (
     InvalidTypeError,
     UnhandledArchiveError,
 )
-from eoreader.keywords import DEM_KW, HILLSHADE_KW, SLOPE_KW
+from eoreader.keywords import DEM_KW, HILLSHADE_KW, SLOPE_KW, WRITE_INTERMEDIARY
 from eoreader.reader import Constellation, Reader
 from eoreader.stac import StacItem
 from eoreader.utils import DEFAULT_TILE_SIZE, simplify
@@ -100,6 +110,18 @@ from eoreader.utils import DEFAULT_TILE_SIZE, simplify
 LOGGER = logging.getLogger(EOREADER_NAME)
 PRODUCT_FACTORY = Reader()
 
+_ORTHO_KERNEL_RADIUS = {
+    Resampling.nearest: 1,
+    Resampling.bilinear: 1,
+    Resampling.cubic: 2,
+    Resampling.cubic_spline: 2,
+    Resampling.lanczos: 3,
+}
+"""Radius (in source pixels) of the resampling kernels when orthorectifying tile by tile (2 for the other resamplings)"""
+
+_ORTHO_HEIGHT_MARGIN = 100
+"""Margin (in meters) added around the DEM heights of a tile to back-project it through the RPCs (i.e. for the geoid undulation)"""
+
 
 @unique
 class SensorType(ListEnum):
@@ -130,6 +152,52 @@ class OrbitDirection(ListEnum):
     """Unknown orbit direction"""
 
 
+_LAZY_ATTRIBUTES = [
+    "tile_name",
+    "product_type",
+    "instrument",
+    "bands",
+    "resolution",
+    "pixel_size",
+    "condensed_name",
+]
+"""Attributes computed on first access for lazy products"""
+
+_TRANSIENT_ATTRIBUTES = [
+    "_tmp_output",
+    "_tmp_process",
+    "_has_output_folders",
+    "_pending_writes",
+    "_pending_writes_lock",
+    "_write_executor",
+    "_stacked_reads",
+    "_stac",
+]
+"""Attributes that cannot be shared between processes (not stored in the product descriptors)"""
+
+_DESCRIPTOR_GEOMETRIES = ["crs", "extent", "footprint"]
+"""Geometries stored in the product descriptors"""
+
+
+class _DescriptorValue:
+    """
+    Value of a method stored in a product descriptor, returned without computing it again.
+    The real method is called if some arguments are given.
+    """
+
+    def __init__(self, prod, method: str, value) -> None:
+        self.prod = prod
+        self.method = method
+        self.value = value
+
+    def __call__(self, *args, **kwargs):
+        if args or kwargs:
+            method = inspect.getattr_static(type(self.prod), self.method)
+            return method.__get__(self.prod, type(self.prod))(*args, **kwargs)
+
+        return self.value
+
+
 class Product:
     """Super class of EOReader Products"""
 
@@ -182,6 +250,14 @@ class Product:
         self._output = None
         self._remove_tmp_process = remove_tmp
 
+        # Write-behind of the intermediary files: {path: future}
+        self._pending_writes = {}
+        self._pending_writes_lock = threading.Lock()
+        self._write_executor = None
+
+        # Bands of the current load read in one call from their stack (see _stacked_reading)
+        self._stacked_reads = None
+
         # Get the product date and datetime
         self.date = None
         """Acquisition date."""
@@ -268,19 +344,30 @@ class Product:
         self.band_resampling = utils.get_band_resampling()
         """Band resampling (default: bilinear). Overridden by the env variable "EOREADER_BAND_RESAMPLING", if existing and valid."""
 
+        self.collocation_stats = {"snapped": 0, "reprojected": 0}
+        """
+        Number of bands snapped onto the grid of the other loaded bands (already aligned)
+        or reprojected onto it (misaligned) during the last :code:`load` call. Useful for diagnostics.
+        """
+
         self._stac = None
 
-        # Manage output
+        # Lazy initialization: only compute the attributes when they are needed
+        self._is_lazy = kwargs.get(
+            "lazy", os.getenv(LAZY_INIT, "0").lower() in ("1", "true")
+        )
+        self._is_initialized = True
+        self._has_output_folders = False
+        self._init_kwargs = kwargs
+        self._lazy_attrs = {}
+
+        # Manage output (a temporary directory will be created if no output is given)
         if output_path:
-            self._tmp_output = None
             self._output = AnyPath(output_path)
-        else:
-            self._tmp_output = tempfile.TemporaryDirectory()
-            self._output = AnyPath(self._tmp_output.name)
 
-        # Temporary file path (private)
-        self._tmp_process = self._output.joinpath("tmp")
-        os.makedirs(self._tmp_process, exist_ok=True)
+        # Temporary file path (private), created on first write for lazy products
+        if not self._is_lazy:
+            self._create_output_folders("tmp")
 
         # Pre initialization
         self._pre_init(**kwargs)
@@ -312,26 +399,91 @@ class Product:
                 if isinstance(self.constellation, str)
                 else self.constellation.name
             )
-            self._set_instrument()
 
-            # Post initialization
-            self._post_init(**kwargs)
+            if self._is_lazy:
+                # Hide the remaining attributes: they will be computed on first access (see __getattr__)
+                self._is_initialized = False
+                self._lazy_attrs = {
+                    attr: self.__dict__.pop(attr)
+                    for attr in _LAZY_ATTRIBUTES
+                    if attr in self.__dict__
+                }
+            else:
+                self._finish_init()
 
-            # Set product type, needs to be done after the post-initialization
-            self._set_product_type()
+    def _finish_init(self) -> None:
+        """
+        Finish the initialization of the product, i.e. set all the attributes needing the metadata
+        (instrument, product type, pixel size, band mapping, condensed name...).
 
-            # Set the pixel size, needs to be done when knowing the product type
-            self._set_pixel_size()
+        Called at the end of :code:`__init__`, or on the first access to one of these attributes for lazy products.
+        """
+        # Restore the hidden attributes (before anything else, to avoid infinite recursions)
+        self._is_initialized = True
+        for attr, val in self._lazy_attrs.items():
+            self.__dict__.setdefault(attr, val)
+        self._lazy_attrs = {}
+
+        self._set_instrument()
+
+        # Post initialization
+        self._post_init(**self._init_kwargs)
+
+        # Set product type, needs to be done after the post-initialization
+        self._set_product_type()
 
-            self._map_bands()
+        # Set the pixel size, needs to be done when knowing the product type
+        self._set_pixel_size()
 
-            # Condensed name
-            self.condensed_name = self._get_condensed_name()
+        self._map_bands()
 
-            # Once we get the condensed name, move the temporary folder in order to have its correct name
-            # This is to avoid a meaningless tmp folder (tmp_None) if the output is given directly in the init of the product
+        # Condensed name
+        self.condensed_name = self._get_condensed_name()
+
+        # Once we get the condensed name, move the temporary folder in order to have its correct name
+        # This is to avoid a meaningless tmp folder (tmp_None) if the output is given directly in the init of the product
+        if self._has_output_folders:
             self._move_tmp_process(f"tmp_{self.condensed_name}")
 
+    def _create_output_folders(self, tmp_name: str) -> None:
+        """
+        Create the output folder (a temporary directory if no output has been given) and the temporary process folder.
+
+        Args:
+            tmp_name (str): Name of the temporary process folder
+        """
+        self._has_output_folders = True
+        if self._output is None:
+            self._tmp_output = tempfile.TemporaryDirectory()
+            self._output = AnyPath(self._tmp_output.name)
+
+        self._tmp_process = self._output.joinpath(tmp_name)
+        os.makedirs(self._tmp_process, exist_ok=True)
+
+    def __getattr__(self, item):
+        """
+        Only called when the attribute hasn't been found: compute the lazy attributes if needed.
+        """
+        attrs = self.__dict__
+        if not item.startswith("__"):
+            if not attrs.get("_is_initialized", True):
+                try:
+                    self._finish_init()
+                except AttributeError as exc:
+                    # Don't report it as the missing attribute
+                    raise RuntimeError(
+                        f"Cannot finish the initialization of {attrs.get('name', self.__class__.__name__)}: {exc}"
+                    ) from exc
+                return getattr(self, item)
+            if item == "_tmp_process" and attrs.get("_is_lazy", False):
+                # Only create the folders when needed (i.e. when something needs to be written or read from the disk)
+                self._create_output_folders(f"tmp_{self.condensed_name}")
+                return self._tmp_process
+
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{item}'"
+        )
+
     def __enter__(self):
         return self
 
@@ -343,6 +495,13 @@ class Product:
         self.close()
 
     def close(self):
+        # -- Wait for the pending writes before removing anything
+        self.flush()
+        with contextlib.suppress(AttributeError):
+            if self._write_executor is not None:
+                self._write_executor.shutdown(wait=True)
+                self._write_executor = None
+
         self.clear()
 
         # -- Remove temp folders
@@ -352,6 +511,7 @@ class Product:
 
             elif (
                 self._remove_tmp_process
+                and self._has_output_folders
                 and self._tmp_process is not None
                 and self._tmp_process.exists()
             ):
@@ -798,6 +958,183 @@ class Product:
 
         return out, exists
 
+    def _get_cache_key(self, filename: str, *args, **kwargs) -> str:
+        """
+        Get the key of a file in the disk cache.
+
+        The key is derived from the product identity, the filename (encoding the band, the pixel size and the window),
+        the sensor-specific processing options and any other given argument.
+
+        Args:
+            filename (str): Filename
+            *args: Other arguments making the file unique
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            str: Disk cache key
+        """
+        return DiskCache.get_key(
+            self.name,
+            filename,
+            *self._get_cache_key_sensor_specific_parts(**kwargs),
+            *args,
+        )
+
+    def _get_cache_key_sensor_specific_parts(self, **kwargs) -> list:
+        """
+        Get the sensor-specific processing options that alter the content of the cached files.
+
+        Args:
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            list: Sensor-specific parts of the disk cache key
+        """
+        return []
+
+    def _restore_from_cache(self, out_path: AnyPathType, *args, **kwargs) -> bool:
+        """
+        Restore a file from the disk cache (if enabled with :code:`EOREADER_CACHE_DIR`).
+
+        Args:
+            out_path (AnyPathType): Where to restore the file
+            *args: Other arguments making the file unique
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            bool: True if the file has been restored
+        """
+        disk_cache = get_disk_cache()
+        if disk_cache is None or path.is_cloud_path(out_path):
+            return False
+
+        return disk_cache.restore(
+            self._get_cache_key(AnyPath(out_path).name, *args, **kwargs), out_path
+        )
+
+    def _put_in_cache(self, out_path: AnyPathType, *args, **kwargs) -> None:
+        """
+        Store a written file in the disk cache (if enabled with :code:`EOREADER_CACHE_DIR`).
+
+        Args:
+            out_path (AnyPathType): File to store
+            *args: Other arguments making the file unique
+            **kwargs: Other arguments used to load bands
+        """
+        disk_cache = get_disk_cache()
+        if disk_cache is None or path.is_cloud_path(out_path):
+            return
+
+        if AnyPath(out_path).is_file():
+            disk_cache.put(
+                out_path, self._get_cache_key(AnyPath(out_path).name, *args, **kwargs)
+            )
+
+    def _write_intermediary(
+        self, xda: xr.DataArray, out_path: AnyPathType, **kwargs
+    ) -> xr.DataArray:
+        """
+        Write an intermediary file (clean band, spectral index...) on disk and store it in the disk cache.
+
+        Nothing is written if the :code:`write_intermediary` keyword is :code:`False`.
+
+        If :code:`EOREADER_WRITE_BEHIND` is set, the file is written in a background thread
+        and this function returns immediately. Use :code:`flush()` to wait for the pending writes.
+        In this case, a dask array is persisted before being written, so that it is computed only once
+        (for the file and for the returned array).
+
+        Args:
+            xda (xr.DataArray): Array to write
+            out_path (AnyPathType): Output path
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            xr.DataArray: Array to use instead of :code:`xda`
+        """
+        if not kwargs.get(WRITE_INTERMEDIARY, True):
+            return xda
+
+        if os.getenv(WRITE_BEHIND, "0").lower() not in ("1", "true"):
+            utils.write(xda, out_path)
+            self._put_in_cache(out_path, **kwargs)
+            return xda
+
+        with self._pending_writes_lock:
+            # Already being written
+            if str(out_path) in self._pending_writes:
+                return xda
+
+            if xda.chunks is not None:
+                xda = xda.persist()
+
+            if self._write_executor is None:
+                self._write_executor = ThreadPoolExecutor(
+                    max_workers=max(1, utils.get_max_cores()),
+                    thread_name_prefix="eoreader_write",
+                )
+            self._pending_writes[str(out_path)] = self._write_executor.submit(
+                self._write_atomically, xda, out_path, **kwargs
+            )
+
+        return xda
+
+    def _write_atomically(
+        self, xda: xr.DataArray, out_path: AnyPathType, **kwargs
+    ) -> None:
+        """
+        Write a file in a temporary file (unique across threads and processes) renamed at the end,
+        so that a partially written file is never considered as existing.
+
+        Args:
+            xda (xr.DataArray): Array to write
+            out_path (AnyPathType): Output path
+            **kwargs: Other arguments used to load bands
+        """
+        out_path = AnyPath(out_path)
+        if path.is_cloud_path(out_path):
+            utils.write(xda, out_path)
+        else:
+            tmp_path = out_path.with_name(
+                f".{out_path.stem}_{uuid.uuid4().hex}_tmp{out_path.suffix}"
+            )
+            try:
+                utils.write(xda, tmp_path)
+                os.replace(tmp_path, out_path)
+            finally:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+
+        self._put_in_cache(out_path, **kwargs)
+
+    def flush(self) -> None:
+        """
+        Wait for all the intermediary files written in background (see :code:`EOREADER_WRITE_BEHIND`) to be on disk.
+
+        Writing failures are logged but not raised, as these files are only a cache.
+
+        .. code-block:: python
+
+            >>> import os
+            >>> from eoreader.reader import Reader
+            >>> os.environ["EOREADER_WRITE_BEHIND"] = "1"
+            >>> path = r"S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE.zip"
+            >>> prod = Reader().open(path)
+            >>> ndvi = prod.load("NDVI")  # Returns before the NDVI is written on disk
+            >>> prod.flush()  # The NDVI is now written on disk
+        """
+        with contextlib.suppress(AttributeError):
+            with self._pending_writes_lock:
+                pending_writes = self._pending_writes
+                self._pending_writes = {}
+
+            for out_path, future in pending_writes.items():
+                try:
+                    future.result()
+                except Exception as exc:
+                    LOGGER.warning(
+                        f"Cannot write {path.get_filename(out_path)} on disk: {exc}"
+                    )
+
     def get_band_file_name(
         self,
         band: BandNames,
@@ -1018,6 +1355,91 @@ class Product:
         """
         raise NotImplementedError
 
+    @contextlib.contextmanager
+    def _stacked_reading(self, band_paths: dict) -> Iterator[None]:
+        """
+        Context in which the bands stored in the same stack are read in one call.
+
+        The first of these bands read with :py:meth:`_read_stack_band` reads all the others at once,
+        they are kept until they are read in their turn.
+
+        Args:
+            band_paths (dict): Band dict: {band_enum: band_path}
+        """
+        stacks = {}
+        for band, band_path in band_paths.items():
+            stacks.setdefault(str(band_path), []).append(band)
+
+        previous_reads = self._stacked_reads
+        self._stacked_reads = {
+            "stacks": {
+                stack_path: bands
+                for stack_path, bands in stacks.items()
+                if len(bands) > 1
+            },
+            "arrays": {},
+            "lock": threading.Lock(),
+        }
+        try:
+            yield
+        finally:
+            self._stacked_reads = previous_reads
+
+    def _read_stack_band(
+        self,
+        band_path: AnyPathType,
+        band: BandNames,
+        pixel_size: Union[tuple, list, float] = None,
+        size: Union[list, tuple] = None,
+        **kwargs,
+    ) -> xr.DataArray:
+        """
+        Read a band stored in a stack.
+
+        Inside :py:meth:`_stacked_reading`, all the wanted bands stored in this stack are read at once.
+
+        Args:
+            band_path (AnyPathType): Stack path
+            band (BandNames): Band to read
+            pixel_size (Union[tuple, list, float]): Size of the pixels of the wanted band, in dataset unit (X, Y)
+            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
+            kwargs: Other arguments used to load bands
+        Returns:
+            xr.DataArray: Band xarray
+        """
+        stacked_reads = self._stacked_reads
+        stack_bands = (
+            stacked_reads["stacks"].get(str(band_path), [])
+            if stacked_reads is not None
+            else []
+        )
+        if band not in stack_bands:
+            return utils.read(
+                band_path,
+                pixel_size=pixel_size,
+                size=size,
+                indexes=[self.bands[band].id],
+                **kwargs,
+            )
+
+        with stacked_reads["lock"]:
+            arrays = stacked_reads["arrays"]
+            if (str(band_path), band) not in arrays:
+                LOGGER.debug(
+                    f"Read {', '.join(b.name for b in stack_bands)} at once from {AnyPath(band_path).name}"
+                )
+                stack_arrs = utils.read_stack(
+                    band_path,
+                    pixel_size=pixel_size,
+                    size=size,
+                    indexes=[self.bands[b].id for b in stack_bands],
+                    **kwargs,
+                )
+                for stack_band, arr in zip(stack_bands, stack_arrs):
+                    arrays[(str(band_path), stack_band)] = arr
+
+            return arrays.pop((str(band_path), band))
+
     def load(
         self,
         bands: Union[list, BandNames, str],
@@ -1077,6 +1499,7 @@ class Product:
 
         # Load bands (only once! and convert the bands to be loaded to correct format)
         unique_bands = misc.unique(bands)
+        self.collocation_stats = {"snapped": 0, "reprojected": 0}
         band_xds = self._load(unique_bands, pixel_size, size, **kwargs)
 
         # Rename all bands and add attributes
@@ -1089,6 +1512,100 @@ class Product:
 
         return band_xds
 
+    def iter_tiles(
+        self,
+        bands: Union[list, BandNames, str],
+        tile_size: int = None,
+        overlap: int = 0,
+        pixel_size: float = None,
+        **kwargs,
+    ) -> Iterator[xr.Dataset]:
+        """
+        Load the bands tile by tile, to process very large products with a fixed memory ceiling.
+
+        The pixel grid of the product (see :code:`default_transform`) is split into square tiles (in pixels, at the wanted pixel size)
+        and every tile is loaded as with :code:`load` (cleaned, converted to reflectance, with masks and indices...),
+        reading only the needed window from each band file.
+        The tiles are aligned on the same grid and can overlap each other by :code:`overlap` pixels (i.e. for convolutions).
+
+        The clean bands and spectral indices of the tiles are not written on disk (see :code:`write_intermediary`).
+
+        .. code-block:: python
+
+            >>> from eoreader.reader import Reader
+            >>> from eoreader.bands import *
+            >>> path = r"S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE.zip"
+            >>> prod = Reader().open(path)
+            >>> for tile in prod.iter_tiles([RED, NIR, NDVI], tile_size=2048, overlap=16, pixel_size=10):
+            >>>     predict(tile)
+
+        Args:
+            bands (Union[list, BandNames, str]): Band list
+            tile_size (int): Tile size in pixels (without the overlap). Default is :code:`EOREADER_TILE_SIZE` (or 1024)
+            overlap (int): Overlap between the tiles, in pixels
+            pixel_size (float): Pixel size of the band, in meters
+            kwargs: Other arguments used to load bands
+
+        Yields:
+            xr.Dataset: Dataset of the tile, with a variable per band
+        """
+        if "window" in kwargs:
+            raise ValueError(
+                "iter_tiles already loads the bands by window, 'window' cannot be given."
+            )
+
+        if tile_size is None:
+            tile_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+
+        if pixel_size is None:
+            pixel_size = self.pixel_size
+
+        kwargs.setdefault(WRITE_INTERMEDIARY, False)
+
+        # Align the tiles on the pixel grid of the bands
+        def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
+        if def_crs == self.crs():
+            tile_tr = def_tr * Affine.scale(
+                pixel_size / abs(def_tr.a), pixel_size / abs(def_tr.e)
+            )
+            width = int(np.ceil(def_w * abs(def_tr.a) / pixel_size))
+            height = int(np.ceil(def_h * abs(def_tr.e) / pixel_size))
+        else:
+            tile_tr, width, height = warp.calculate_default_transform(
+                def_crs,
+                self.crs(),
+                def_w,
+                def_h,
+                *transform.array_bounds(def_h, def_w, def_tr),
+                resolution=pixel_size,
+            )
+
+        for row_off in range(0, height, tile_size):
+            for col_off in range(0, width, tile_size):
+                col_start = max(col_off - overlap, 0)
+                col_stop = min(col_off + tile_size + overlap, width)
+                row_start = max(row_off - overlap, 0)
+                row_stop = min(row_off + tile_size + overlap, height)
+
+                tile = gpd.GeoDataFrame(
+                    geometry=[
+                        box(
+                            *transform.array_bounds(
+                                row_stop - row_start,
+                                col_stop - col_start,
+                                tile_tr * Affine.translation(col_start, row_start),
+                            )
+                        )
+                    ],
+                    crs=self.crs(),
+                )
+                # Used as suffix in the band filenames
+                tile.attrs["name"] = (
+                    f"tile{tile_size}_{overlap}_{row_off // tile_size}_{col_off // tile_size}"
+                )
+
+                yield self.load(bands, pixel_size=pixel_size, window=tile, **kwargs)
+
     def _load(
         self,
         bands: list,
@@ -1184,6 +1701,7 @@ class Product:
         # Load band arrays (only keep unique bands: open them only one time!)
         unique_bands = misc.unique(bands_to_load)
         bands_dict = {}
+        collocated = []
         if unique_bands:
             LOGGER.debug(f"Loading bands {to_str(unique_bands)}")
             loaded_bands = self._load_bands(
@@ -1194,6 +1712,7 @@ class Product:
             if index_list:
                 # Collocate bands before indices to ensure the same size to perform operations between bands
                 loaded_bands = self._collocate_bands(loaded_bands)
+                collocated = list(loaded_bands) + index_list
 
                 LOGGER.debug(f"Loading indices {to_str(index_list)}")
                 bands_dict.update(
@@ -1242,7 +1761,8 @@ class Product:
             )
 
         # Manage the case of arrays with different sizes -> collocate arrays if needed
-        bands_dict = self._collocate_bands(bands_dict)
+        # (the bands and indices already collocated are on the grid of the first array: don't collocate them twice)
+        bands_dict = self._collocate_bands(bands_dict, collocated=collocated)
 
         # Create a dataset (only after collocation)
         coords = None
@@ -1403,24 +1923,32 @@ class Product:
             dict: Dictionary {band_name, band_xarray}
         """
         band_dict = {}
+        idx_paths = {}
         for idx in index_list:
             idx_path, idx_exists = self._is_existing(
                 self.get_band_file_name(idx, pixel_size, size, **kwargs)
             )
+            if not idx_exists:
+                idx_exists = self._restore_from_cache(idx_path, **kwargs)
+
             if idx_exists:
                 band_dict[idx] = utils.read(idx_path)
             else:
-                idx_arr = compute_index(index=idx, bands=loaded_bands, **kwargs).rename(
-                    idx
-                )
+                idx_paths[idx] = idx_path
+
+        # Compute all the missing indices at once, sharing their common sub-expressions
+        if idx_paths:
+            idx_arrs = compute_indices(list(idx_paths), bands=loaded_bands, **kwargs)
+            for idx, idx_path in idx_paths.items():
+                idx_arr = idx_arrs[idx].rename(idx)
                 idx_arr.attrs["long_name"] = idx
 
                 # Write on disk
                 idx_arr = utils.write_path_in_attrs(idx_arr, idx_path)
-                utils.write(idx_arr, idx_path)
+                idx_arr = self._write_intermediary(idx_arr, idx_path, **kwargs)
                 band_dict[idx] = idx_arr
 
-        return band_dict
+        return {idx: band_dict[idx] for idx in index_list}
 
     def _load_dem(
         self,
@@ -1443,33 +1971,47 @@ class Product:
         dem_bands = {}
         if band_list:
             dem_path = os.environ.get(DEM_PATH)  # We already checked if it exists
+
+            # Compute the terrain derivatives computed from the same DEM together (reading it only once)
+            terrain_dems = {}
             for band in band_list:
-                assert is_dem(band)
-                if band == DEM:
-                    dem_path = self._warp_dem(
-                        kwargs.get(DEM_KW, dem_path),
-                        pixel_size=pixel_size,
-                        size=size,
-                        **kwargs,
+                if band == SLOPE:
+                    terrain_dems.setdefault(kwargs.get(SLOPE_KW, dem_path), []).append(
+                        band
                     )
-                elif band == SLOPE:
-                    dem_path = self._compute_slope(
-                        kwargs.get(SLOPE_KW, dem_path),
+                elif band == HILLSHADE:
+                    terrain_dems.setdefault(
+                        kwargs.get(HILLSHADE_KW, dem_path), []
+                    ).append(band)
+
+            terrain_paths = {}
+            for terrain_dem_path, terrain_bands in terrain_dems.items():
+                terrain_paths.update(
+                    self._compute_terrain(
+                        terrain_dem_path,
+                        terrain_bands,
                         pixel_size=pixel_size,
                         size=size,
                     )
-                elif band == HILLSHADE:
-                    dem_path = self._compute_hillshade(
-                        kwargs.get(HILLSHADE_KW, dem_path),
+                )
+
+            for band in band_list:
+                assert is_dem(band)
+                if band == DEM:
+                    band_path = self._warp_dem(
+                        kwargs.get(DEM_KW, dem_path),
                         pixel_size=pixel_size,
                         size=size,
+                        **kwargs,
                     )
+                elif band in terrain_paths:
+                    band_path = terrain_paths[band]
                 else:
                     raise InvalidTypeError(f"Unknown DEM band: {band}")
 
                 dem_name = to_str(band)[0]
                 dem_arr = utils.read(
-                    dem_path, pixel_size=pixel_size, size=size, as_type=np.float32
+                    band_path, pixel_size=pixel_size, size=size, as_type=np.float32
                 ).rename(dem_name)
                 dem_arr.attrs["long_name"] = dem_name
                 dem_bands[band] = dem_arr
@@ -1720,6 +2262,8 @@ class Product:
     @property
     def output(self) -> AnyPathType:
         """Output directory of the product, to write orthorectified data for example."""
+        if self._output is None:
+            self._create_output_folders(f"tmp_{self.condensed_name}")
         return self._output
 
     @output.setter
@@ -1730,6 +2274,10 @@ class Product:
         if not path.is_cloud_path(self._output):
             self._output = self._output.resolve()
 
+        # Nothing has been written yet: the folders will be created when needed
+        if not self._has_output_folders:
+            return
+
         # Move temporary process folder
         self._move_tmp_process(f"tmp_{self.condensed_name}")
 
@@ -1740,6 +2288,9 @@ class Product:
 
     def _move_tmp_process(self, new_tmp_name: str):
         """Move temporary process folder"""
+        # Don't move files being written
+        self.flush()
+
         # Create temporary process folder
         old_tmp_process = self._tmp_process
         self._tmp_process = self._output.joinpath(new_tmp_name)
@@ -1754,6 +2305,112 @@ class Product:
         if old_tmp_process is not None:
             files.remove(old_tmp_process)
 
+    def to_descriptor(self, geometry: bool = True) -> dict:
+        """
+        Get a compact and picklable snapshot of this product (paths, band mapping, metadata attributes, CRS, extent, footprint...),
+        allowing to reconstruct it with :code:`Reader().from_descriptor` without opening nor parsing the source files again.
+
+        This is useful to send products to other processes or to the workers of a cluster.
+        The descriptor holds Python objects: it is meant to be pickled (i.e. by :code:`multiprocessing` or :code:`dask`),
+        not to be stored as a portable file.
+
+        The temporary files (and their folder) are not shared: a product whose output is a temporary directory will get a new one when reconstructed.
+
+        .. code-block:: python
+
+            >>> from eoreader.reader import Reader
+            >>> path = r"S2B_MSIL1C_20210517T103619_N7990_R008_T30QVE_20210929T075738.SAFE.zip"
+            >>> prod = Reader().open(path)
+            >>> desc = prod.to_descriptor()
+            >>> Reader().from_descriptor(desc)
+            eoreader.S2Product 'S2B_MSIL1C_20210517T103619_N7990_R008_T30QVE_20210929T075738'
+            Attributes:
+                condensed_name: 20210517T103619_S2_T30QVE_L1C_075738
+                (...)
+
+        Args:
+            geometry (bool): Compute and store the CRS, extent and footprint of the product (they won't be recomputed by the reconstructed product)
+
+        Returns:
+            dict: Product descriptor
+        """
+        # Compute every lazy attributes
+        if not self._is_initialized:
+            self._finish_init()
+
+        # Wait for the pending writes (the reconstructed product may need them)
+        self.flush()
+
+        state = {
+            key: val
+            for key, val in self.__dict__.items()
+            if key not in _TRANSIENT_ATTRIBUTES + _DESCRIPTOR_GEOMETRIES
+            and not key.startswith("__wire|")
+        }
+
+        # Temporary outputs cannot be shared
+        if self._tmp_output is not None:
+            state["_output"] = None
+
+        geometries = {}
+        if geometry:
+            geometries = {
+                method: getattr(self, method)() for method in _DESCRIPTOR_GEOMETRIES
+            }
+
+        descriptor = {
+            "version": __version__,
+            "class": f"{self.__class__.__module__}.{self.__class__.__name__}",
+            "name": self.name,
+            "path": str(self.path),
+            "state": state,
+            "geometries": geometries,
+        }
+
+        return descriptor
+
+    @classmethod
+    def _from_descriptor(
+        cls,
+        descriptor: dict,
+        output_path: AnyPathStrType = None,
+        remove_tmp: bool = False,
+    ) -> Product:
+        """
+        Reconstruct a product from its descriptor (see :code:`to_descriptor`), without opening its source files.
+
+        Args:
+            descriptor (dict): Product descriptor
+            output_path (AnyPathStrType): Output path. If not given, the output of the original product is used (or a temporary directory if it was one)
+            remove_tmp (bool): Remove temp files (such as clean or orthorectified bands...) when the product is deleted
+
+        Returns:
+            Product: EOReader product
+        """
+        prod = cls.__new__(cls)
+        prod.__dict__.update(descriptor["state"])
+
+        # Reset the transient attributes
+        prod._tmp_output = None
+        prod._has_output_folders = False
+        prod._remove_tmp_process = remove_tmp
+        prod._pending_writes = {}
+        prod._pending_writes_lock = threading.Lock()
+        prod._write_executor = None
+        prod._stacked_reads = None
+        prod._stac = None
+
+        # The temporary process folder will be created when needed
+        prod._is_lazy = True
+        if output_path:
+            prod._output = AnyPath(output_path)
+
+        # Don't compute the stored geometries again
+        for method, value in descriptor["geometries"].items():
+            setattr(prod, method, _DescriptorValue(prod, method, value))
+
+        return prod
+
     @property
     def stac(self) -> StacItem:
         if not self._stac:
@@ -1793,6 +2450,7 @@ class Product:
         """
         dem_name = f"{self.condensed_name}_DEM_{path.get_filename(dem_path)}.vrt"
 
+        # The warped DEM is a VRT pointing to files outside the disk cache: don't store it there
         warped_dem_path, warped_dem_exists = self._get_out_path(dem_name)
         if warped_dem_exists:
             LOGGER.debug(
@@ -1816,7 +2474,8 @@ class Product:
             # Reproject DEM into products CRS
             LOGGER.debug("Using DEM: %s", dem_path)
             def_tr, def_w, def_h, def_crs = self.default_transform(**kwargs)
-            with rasterio.open(str(dem_path)) as dem_ds:
+            dem_subset_path = self._get_dem_subset_path(dem_path)
+            with rasterio.open(str(dem_subset_path)) as dem_ds:
                 # Get adjusted transform and shape (with new pixel_size)
                 if size is not None and pixel_size is None:
                     try:
@@ -1868,7 +2527,6 @@ class Product:
 
         return warped_dem_path
 
-    @abstractmethod
     def _compute_hillshade(
         self,
         dem_path: str = "",
@@ -1889,7 +2547,9 @@ class Product:
             AnyPathType: Hillshade mask path
 
         """
-        raise NotImplementedError
+        return self._compute_terrain(
+            dem_path, [HILLSHADE], pixel_size, size, resampling
+        )[HILLSHADE]
 
     def _compute_slope(
         self,
@@ -1911,53 +2571,319 @@ class Product:
             AnyPathType: Slope mask path
 
         """
+        return self._compute_terrain(dem_path, [SLOPE], pixel_size, size, resampling)[
+            SLOPE
+        ]
+
+    def _get_hillshade_sun_angles(self) -> (float, float):
+        """
+        Get the sun angles (azimuth, zenith) used to compute the hillshade.
+
+        Returns:
+            (float, float): Sun azimuth and zenith angles, in degrees
+        """
+        raise InvalidProductError(
+            f"Impossible to compute hillshade mask for {self.sensor_type.value} data."
+        )
+
+    def _compute_terrain(
+        self,
+        dem_path: str,
+        bands: list,
+        pixel_size: Union[float, tuple] = None,
+        size: Union[list, tuple] = None,
+        resampling: Resampling = Resampling.bilinear,
+    ) -> dict:
+        """
+        Compute the wanted terrain derivatives (:code:`SLOPE` and/or :code:`HILLSHADE`) in one pass.
+
+        The warped DEM is read only once, in overlapping blocks. The gradient of each block gives its slope,
+        aspect and hillshade, written block by block in their own files.
+
+        Args:
+            dem_path (str): DEM path, using EUDEM/MERIT DEM if none
+            bands (list): Wanted terrain derivatives (:code:`SLOPE`, :code:`HILLSHADE`)
+            pixel_size (Union[float, tuple]): Pixel size in meters. If not specified, use the product pixel size.
+            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
+            resampling (Resampling): Resampling method
+
+        Returns:
+            dict: Dictionary containing the path of each terrain derivative
+        """
+        terrain_paths = {}
+        to_compute = {}
+        for band in bands:
+            terrain_path, terrain_exists = self._get_out_path(
+                f"{self.condensed_name}_{band.name}_{path.get_filename(dem_path)}.tif"
+            )
+            terrain_paths[band] = terrain_path
+            if terrain_exists:
+                LOGGER.debug(
+                    f"Already existing {band.name.lower()} DEM for {self.condensed_name}. Skipping process."
+                )
+            else:
+                to_compute[band] = terrain_path
+
+        if not to_compute:
+            return terrain_paths
+
+        # Check the sun angles before warping the DEM
+        sun_angles = (
+            self._get_hillshade_sun_angles() if HILLSHADE in to_compute else None
+        )
+
         # Warp DEM
         warped_dem_path = self._warp_dem(dem_path, pixel_size, size, resampling)
 
-        # Get slope path
-        slope_name = f"{self.condensed_name}_SLOPE_{path.get_filename(dem_path)}.tif"
+        LOGGER.debug(
+            f"Computing {', '.join(band.name.lower() for band in to_compute)} for {self.condensed_name}"
+        )
 
-        slope_path, slope_exists = self._get_out_path(slope_name)
-        if slope_exists:
-            LOGGER.debug(
-                "Already existing slope DEM for %s. Skipping process.",
-                self.condensed_name,
-            )
-        else:
-            LOGGER.debug("Computing slope for %s", self.condensed_name)
+        try:
+            tile_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+        except ValueError:
+            tile_size = int(DEFAULT_TILE_SIZE)
+
+        driver = utils.get_driver({})
+        with rasterio.open(
+            str(warped_dem_path)
+        ) as dem_ds, tempfile.TemporaryDirectory() as tmp_dir:
+            # Write tiled GeoTiffs block by block (converted to COGs afterwards if needed)
+            out_paths = {
+                band: (
+                    os.path.join(tmp_dir, f"{band.name}.tif")
+                    if driver == "COG"
+                    else str(terrain_path)
+                )
+                for band, terrain_path in to_compute.items()
+            }
+            profile = {
+                "driver": "GTiff",
+                "dtype": "float32",
+                "count": 1,
+                "nodata": self.nodata,
+                "width": dem_ds.width,
+                "height": dem_ds.height,
+                "crs": dem_ds.crs,
+                "transform": dem_ds.transform,
+                "tiled": True,
+                "blockxsize": 512,
+                "blockysize": 512,
+                "compress": "lzw",
+                "BIGTIFF": "IF_NEEDED",
+            }
+            with contextlib.ExitStack() as stack:
+                out_ds = {
+                    band: stack.enter_context(
+                        rasterio.open(out_path, "w", **profile)
+                    )
+                    for band, out_path in out_paths.items()
+                }
+                for band, ds in out_ds.items():
+                    ds.descriptions = (band.name.lower(),)
+
+                for row_off in range(0, dem_ds.height, tile_size):
+                    for col_off in range(0, dem_ds.width, tile_size):
+                        window = rasterio.windows.Window(
+                            col_off,
+                            row_off,
+                            min(tile_size, dem_ds.width - col_off),
+                            min(tile_size, dem_ds.height - row_off),
+                        )
+                        terrain_arrs = self._compute_terrain_block(
+                            dem_ds, window, list(to_compute), sun_angles
+                        )
+                        for band, terrain_arr in terrain_arrs.items():
+                            out_ds[band].write(
+                                np.where(
+                                    np.isnan(terrain_arr), self.nodata, terrain_arr
+                                ).astype(np.float32),
+                                1,
+                                window=window,
+                            )
 
-            # Compute slope
-            slope = rasters.slope(warped_dem_path)
-            slope = utils.write_path_in_attrs(slope, warped_dem_path)
-            utils.write(slope, slope_path)
+            if driver == "COG":
+                for band, terrain_path in to_compute.items():
+                    rio_shutil.copy(
+                        out_paths[band],
+                        str(terrain_path),
+                        driver="COG",
+                        compress="lzw",
+                        BIGTIFF="IF_NEEDED",
+                        NUM_THREADS="ALL_CPUS",
+                    )
 
-        return slope_path
+        return terrain_paths
 
     @staticmethod
-    def _collocate_bands(bands: dict, reference: xr.DataArray = None) -> dict:
+    def _compute_terrain_block(
+        dem_ds: rasterio.DatasetReader,
+        window: rasterio.windows.Window,
+        bands: list,
+        sun_angles: tuple = None,
+    ) -> dict:
         """
-        Collocate all bands from a dict if needed (if a raster shape is different)
+        Compute the terrain derivatives of a block of the DEM, with the same algorithms as :code:`sertit.rasters`:
+        Horn's kernel for the slope (as :code:`xrspatial`) and GDAL's hillshade.
+
+        The block is read with a one-pixel overlap (NaN outside the DEM) to compute its derivatives,
+        so the pixels on the DEM borders are set to nodata, as when computed on the whole DEM.
+
+        Args:
+            dem_ds (rasterio.DatasetReader): Opened warped DEM
+            window (rasterio.windows.Window): Block to compute
+            bands (list): Wanted terrain derivatives (:code:`SLOPE`, :code:`HILLSHADE`)
+            sun_angles (tuple): Sun azimuth and zenith angles (in degrees), needed for the hillshade
+
+        Returns:
+            dict: Dictionary {band_name, terrain_array}
+        """
+        row_min = max(window.row_off - 1, 0)
+        row_max = min(window.row_off + window.height + 1, dem_ds.height)
+        col_min = max(window.col_off - 1, 0)
+        col_max = min(window.col_off + window.width + 1, dem_ds.width)
+        dem_arr = (
+            dem_ds.read(
+                1,
+                window=rasterio.windows.Window(
+                    col_min, row_min, col_max - col_min, row_max - row_min
+                ),
+                masked=True,
+                out_dtype=np.float32,
+            )
+            .astype(np.float32)
+            .filled(np.nan)
+        )
+        dem_arr = np.pad(
+            dem_arr,
+            (
+                (
+                    row_min - window.row_off + 1,
+                    window.row_off + window.height + 1 - row_max,
+                ),
+                (
+                    col_min - window.col_off + 1,
+                    window.col_off + window.width + 1 - col_max,
+                ),
+            ),
+            constant_values=np.nan,
+        )
+
+        x_res, y_res = np.abs(dem_ds.res)
+
+        terrain_arrs = {}
+        if SLOPE in bands:
+            # Horn's kernel: weighted differences over the 3x3 neighbourhood of each pixel
+            def neighbours(row: int, col: int) -> np.ndarray:
+                return dem_arr[
+                    row : dem_arr.shape[0] - 2 + row, col : dem_arr.shape[1] - 2 + col
+                ]
+
+            dz_dx = (
+                neighbours(0, 2)
+                + 2 * neighbours(1, 2)
+                + neighbours(2, 2)
+                - neighbours(0, 0)
+                - 2 * neighbours(1, 0)
+                - neighbours(2, 0)
+            ) / (8 * x_res)
+            dz_dy = (
+                neighbours(0, 0)
+                + 2 * neighbours(0, 1)
+                + neighbours(0, 2)
+                - neighbours(2, 0)
+                - 2 * neighbours(2, 1)
+                - neighbours(2, 2)
+            ) / (8 * y_res)
+            terrain_arrs[SLOPE] = np.rad2deg(np.arctan(np.sqrt(dz_dx**2 + dz_dy**2)))
+
+        if HILLSHADE in bands:
+            # Centered differences along the rows and the columns, without the overlap
+            d_row, d_col = np.gradient(dem_arr, y_res, x_res)
+            d_row = d_row[1:-1, 1:-1]
+            d_col = d_col[1:-1, 1:-1]
+            x2_y2 = d_row**2 + d_col**2
+
+            az_rad = np.deg2rad(sun_angles[0])
+            alt_rad = np.deg2rad(90 - sun_angles[1])
+            aspect = np.arctan2(d_row, d_col)
+            hillshade = (
+                np.sin(alt_rad)
+                + np.cos(alt_rad) * np.sqrt(x2_y2) * np.sin(aspect - az_rad)
+            ) / np.sqrt(1 + x2_y2)
+            terrain_arrs[HILLSHADE] = np.where(
+                hillshade <= 0, 1.0, 254.0 * hillshade + 1
+            )
+
+        return terrain_arrs
+
+    def _collocate_bands(
+        self, bands: dict, reference: xr.DataArray = None, collocated: list = None
+    ) -> dict:
+        """
+        Collocate all bands from a dict if needed (if a raster grid is different)
+
+        The bands already on the reference grid are only snapped onto its coordinates, the other ones are reprojected.
+        See :code:`collocation_stats` for the number of snapped and reprojected bands.
 
         Args:
             bands (dict): Dict of bands to collocate if needed
             reference (xr.DataArray): Reference array
+            collocated (list): Bands already collocated onto the reference (neither collocated nor counted again)
 
         Returns:
             dict: Collocated bands
         """
+        if collocated is None:
+            collocated = []
+
         for band_id, band_arr in bands.items():
             if reference is None:
                 # If reference is not passed, use the first array
                 # Don't collocate if same array
                 reference = band_arr
+            elif band_id in collocated:
+                continue
+            elif self._is_aligned(reference, band_arr):
+                # A small difference in the coordinates will lead to empty arrays
+                # So the bands MUST BE exactly aligned: snap them without resampling
+                bands[band_id] = band_arr.assign_coords(
+                    {"x": reference.x, "y": reference.y}
+                )
+                self.collocation_stats["snapped"] += 1
             else:
-                # To be sure, always collocate arrays, even if the size is the same
-                # Indeed, a small difference in the coordinates will lead to empty arrays
-                # So the bands MUST BE exactly aligned
                 bands[band_id] = rasters.collocate(reference, band_arr)
+                self.collocation_stats["reprojected"] += 1
 
         return bands
 
+    @staticmethod
+    def _is_aligned(
+        reference: xr.DataArray, other: xr.DataArray, tolerance: float = 1e-3
+    ) -> bool:
+        """
+        Is an array on the same grid as the reference one?
+        (same CRS, same shape and same transform, within a fraction of pixel)
+
+        Args:
+            reference (xr.DataArray): Reference array
+            other (xr.DataArray): Other array
+            tolerance (float): Tolerance on the transform, as a fraction of the reference pixel size
+
+        Returns:
+            bool: True if the arrays are aligned
+        """
+        if (
+            other.rio.shape != reference.rio.shape
+            or other.rio.crs != reference.rio.crs
+        ):
+            return False
+
+        ref_tr = reference.rio.transform()
+        other_tr = other.rio.transform()
+        atol = tolerance * max(abs(ref_tr.a), abs(ref_tr.e))
+        return np.allclose(ref_tr[:6], other_tr[:6], rtol=0, atol=atol)
+
     # pylint: disable=R0913
     # Too many arguments (6/5)
     def stack(
@@ -2016,26 +2942,22 @@ class Product:
         # Write on disk
         if stack_path:
             LOGGER.debug("Saving stack")
-            # Convert to uint16 only for the stack written on disk
-            # (sadly we have to restack the dataset a second time...)
-            stack_to_save = None
+            # Convert to uint16 only for the stack written on disk,
+            # the bands are scaled and written one by one, without restacking them
+            scales = {}
+            clip = False
             if save_as_int:
-                stack_to_save, dtype = utils.convert_to_uint16(band_xds)
-                if dtype == np.uint16:
-                    stack_to_save, _ = utils.stack(band_xds, dtype=dtype, **kwargs)
-                    stack_to_save = self._update_attrs(
-                        stack_to_save, band_xds.keys(), **kwargs
-                    )
+                dtype, scales, clip = utils.get_uint16_conversion(band_xds)
 
-            if stack_to_save is None:
-                stack_to_save = stack
-
-            stack_to_save = utils.write_path_in_attrs(stack_to_save, stack_path)
-            utils.write(
-                stack_to_save,
+            stack = utils.write_path_in_attrs(stack, stack_path)
+            utils.write_stack(
+                band_xds,
                 stack_path,
                 dtype=dtype,
                 nodata=kwargs.pop("nodata", rasters.get_nodata_value_from_dtype(dtype)),
+                scales=scales,
+                clip=clip,
+                attrs=stack.attrs,
                 driver=driver,
                 **kwargs,
             )
@@ -2215,7 +3137,8 @@ class Product:
         """
         Clean the temporary directory of the current product
         """
-        if self._tmp_process.exists():
+        self.flush()
+        if self._has_output_folders and self._tmp_process.exists():
             for tmp_file in self._tmp_process.glob("*"):
                 files.remove(tmp_file)
 
@@ -2567,6 +3490,407 @@ class Product:
 
         return dem_path
 
+    def _get_dem_subset_path(self, dem_path: AnyPathStrType) -> AnyPathStrType:
+        """
+        Get the DEM extracted over the bounding box of this product (with a margin) from the DEM tile cache,
+        shared by the DEM, SLOPE and HILLSHADE bands and the RPC orthorectification.
+
+        Returns the given DEM path if the DEM tile cache is disabled (see :code:`EOREADER_DEM_TILE_CACHE`).
+
+        Args:
+            dem_path (AnyPathStrType): DEM path
+
+        Returns:
+            AnyPathStrType: DEM subset path
+        """
+        dem_tile_cache = get_dem_tile_cache(dem_path)
+        if dem_tile_cache is None:
+            return dem_path
+
+        dem_subset_path, dem_subset_exists = self._get_out_path(
+            f"{self.condensed_name}_DEM_{path.get_filename(dem_path)}_subset.tif"
+        )
+        if not dem_subset_exists:
+            dem_subset_exists = self._restore_from_cache(dem_subset_path, str(dem_path))
+
+        if not dem_subset_exists:
+            LOGGER.debug(
+                f"Extracting the DEM over {self.condensed_name} from the DEM tile cache"
+            )
+            extent = self.extent()
+            dem_tile_cache.extract(
+                tuple(extent.total_bounds), extent.crs, dem_subset_path
+            )
+            self._put_in_cache(dem_subset_path, str(dem_path))
+
+        return dem_subset_path
+
+    def _get_rpc_dem_path(self, dem_path: str) -> str:
+        """
+        Get a DEM path usable as :code:`RPC_DEM`.
+
+        RPC_DEM doesn't work with cloud-based DEM: read it to the extent of the product and save it on disk
+
+        Args:
+            dem_path (str): DEM path
+
+        Returns:
+            str: DEM path usable by GDAL's RPC transformer
+        """
+        # Use the DEM extracted from the DEM tile cache if enabled
+        dem_subset_path = self._get_dem_subset_path(dem_path)
+        if str(dem_subset_path) != str(dem_path):
+            dem_path = str(dem_subset_path)
+        elif path.is_cloud_path(dem_path):
+            cached_dem_path, cached_dem_exists = self._get_out_path(
+                AnyPath(dem_path).name
+            )
+            if not cached_dem_exists:
+                LOGGER.warning(
+                    "gdalwarp cannot process DEM stored on cloud with 'RPC_DEM' argument, "
+                    "hence cloud-stored DEM cannot be used with non orthorectified data. "
+                    f"(DEM: {dem_path}). "
+                    "The DEM will be cached before the operation."
+                )
+
+                utils.write(
+                    utils.read(dem_path, window=self.extent()),
+                    cached_dem_path,
+                    dtype=np.float32,
+                )
+
+                LOGGER.debug("DEM cached.")
+            dem_path = str(cached_dem_path)
+
+        return dem_path
+
+    def _get_ortho_grid(
+        self,
+        src_path: AnyPathStrType,
+        rpcs: rpc.RPC,
+        dem_path: str,
+        pixel_size: float = None,
+    ) -> (Affine, int, int):
+        """
+        Get the grid of the orthorectified raster (without orthorectifying it).
+
+        Args:
+            src_path (AnyPathStrType): Path of the raster to orthorectify
+            rpcs (rpc.RPC): RPCs of the raster
+            dem_path (str): DEM path (usable as :code:`RPC_DEM`)
+            pixel_size (float): Output pixel size. If not specified, use the product pixel size.
+
+        Returns:
+            Affine, int, int: transform, width, height
+        """
+        if pixel_size is None:
+            pixel_size = self.pixel_size
+
+        with rasterio.open(str(src_path)) as src:
+            return warp.calculate_default_transform(
+                src.crs if src.crs is not None else self._get_raw_crs(),
+                self.crs(),
+                src.width,
+                src.height,
+                rpcs=rpcs,
+                resolution=pixel_size,
+                RPC_DEM=dem_path,
+                RPC_DEM_MISSING_VALUE=0,
+            )
+
+    def _orthorectify(
+        self,
+        src_path: AnyPathStrType,
+        rpcs: rpc.RPC,
+        dem_path: str,
+        ortho_paths: dict,
+        pixel_size: float = None,
+        bounds: tuple = None,
+        **kwargs,
+    ) -> None:
+        """
+        Orthorectify a raster with its RPCs, tile by tile (in a thread pool), without loading it in memory.
+
+        For each output tile, the needed source window is found by back-projecting the tile borders through the RPCs,
+        at the minimum and maximum heights of the DEM under the tile (with a margin for the resampling kernel).
+        Only this window is read and warped with GDAL's RPC transformer, and the tile is written on disk.
+
+        Args:
+            src_path (AnyPathStrType): Path of the raster to orthorectify
+            rpcs (rpc.RPC): RPCs of the raster
+            dem_path (str): DEM path
+            ortho_paths (dict): Output paths and the (1-based) indexes of the source bands to write in each of them, i.e. :code:`{ortho_path: [1, 2, 3]}`
+            pixel_size (float): Output pixel size. If not specified, use the product pixel size.
+            bounds (tuple): Bounds (in the product CRS) to restrict the orthorectification to. The output grid stays aligned on the whole orthorectified grid.
+            kwargs: Other arguments (:code:`resampling`, :code:`tags`, :code:`long_name`, :code:`driver`...)
+        """
+        if pixel_size is None:
+            pixel_size = self.pixel_size
+
+        LOGGER.debug(f"Orthorectifying data with {dem_path} (tile by tile)")
+        dem_path = self._get_rpc_dem_path(dem_path)
+        rpc_options = {"RPC_DEM": dem_path, "RPC_DEM_MISSING_VALUE": 0}
+        resampling = kwargs.get("resampling", self.band_resampling)
+        dst_crs = self.crs()
+
+        try:
+            tile_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+        except ValueError:
+            tile_size = int(DEFAULT_TILE_SIZE)
+
+        with rasterio.open(str(src_path)) as src:
+            src_crs = src.crs if src.crs is not None else self._get_raw_crs()
+            src_height, src_width = src.height, src.width
+        dst_tr, dst_w, dst_h = self._get_ortho_grid(
+            src_path, rpcs, dem_path, pixel_size
+        )
+
+        # Restrict the output grid to the given bounds (keeping the alignment of the whole grid)
+        if bounds is not None:
+            win = rasterio.windows.from_bounds(*bounds, transform=dst_tr)
+            col_min = max(0, int(np.floor(win.col_off)))
+            row_min = max(0, int(np.floor(win.row_off)))
+            col_max = min(dst_w, int(np.ceil(win.col_off + win.width)))
+            row_max = min(dst_h, int(np.ceil(win.row_off + win.height)))
+            if col_min >= col_max or row_min >= row_max:
+                raise ValueError(
+                    f"The given window doesn't intersect {self.condensed_name}"
+                )
+            dst_tr = dst_tr * Affine.translation(col_min, row_min)
+            dst_w, dst_h = col_max - col_min, row_max - row_min
+
+        # Read only the needed bands
+        indexes = sorted({idx for idxs in ortho_paths.values() for idx in idxs})
+
+        # Output tiles
+        windows = [
+            rasterio.windows.Window(
+                col_off,
+                row_off,
+                min(tile_size, dst_w - col_off),
+                min(tile_size, dst_h - row_off),
+            )
+            for row_off in range(0, dst_h, tile_size)
+            for col_off in range(0, dst_w, tile_size)
+        ]
+
+        # Margin around the back-projected source window: resampling kernel and rounding of the back-projection
+        margin = _ORTHO_KERNEL_RADIUS.get(resampling, 2) + 1
+
+        # GDAL objects are not thread-safe: one dataset and transformer per thread, closed once all the tiles are written
+        local = threading.local()
+        thread_handles = []
+        thread_handles_lock = threading.Lock()
+
+        def thread_handle(handle):
+            with thread_handles_lock:
+                thread_handles.append(handle)
+            return handle
+
+        def tile_heights(bounds: tuple) -> (float, float):
+            # Minimum and maximum heights of the DEM under the tile (missing heights are set to 0, as RPC_DEM_MISSING_VALUE)
+            if not dem_path:
+                return 0.0, 0.0
+
+            if not hasattr(local, "dem"):
+                local.dem = thread_handle(rasterio.open(str(dem_path)))
+
+            dem_window = (
+                rasterio.windows.from_bounds(
+                    *warp.transform_bounds(dst_crs, local.dem.crs, *bounds),
+                    transform=local.dem.transform,
+                )
+                .round_offsets(op="floor")
+                .round_lengths(op="ceil")
+            )
+            try:
+                dem_window_in = dem_window.intersection(
+                    rasterio.windows.Window(0, 0, local.dem.width, local.dem.height)
+                )
+            except rasterio.errors.WindowError:
+                return 0.0, 0.0
+
+            heights = local.dem.read(1, window=dem_window_in, masked=True)
+            valid_heights = heights.compressed()
+            if valid_heights.size < heights.size or dem_window_in != dem_window:
+                # Missing heights are set to 0 by GDAL (RPC_DEM_MISSING_VALUE)
+                valid_heights = np.append(valid_heights, 0)
+            if valid_heights.size == 0:
+                return 0.0, 0.0
+            return float(valid_heights.min()), float(valid_heights.max())
+
+        def ortho_tile(window: rasterio.windows.Window) -> Union[np.ndarray, None]:
+            if not hasattr(local, "src"):
+                local.src = thread_handle(rasterio.open(str(src_path)))
+                # Without DEM: the heights are given explicitly when back-projecting
+                local.rpc_tr = thread_handle(transform.RPCTransformer(rpcs))
+
+            # GDAL's RPC warping is inaccurate on very small outputs: never warp less than 32 pixels in each direction
+            warp_height = max(int(window.height), 32)
+            warp_width = max(int(window.width), 32)
+
+            # Back-project the tile borders to find the source window, at the minimum and maximum heights of the tile.
+            # The relief displacement being monotonic with the height, the tile pixels are projected between them.
+            win_tr = rasterio.windows.transform(window, dst_tr)
+            steps = np.linspace(0, 1, 17)
+            cols = (
+                np.concatenate(
+                    [steps, steps, np.zeros_like(steps), np.ones_like(steps)]
+                )
+                * warp_width
+            )
+            rows = (
+                np.concatenate(
+                    [np.zeros_like(steps), np.ones_like(steps), steps, steps]
+                )
+                * warp_height
+            )
+            xs, ys = win_tr * (cols, rows)
+            min_height, max_height = tile_heights(
+                transform.array_bounds(warp_height, warp_width, win_tr)
+            )
+            lons, lats = warp.transform(dst_crs, WGS84, xs, ys)
+            lons = np.tile(lons, 2)
+            lats = np.tile(lats, 2)
+            zs = np.repeat(
+                [min_height - _ORTHO_HEIGHT_MARGIN, max_height + _ORTHO_HEIGHT_MARGIN],
+                len(xs),
+            )
+            src_rows, src_cols = local.rpc_tr.rowcol(lons, lats, zs=zs, op=float)
+            src_rows = np.asarray(src_rows, dtype=float)
+            src_cols = np.asarray(src_cols, dtype=float)
+            valid = np.isfinite(src_rows) & np.isfinite(src_cols)
+            if not valid.any():
+                LOGGER.warning(
+                    f"The tile {window} cannot be back-projected through the RPCs: it is left empty"
+                )
+                return None
+
+            row_min = max(0, int(np.floor(src_rows[valid].min())) - margin)
+            row_max = min(src_height, int(np.ceil(src_rows[valid].max())) + margin)
+            col_min = max(0, int(np.floor(src_cols[valid].min())) - margin)
+            col_max = min(src_width, int(np.ceil(src_cols[valid].max())) + margin)
+            if row_min >= row_max or col_min >= col_max:
+                return None
+
+            # Read the source window and shift the RPCs accordingly
+            src_window = rasterio.windows.Window(
+                col_min, row_min, col_max - col_min, row_max - row_min
+            )
+            src_arr = local.src.read(indexes, window=src_window)
+            win_rpcs = rpc.RPC(**rpcs.to_dict())
+            win_rpcs.line_off -= row_min
+            win_rpcs.samp_off -= col_min
+
+            dst_arr = np.full(
+                (len(indexes), warp_height, warp_width),
+                self._raw_nodata,
+                dtype=np.float32,
+            )
+            warp.reproject(
+                src_arr,
+                dst_arr,
+                rpcs=win_rpcs,
+                src_crs=src_crs,
+                src_nodata=self._raw_nodata,
+                dst_transform=win_tr,
+                dst_crs=dst_crs,
+                dst_nodata=self._raw_nodata,
+                resampling=resampling,
+                # GDAL computes its source window from the tile borders only (at the DEM heights): use the whole read window
+                SOURCE_EXTRA=max(src_window.width, src_window.height),
+                **rpc_options,
+            )
+            return dst_arr[:, : window.height, : window.width]
+
+        # Write tiled GeoTiffs incrementally (converted to COGs afterwards if needed)
+        driver = utils.get_driver(kwargs)
+        long_name = kwargs.get("long_name")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_paths = {
+                ortho_path: (
+                    os.path.join(tmp_dir, f"{idx}.tif")
+                    if driver == "COG"
+                    else str(ortho_path)
+                )
+                for idx, ortho_path in enumerate(ortho_paths)
+            }
+            profile = {
+                "driver": "GTiff",
+                "dtype": "float32",
+                "nodata": self._raw_nodata,
+                "width": dst_w,
+                "height": dst_h,
+                "crs": dst_crs,
+                "transform": dst_tr,
+                "tiled": True,
+                "blockxsize": 512,
+                "blockysize": 512,
+                "compress": "lzw",
+                "BIGTIFF": "IF_NEEDED",
+            }
+            with contextlib.ExitStack() as stack:
+                dst_ds = {
+                    ortho_path: stack.enter_context(
+                        rasterio.open(
+                            out_paths[ortho_path],
+                            "w",
+                            count=len(idxs),
+                            **profile,
+                        )
+                    )
+                    for ortho_path, idxs in ortho_paths.items()
+                }
+                for ortho_path, ds in dst_ds.items():
+                    if kwargs.get("tags"):
+                        ds.update_tags(**kwargs["tags"])
+                    band_names = (
+                        types.make_iterable(long_name)
+                        if long_name
+                        else [
+                            next(
+                                (
+                                    band.name
+                                    for band, band_obj in self.bands.items()
+                                    if band_obj is not None and band_obj.id == idx
+                                ),
+                                str(idx),
+                            )
+                            for idx in ortho_paths[ortho_path]
+                        ]
+                    )
+                    if len(band_names) == ds.count:
+                        ds.descriptions = tuple(band_names)
+
+                try:
+                    with ThreadPoolExecutor(
+                        max_workers=max(1, utils.get_max_cores())
+                    ) as executor:
+                        for window, dst_arr in zip(
+                            windows, executor.map(ortho_tile, windows)
+                        ):
+                            if dst_arr is None:
+                                continue
+                            for ortho_path, idxs in ortho_paths.items():
+                                dst_ds[ortho_path].write(
+                                    dst_arr[[indexes.index(idx) for idx in idxs]],
+                                    window=window,
+                                )
+                finally:
+                    for handle in thread_handles:
+                        handle.close()
+
+            if driver == "COG":
+                for ortho_path, out_path in out_paths.items():
+                    rio_shutil.copy(
+                        out_path,
+                        str(ortho_path),
+                        driver="COG",
+                        compress="lzw",
+                        BIGTIFF="IF_NEEDED",
+                        NUM_THREADS="ALL_CPUS",
+                    )
+
     def _reproject(
         self,
         src_xda: xr.DataArray,
@@ -2597,28 +3921,7 @@ class Product:
         # See https://gdal.org/en/stable/api/gdal_alg.html#_CPPv426GDALCreateRPCTransformerV2PK13GDALRPCInfoV2idPPc
         LOGGER.debug(f"Orthorectifying data with {dem_path}")
 
-        # RPC_DEM doesn't work with cloud-based DEM
-        # Read it to the extent of the product and save it on disk
-        if path.is_cloud_path(dem_path):
-            cached_dem_path, cached_dem_exists = self._get_out_path(
-                AnyPath(dem_path).name
-            )
-            if not cached_dem_exists:
-                LOGGER.warning(
-                    "gdalwarp cannot process DEM stored on cloud with 'RPC_DEM' argument, "
-                    "hence cloud-stored DEM cannot be used with non orthorectified data. "
-                    f"(DEM: {dem_path}). "
-                    "The DEM will be cached before the operation."
-                )
-
-                utils.write(
-                    utils.read(dem_path, window=self.extent()),
-                    cached_dem_path,
-                    dtype=np.float32,
-                )
-
-                LOGGER.debug("DEM cached.")
-            dem_path = str(cached_dem_path)
+        dem_path = self._get_rpc_dem_path(dem_path)
 
         # Set SRC crs if needed
         if src_xda.rio.crs is None:
@@ -22,11 +22,14 @@ from enum import unique
 from typing import Union
 
 import geopandas as gpd
+import numpy as np
 from lxml import etree
+from rasterio.windows import Window
 from sertit import path, vectors
 from sertit.misc import ListEnum
 
 from eoreader import DATETIME_FMT, EOREADER_NAME, cache
+from eoreader.bands import SarBandNames as sab
 from eoreader.exceptions import InvalidProductError
 from eoreader.products import SarProduct, SarProductType
 from eoreader.products.product import OrbitDirection
@@ -34,6 +37,49 @@ from eoreader.products.product import OrbitDirection
 LOGGER = logging.getLogger(EOREADER_NAME)
 
 
+def _to_array(element: etree._Element) -> np.ndarray:
+    """Convert a XML element storing a list of numbers to an array"""
+    return np.array(element.text.split(), dtype=np.float64)
+
+
+def _interp_lut(
+    lines: np.ndarray, vectors: list, rows: np.ndarray, cols: np.ndarray
+) -> np.ndarray:
+    """
+    Bilinearly interpolate a LUT given as range vectors (one per line) on the wanted rows and columns of the image.
+
+    Only the range vectors surrounding the wanted rows are interpolated, and the LUT is computed as :code:`float32`
+    (it is meant to be computed block by block).
+
+    Args:
+        lines (np.ndarray): Lines of the range vectors
+        vectors (list): Range vectors, as (pixels, values) tuples
+        rows (np.ndarray): Wanted rows
+        cols (np.ndarray): Wanted columns
+
+    Returns:
+        np.ndarray: Interpolated LUT (as float32), of shape (rows, cols)
+    """
+
+    def interp_in_range(vector_idx):
+        pixels, values = vectors[vector_idx]
+        return np.interp(cols, pixels, values).astype(np.float32)
+
+    # Interpolate in range first, then in azimuth
+    if len(lines) == 1:
+        return np.broadcast_to(interp_in_range(0), (rows.size, cols.size))
+
+    idx = np.clip(np.searchsorted(lines, rows, side="right") - 1, 0, len(lines) - 2)
+    weights = np.clip((rows - lines[idx]) / (lines[idx + 1] - lines[idx]), 0, 1)
+    weights = weights.astype(np.float32)[:, np.newaxis]
+
+    # Only interpolate in range the vectors needed by the wanted rows
+    needed_idx = np.unique(np.concatenate([idx, idx + 1]))
+    in_range = np.stack([interp_in_range(vector_idx) for vector_idx in needed_idx])
+    idx = np.searchsorted(needed_idx, idx)
+    return (1 - weights) * in_range[idx] + weights * in_range[idx + 1]
+
+
 @unique
 class S1ProductType(ListEnum):
     """
@@ -220,6 +266,167 @@ class S1Product(SarProduct):
         # Post init done by the super class
         super()._post_init(**kwargs)
 
+    def _has_native_pre_process(self) -> bool:
+        """Only GRD products can be pre-processed with the native pipeline"""
+        return self.sar_prod_type == SarProductType.GRD
+
+    def _read_pol_xml(self, band: sab, folder: str = "") -> etree._Element:
+        """
+        Read the annotation XML of the given band (or the one stored in the given annotation subfolder, i.e. calibration or noise)
+
+        Args:
+            band (sab): Band
+            folder (str): Annotation subfolder (:code:`calibration` or :code:`noise`), the main annotation file if empty
+
+        Returns:
+            etree._Element: XML root
+        """
+        pol = self.bands[band].id.lower()
+        if folder:
+            mtd_from_path = f"annotation/calibration/{folder}-*-{pol}-*.xml"
+            mtd_archived = rf"annotation/calibration/{folder}-.*-{pol}-.*\.xml"
+        else:
+            mtd_from_path = f"annotation/s1*-{pol}-*.xml"
+            mtd_archived = rf"annotation/s1.*-{pol}-.*\.xml"
+
+        root, _ = self._read_mtd_xml(mtd_from_path, mtd_archived)
+        return root
+
+    @cache
+    def _get_native_geolocation(self, band: sab) -> dict:
+        """
+        Get the geolocation grid of the given band, used by the native pipeline.
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            dict: Geolocation grid as 1D arrays (:code:`line`, :code:`pixel`, :code:`latitude`, :code:`longitude`, :code:`height`, :code:`incidence_angle` in degrees)
+            and the ground range pixel spacing (:code:`range_pixel_spacing`, in meters)
+        """
+        root = self._read_pol_xml(band)
+
+        fields = {
+            "line": "line",
+            "pixel": "pixel",
+            "latitude": "latitude",
+            "longitude": "longitude",
+            "height": "height",
+            "incidence_angle": "incidenceAngle",
+        }
+        points = root.findall(".//geolocationGridPoint")
+        if not points:
+            raise InvalidProductError("geolocationGridPoint not found in metadata!")
+
+        geoloc = {
+            key: np.array([float(point.findtext(field)) for point in points])
+            for key, field in fields.items()
+        }
+
+        range_pixel_spacing = root.findtext(".//rangePixelSpacing")
+        if not range_pixel_spacing:
+            raise InvalidProductError("rangePixelSpacing not found in metadata!")
+        geoloc["range_pixel_spacing"] = float(range_pixel_spacing)
+
+        return geoloc
+
+    @cache
+    def _read_native_luts(self, band: sab) -> dict:
+        """
+        Read the calibration (:code:`sigma0`) and thermal noise LUTs of the given band.
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            dict: LUTs of the band
+        """
+
+        def read_vectors(root, vector_name, lut_name):
+            vectors = root.findall(f".//{vector_name}")
+            if not vectors:
+                return None
+            lines = np.array([float(vector.findtext("line")) for vector in vectors])
+            luts = [
+                (_to_array(vector.find("pixel")), _to_array(vector.find(lut_name)))
+                for vector in vectors
+            ]
+            return lines, luts
+
+        # Calibration
+        sigma0 = read_vectors(
+            self._read_pol_xml(band, "calibration"), "calibrationVector", "sigmaNought"
+        )
+        if sigma0 is None:
+            raise InvalidProductError("calibrationVector not found in metadata!")
+
+        # Thermal noise (IPF >= 2.9 have range and azimuth vectors, older ones only range ones)
+        noise_root = self._read_pol_xml(band, "noise")
+        noise_range = read_vectors(noise_root, "noiseRangeVector", "noiseRangeLut")
+        if noise_range is None:
+            noise_range = read_vectors(noise_root, "noiseVector", "noiseLut")
+
+        noise_azimuth = [
+            (
+                int(vector.findtext("firstAzimuthLine")),
+                int(vector.findtext("lastAzimuthLine")),
+                int(vector.findtext("firstRangeSample")),
+                int(vector.findtext("lastRangeSample")),
+                _to_array(vector.find("line")),
+                _to_array(vector.find("noiseAzimuthLut")),
+            )
+            for vector in noise_root.findall(".//noiseAzimuthVector")
+        ]
+
+        return {
+            "sigma0": sigma0,
+            "noise_range": noise_range,
+            "noise_azimuth": noise_azimuth,
+        }
+
+    def _calibrate_native(
+        self, band: sab, dn_arr: np.ndarray, window: Window
+    ) -> np.ndarray:
+        """
+        Calibrate the given raw window of a band (and remove its thermal noise), used by the native pipeline.
+
+        See `Thermal Denoising of Products Generated by the S-1 IPF <https://sentinel.esa.int/documents/247904/2142675/Thermal-Denoising-of-Products-Generated-by-Sentinel-1-IPF>`_
+
+        Args:
+            band (sab): Band
+            dn_arr (np.ndarray): Raw digital numbers (as float32, with nodata set to NaN)
+            window (Window): Window of the raw image corresponding to :code:`dn_arr`
+
+        Returns:
+            np.ndarray: Calibrated array (:code:`sigma0`, linear, as float32)
+        """
+        luts = self._read_native_luts(band)
+        rows = np.arange(window.row_off, window.row_off + window.height)
+        cols = np.arange(window.col_off, window.col_off + window.width)
+
+        # Thermal noise: range noise x azimuth noise (if existing)
+        if luts["noise_range"] is not None:
+            noise = np.array(_interp_lut(*luts["noise_range"], rows, cols))
+            for (
+                first_line,
+                last_line,
+                first_sample,
+                last_sample,
+                az_lines,
+                az_lut,
+            ) in luts["noise_azimuth"]:
+                row_mask = (rows >= first_line) & (rows <= last_line)
+                col_mask = (cols >= first_sample) & (cols <= last_sample)
+                if row_mask.any() and col_mask.any():
+                    noise[np.ix_(row_mask, col_mask)] *= np.interp(
+                        rows[row_mask], az_lines, az_lut
+                    ).astype(np.float32)[:, np.newaxis]
+        else:
+            noise = 0
+
+        sigma0_lut = _interp_lut(*luts["sigma0"], rows, cols)
+        return (dn_arr.astype(np.float32) ** 2 - noise) / sigma0_lut**2
+
     @cache
     def wgs84_extent(self) -> gpd.GeoDataFrame:
         """
@@ -15,6 +15,7 @@
 # limitations under the License.
 """Super class for SAR products"""
 
+import contextlib
 import logging
 import os
 import tempfile
@@ -26,10 +27,11 @@ from typing import Union
 import geopandas as gpd
 import numpy as np
 import rasterio
-import rioxarray
 import xarray as xr
 from rasterio import crs
 from rasterio.enums import Resampling
+from rasterio.transform import from_origin
+from rasterio.vrt import WarpedVRT
 from rasterio.windows import Window
 from sertit import AnyPath, geometry, misc, path, rasters, snap, strings, types, vectors
 from sertit.misc import ListEnum
@@ -44,11 +46,13 @@ from eoreader.env_vars import (
     DEM_PATH,
     DSPK_GRAPH,
     PP_GRAPH,
+    SAR_BATCH_POLARISATIONS,
     SAR_DEF_PIXEL_SIZE,
+    SAR_PREPROCESS_ENGINE,
     SNAP_DEM_NAME,
 )
 from eoreader.exceptions import InvalidProductError, InvalidTypeError
-from eoreader.keywords import SAR_INTERP_NA
+from eoreader.keywords import SAR_ENGINE, SAR_INTERP_NA
 from eoreader.products.product import Product, SensorType
 from eoreader.reader import Constellation
 from eoreader.stac import INTENSITY
@@ -56,6 +60,118 @@ from eoreader.utils import simplify
 
 LOGGER = logging.getLogger(EOREADER_NAME)
 
+NATIVE_BLOCK_SIZE = 2**11
+"""Size (in pixels) of the square output blocks geocoded (and written) at once by the native SAR pipeline"""
+
+NATIVE_SUFFIX = "_NATIVE"
+"""Suffix of the bands pre-processed by the native SAR pipeline"""
+
+SAR_INTERP_NA_LIMIT = 10
+"""Maximum distance (in pixels) to the valid data of the nodata pixels interpolated with :code:`SAR_INTERP_NA`"""
+
+
+def _fill_na_block(block: np.ndarray, method: str, limit: int) -> np.ndarray:
+    """
+    Fill the nodata holes of a block (band, y, x) with the valid pixels found at less than :code:`limit` pixels.
+    Only the holes inside the footprint are filled (i.e. its borders are not extended).
+
+    Args:
+        block (np.ndarray): Block to fill, with its nodata set to NaN
+        method (str): :code:`nearest` or :code:`idw` (inverse distance weighting)
+        limit (int): Maximum distance (in pixels) to the valid data
+
+    Returns:
+        np.ndarray: Filled block
+    """
+    nodata = np.isnan(block)
+
+    # Nothing to fill or nothing to fill from: don't spend time here
+    if not nodata.any() or nodata.all():
+        return block
+
+    # Import scipy here (long import)
+    from scipy import ndimage, signal
+
+    block = block.copy()
+    for band_idx in range(block.shape[0]):
+        band_nodata = nodata[band_idx]
+        if not band_nodata.any() or band_nodata.all():
+            continue
+
+        # Morphological closing of the valid pixels (computed with distance transforms):
+        # keep the nodata pixels close enough to the valid data, but not the ones extending the footprint
+        dist_to_valid, (rows, cols) = ndimage.distance_transform_edt(
+            band_nodata, return_indices=True
+        )
+        near_valid = dist_to_valid <= limit
+        if near_valid.all():
+            to_fill = band_nodata
+        else:
+            to_fill = band_nodata & (ndimage.distance_transform_edt(near_valid) > limit)
+
+        if not to_fill.any():
+            continue
+
+        band_arr = block[band_idx]
+        if method == "nearest":
+            band_arr[to_fill] = band_arr[rows[to_fill], cols[to_fill]]
+        else:
+            # Inverse distance weighting (1/d²) of the valid pixels in a radius of 'limit' pixels
+            kernel_y, kernel_x = np.mgrid[-limit : limit + 1, -limit : limit + 1]
+            dist2 = (kernel_y**2 + kernel_x**2).astype(np.float64)
+            kernel = np.where(
+                (dist2 > 0) & (dist2 <= limit**2), 1 / np.maximum(dist2, 1), 0
+            )
+            weighted_sum = signal.fftconvolve(
+                np.where(band_nodata, 0, band_arr), kernel, mode="same"
+            )
+            weights = signal.fftconvolve(~band_nodata, kernel, mode="same")
+            to_fill &= weights > 1e-6
+            band_arr[to_fill] = weighted_sum[to_fill] / weights[to_fill]
+
+    return block
+
+
+def _fill_na(arr: xr.DataArray, method: str, limit: int) -> xr.DataArray:
+    """
+    Fill the nodata holes of an array, block by block (with a halo) if it is a dask array.
+    See :code:`_fill_na_block`.
+
+    Args:
+        arr (xr.DataArray): Array to fill, with its nodata set to NaN
+        method (str): :code:`nearest` or :code:`idw` (inverse distance weighting)
+        limit (int): Maximum distance (in pixels) to the valid data
+
+    Returns:
+        xr.DataArray: Filled array
+    """
+    if method not in ["nearest", "idw"]:
+        raise ValueError(
+            f"{SAR_INTERP_NA} should be True or chosen among ['nearest', 'idw'], not {method}"
+        )
+
+    # The closing needs a halo of twice the limit
+    # (padded with nodata on the borders of the array, so that the footprint is never extended there)
+    depth = 2 * limit + 1
+    if arr.chunks is not None:
+        data = arr.data.map_overlap(
+            _fill_na_block,
+            depth={0: 0, 1: depth, 2: depth},
+            boundary=np.nan,
+            dtype=arr.dtype,
+            method=method,
+            limit=limit,
+        )
+    else:
+        padded = np.pad(
+            np.asarray(arr.data),
+            ((0, 0), (depth, depth), (depth, depth)),
+            constant_values=np.nan,
+        )
+        data = _fill_na_block(padded, method, limit)[:, depth:-depth, depth:-depth]
+
+    return arr.copy(data=data)
+
 
 @unique
 class SnapDems(ListEnum):
@@ -132,6 +248,25 @@ class SarProductType(ListEnum):
     """Other products types, not used in EOReader"""
 
 
+@unique
+class SarEngine(ListEnum):
+    """
+    Engines used to pre-process the SAR products (calibration and geocoding).
+    """
+
+    SNAP = "snap"
+    """SNAP's :code:`gpt` (default)"""
+
+    NATIVE = "native"
+    """
+    EOReader's in-process pipeline, without SNAP nor Java (only available for Sentinel-1 GRD products).
+    The bands are calibrated (:code:`sigma0`, in dB), their thermal noise is removed and they are geocoded with the geolocation grid of the product,
+    corrected from the terrain if a DEM is given with :code:`EOREADER_DEM_PATH`.
+
+    This is faster (especially for small windows) but less accurate than SNAP: no precise orbit nor Range-Doppler terrain correction.
+    """
+
+
 class _ExtendedFormatter(Formatter):
     """An extended format string formatter
 
@@ -200,6 +335,22 @@ class SarProduct(Product):
         # Initialization from the super class
         super().__init__(product_path, archive_path, output_path, remove_tmp, **kwargs)
 
+        if not self._is_initialized:
+            # Lazy products: hide the SAR attributes too, they will be computed on first access
+            for attr in [
+                "sar_prod_type",
+                "sensor_mode",
+                "pol_channels",
+                "is_ortho",
+                "_need_snap",
+            ]:
+                self._lazy_attrs[attr] = self.__dict__.pop(attr)
+
+    def _finish_init(self) -> None:
+        """
+        Finish the initialization of the product, and set the SAR attributes depending on the product type.
+        """
+        super()._finish_init()
         self._need_snap = self._need_snap_to_pre_process()
         self.is_ortho = self.sar_prod_type == SarProductType.ORTHO
 
@@ -269,6 +420,74 @@ class SarProduct(Product):
         need_snap = self.sar_prod_type in [SarProductType.CPLX, SarProductType.GRD]
         return need_snap
 
+    def _has_native_pre_process(self) -> bool:
+        """
+        This product can be pre-processed with the native pipeline (see :code:`SarEngine.NATIVE`).
+        Products handling it need to implement :code:`_get_native_geolocation` and :code:`_calibrate_native`.
+        """
+        return False
+
+    def _get_sar_engine(self, **kwargs) -> SarEngine:
+        """
+        Get the engine used to pre-process this product,
+        given by the :code:`sar_engine` keyword or the :code:`EOREADER_SAR_PREPROCESS_ENGINE` environment variable.
+
+        Falls back to SNAP if the native pipeline is not available for this product.
+
+        Args:
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            SarEngine: Engine used to pre-process this product
+        """
+        engine = kwargs.get(
+            SAR_ENGINE, os.environ.get(SAR_PREPROCESS_ENGINE, SarEngine.SNAP)
+        )
+        try:
+            engine = SarEngine.from_value(
+                engine.lower() if isinstance(engine, str) else engine
+            )
+        except ValueError as ex:
+            raise ValueError(
+                f"{SAR_PREPROCESS_ENGINE} should be chosen among {SarEngine.list_values()}"
+            ) from ex
+
+        if engine == SarEngine.NATIVE and not self._has_native_pre_process():
+            LOGGER.warning(
+                f"The native pre-process is not available for {self.condensed_name}: using SNAP instead."
+            )
+            engine = SarEngine.SNAP
+
+        return engine
+
+    def _use_native_pre_process(self, **kwargs) -> bool:
+        """
+        This product needs to be pre-processed and will be with the native pipeline.
+
+        Args:
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            bool: True if the native pipeline is used
+        """
+        return self._need_snap and self._get_sar_engine(**kwargs) == SarEngine.NATIVE
+
+    def _get_band_file_name_sensor_specific_suffix(
+        self, band: BandNames, **kwargs
+    ) -> str:
+        """
+        Get the sensor-specific suffix of a band filename.
+        The bands pre-processed with the native pipeline are not the same as SNAP's ones: don't mix them.
+
+        Args:
+            band (BandNames): Wanted band
+            **kwargs: Other args
+
+        Returns:
+            str: Band filename sensor-specific suffix
+        """
+        return NATIVE_SUFFIX if self._use_native_pre_process(**kwargs) else ""
+
     @cache
     @simplify
     def footprint(self) -> gpd.GeoDataFrame:
@@ -465,6 +684,9 @@ class SarProduct(Product):
         if pixel_size is None:
             pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, self.pixel_size))
 
+        # Pre-process all the missing polarisations at once if wanted
+        self._pre_process_snap_batch(band_list, pixel_size, **kwargs)
+
         band_paths = {}
         for band in band_list:
             if self.bands[band] is None:
@@ -912,14 +1134,19 @@ class SarProduct(Product):
             ) + list(self._get_band_folder(writable=False).glob(no_res_name))
 
             if len(no_res_files) > 0:
+                use_native = self._use_native_pre_process(**kwargs)
                 for no_res_file in no_res_files:
+                    # Discard files processed by the other engine
+                    if (NATIVE_SUFFIX in no_res_file.name) != use_native:
+                        continue
+
                     # Discard despeckled file
                     if (
                         sab.is_speckle(band)
                         and sab.corresponding_despeckle(band).name in no_res_file.name
                     ):
                         continue
-                    filename = path.get_filename(no_res_file)
+                    filename = path.get_filename(no_res_file).replace(NATIVE_SUFFIX, "")
                     split_name = filename.split("_")
                     if pixel_size is not None and "m" in split_name[-1]:
                         # Check if resolution is better than the one asked
@@ -942,6 +1169,25 @@ class SarProduct(Product):
 
         return already_ortho
 
+    def _get_snap_pixel_size(self, pixel_size: float = None) -> float:
+        """
+        Get the pixel size used for the Terrain Correction (0 lets SNAP choose it).
+        This is not the pixel size used for reading the file!
+        It is possible to orthorectify the image at 20 m but read it at 10 m
+
+        Args:
+            pixel_size (float): Wanted pixel size
+
+        Returns:
+            float: Pixel size used by SNAP
+        """
+        def_snap_pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, 0))
+        return (
+            pixel_size
+            if (pixel_size and pixel_size != self.pixel_size)
+            else def_snap_pixel_size
+        )
+
     def _pre_process_snap(
         self,
         pre_processed_path: AnyPathType,
@@ -961,72 +1207,419 @@ class SarProduct(Product):
         Returns:
             AnyPathType: Band path
         """
-        # Manage pixel size used for Terrain correction
-        # This is not the pixel size used for reading the file!
-        # It is possible to orthorectify the image at 20 m but read it at 10 m
-        def_snap_pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, 0))
-        snap_pixel_size = (
-            pixel_size
-            if (pixel_size and pixel_size != self.pixel_size)
-            else def_snap_pixel_size
+        already_ortho = self._already_processed_path(
+            band, self._get_snap_pixel_size(pixel_size), **kwargs
         )
-        already_ortho = self._already_processed_path(band, snap_pixel_size, **kwargs)
         if already_ortho is not None:
             return already_ortho
         else:
-            # Create target dir (tmp dir)
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                # Use dimap for speed and security (i.e. GeoTiff's broken georef)
-                pp_target = os.path.join(tmp_dir, f"{self.condensed_name}")
-                pp_dim = pp_target + ".dim"
+            return self._pre_process_snap_bands(
+                {band: pre_processed_path}, pixel_size, **kwargs
+            )[band]
 
-                # Pre-process graph
-                pp_graph = self._get_pp_graph()
+    def _pre_process_snap_bands(
+        self,
+        pre_processed_paths: dict,
+        pixel_size: float = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Pre-process several polarisations of SAR data with SNAP, in one graph execution.
 
-                # Get DEM for orthorectification
-                dem_name, dem_path = self._get_dem()
+        Args:
+            pre_processed_paths (dict): Pre-processed path of each band to pre-process
+            pixel_size (float): Pixel size
+            kwargs: Additional arguments
 
-                # Get the product path, compatible with SNAP
-                # WARNING: this can trigger the download of the product if stored on the cloud!
-                prod_path = self._get_snap_path(tmp_dir, **kwargs)
+        Returns:
+            dict: Path of each band
+        """
+        snap_pixel_size = self._get_snap_pixel_size(pixel_size)
+        calib_pola = ",".join(band.name for band in pre_processed_paths)
 
-                # Manage subset
-                geo_region, region, window_to_crop = self._get_subset(**kwargs)
+        # Create target dir (tmp dir)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Use dimap for speed and security (i.e. GeoTiff's broken georef)
+            pp_target = os.path.join(tmp_dir, f"{self.condensed_name}")
+            pp_dim = pp_target + ".dim"
+
+            # Pre-process graph
+            pp_graph = self._get_pp_graph()
+
+            # Get DEM for orthorectification
+            dem_name, dem_path = self._get_dem()
+
+            # Get the product path, compatible with SNAP
+            # WARNING: this can trigger the download of the product if stored on the cloud!
+            prod_path = self._get_snap_path(tmp_dir, **kwargs)
+
+            # Manage subset
+            geo_region, region, window_to_crop = self._get_subset(**kwargs)
+
+            # Get resolution
+            res_m, res_deg = self._get_resolution(snap_pixel_size)
+
+            # Create SNAP CLI
+            cmd_list = snap.get_gpt_cli(
+                pp_graph,
+                [
+                    f"-Pfile={strings.to_cmd_string(prod_path)}",
+                    f"-Pgeo_region={strings.to_cmd_string(geo_region)}",
+                    f"-Pregion={strings.to_cmd_string(region)}",
+                    f"-Pcalib_pola={strings.to_cmd_string(calib_pola)}",
+                    f"-Pdem_name={strings.to_cmd_string(dem_name.value)}",
+                    f"-Pdem_path={strings.to_cmd_string(dem_path)}",
+                    f"-Pcrs={self.crs()}",
+                    f"-Pres_m={res_m}",
+                    f"-Pres_deg={res_deg}",
+                    f"-Pout={strings.to_cmd_string(pp_dim)}",
+                ],
+                display_snap_opt=LOGGER.level == logging.DEBUG,
+            )
 
-                # Get resolution
-                res_m, res_deg = self._get_resolution(snap_pixel_size)
+            # Pre-process SAR images according to the given graph
+            LOGGER.debug(f"Pre-process SAR image ({calib_pola})")
+            try:
+                misc.run_cli(cmd_list)
+            except RuntimeError as ex:
+                raise RuntimeError("Something went wrong with SNAP!") from ex
 
-                # Create SNAP CLI
-                cmd_list = snap.get_gpt_cli(
-                    pp_graph,
-                    [
-                        f"-Pfile={strings.to_cmd_string(prod_path)}",
-                        f"-Pgeo_region={strings.to_cmd_string(geo_region)}",
-                        f"-Pregion={strings.to_cmd_string(region)}",
-                        f"-Pcalib_pola={strings.to_cmd_string(band.name)}",
-                        f"-Pdem_name={strings.to_cmd_string(dem_name.value)}",
-                        f"-Pdem_path={strings.to_cmd_string(dem_path)}",
-                        f"-Pcrs={self.crs()}",
-                        f"-Pres_m={res_m}",
-                        f"-Pres_deg={res_deg}",
-                        f"-Pout={strings.to_cmd_string(pp_dim)}",
-                    ],
-                    display_snap_opt=LOGGER.level == logging.DEBUG,
+            # Convert DIMAP images to GeoTiff
+            LOGGER.debug("Converting DIMAP to GeoTiff")
+            return {
+                band: self._write_sar(
+                    pre_processed_path,
+                    pp_dim,
+                    band,
+                    multi_pol=len(pre_processed_paths) > 1,
+                    crop=window_to_crop,
+                    **kwargs,
                 )
+                for band, pre_processed_path in pre_processed_paths.items()
+            }
 
-                # Pre-process SAR images according to the given graph
-                LOGGER.debug("Pre-process SAR image")
-                try:
-                    misc.run_cli(cmd_list)
-                except RuntimeError as ex:
-                    raise RuntimeError("Something went wrong with SNAP!") from ex
+    def _pre_process_snap_batch(
+        self, band_list: list, pixel_size: float = None, **kwargs
+    ) -> None:
+        """
+        Pre-process all the missing polarisations needed by the given bands in one SNAP graph execution
+        (instead of one execution per band, each one reading the product and the DEM again).
+
+        Only done if :code:`EOREADER_SAR_BATCH_POLARISATIONS` is set and if at least two polarisations are missing.
+        The pre-processed bands are written where :code:`get_band_paths` expects them.
+
+        Args:
+            band_list (list): List of the wanted bands
+            pixel_size (float): Band pixel size
+            kwargs: Other arguments used to load bands
+        """
+        if (
+            not self._need_snap
+            or os.getenv(SAR_BATCH_POLARISATIONS, "0").lower() not in ("1", "true")
+            or self._use_native_pre_process(**kwargs)
+        ):
+            return
+
+        snap_pixel_size = self._get_snap_pixel_size(pixel_size)
+        pre_processed_paths = {}
+        for band in band_list:
+            if self.bands[band] is None:
+                continue
+
+            # Despeckled bands need their speckle band, if not already existing
+            if sab.is_despeckle(band):
+                _, dspk_exists = self._is_existing(
+                    self.get_band_file_name(band, pixel_size, **kwargs)
+                )
+                if dspk_exists:
+                    continue
+
+            speckle_band = sab.corresponding_speckle(band)
+            if (
+                speckle_band not in self.pol_channels
+                or speckle_band in pre_processed_paths
+            ):
+                continue
+
+            pp_path, pp_exists = self._is_existing(
+                self.get_band_file_name(speckle_band, pixel_size, **kwargs)
+            )
+            if (
+                pp_exists
+                or self._restore_from_cache(pp_path, **kwargs)
+                or self._already_processed_path(speckle_band, snap_pixel_size, **kwargs)
+                is not None
+            ):
+                continue
+
+            pre_processed_paths[speckle_band] = pp_path
+
+        if len(pre_processed_paths) > 1:
+            for out_path in self._pre_process_snap_bands(
+                pre_processed_paths, pixel_size, **kwargs
+            ).values():
+                self._put_in_cache(out_path, **kwargs)
+
+    def _get_native_geolocation(self, band: sab) -> dict:
+        """
+        Get the geolocation grid of the given band, used by the native pipeline.
+
+        Args:
+            band (sab): Band
+
+        Returns:
+            dict: Geolocation grid as 1D arrays (:code:`line`, :code:`pixel`, :code:`latitude`, :code:`longitude`, :code:`height`, :code:`incidence_angle` in degrees)
+            and the ground range pixel spacing (:code:`range_pixel_spacing`, in meters)
+        """
+        raise NotImplementedError
+
+    def _calibrate_native(
+        self, band: sab, dn_arr: np.ndarray, window: Window
+    ) -> np.ndarray:
+        """
+        Calibrate the given raw window of a band (and remove its thermal noise), used by the native pipeline.
+
+        Args:
+            band (sab): Band
+            dn_arr (np.ndarray): Raw digital numbers (as float32, with nodata set to NaN)
+            window (Window): Window of the raw image corresponding to :code:`dn_arr`
+
+        Returns:
+            np.ndarray: Calibrated array (:code:`sigma0`, linear)
+        """
+        raise NotImplementedError
+
+    def _pre_process_native(
+        self,
+        pre_processed_path: AnyPathType,
+        band: sab,
+        pixel_size: float = None,
+        **kwargs,
+    ) -> AnyPathType:
+        """
+        Pre-process SAR data with the native pipeline (without SNAP):
+
+        - calibrate the band (:code:`sigma0`) and remove its thermal noise, only on the needed part of the raw image
+        - geocode it with the geolocation grid of the product (bilinear interpolation), block by block (each block being written on disk as soon as it is computed)
+        - if a DEM is given (:code:`EOREADER_DEM_PATH`), shift the pixels in range to correct the terrain displacement
+        - convert it to dB
+
+        Args:
+            pre_processed_path (AnyPathType): Pre-processed path
+            band (sbn): Band to preprocess
+            pixel_size (float): Pixel size
+            kwargs: Additional arguments
+
+        Returns:
+            AnyPathType: Band path
+        """
+        if not pixel_size:
+            pixel_size = float(os.environ.get(SAR_DEF_PIXEL_SIZE, 0)) or self.pixel_size
 
-                # Convert DIMAP images to GeoTiff
-                LOGGER.debug("Converting DIMAP to GeoTiff")
-                return self._write_sar(
-                    pre_processed_path, pp_dim, band, crop=window_to_crop, **kwargs
+        already_ortho = self._already_processed_path(band, pixel_size, **kwargs)
+        if already_ortho is not None:
+            return already_ortho
+
+        # Import scipy here (long import)
+        from scipy.interpolate import LinearNDInterpolator
+
+        LOGGER.debug(f"Pre-processing {band.name} with the native pipeline")
+
+        # Inverse geolocation: (x, y) in the product CRS -> (line, pixel) in the raw image
+        geoloc = self._get_native_geolocation(band)
+        gcps = gpd.GeoSeries(
+            gpd.points_from_xy(geoloc["longitude"], geoloc["latitude"]), crs=WGS84
+        ).to_crs(self.crs())
+        gcps_xy = np.column_stack([gcps.x, gcps.y])
+        inverse_geoloc = LinearNDInterpolator(
+            gcps_xy,
+            np.column_stack(
+                [
+                    geoloc["line"],
+                    geoloc["pixel"],
+                    geoloc["height"],
+                    geoloc["incidence_angle"],
+                ]
+            ),
+        )
+
+        # Output grid, aligned on the pixel size (cropped to the window if given)
+        left, bottom = gcps_xy.min(axis=0)
+        right, top = gcps_xy.max(axis=0)
+        _, _, window_to_crop = self._get_subset(**kwargs)
+        if window_to_crop is not None and not isinstance(window_to_crop, Window):
+            # Keep a margin of a few pixels, the exact crop is done when writing the band
+            win_left, win_bottom, win_right, win_top = (
+                window_to_crop.to_crs(self.crs()).total_bounds
+                + np.array([-2, -2, 2, 2]) * pixel_size
+            )
+            left, bottom = max(left, win_left), max(bottom, win_bottom)
+            right, top = min(right, win_right), min(top, win_top)
+            if left >= right or bottom >= top:
+                raise ValueError(
+                    f"The given window doesn't intersect {self.condensed_name}"
                 )
 
+        left = np.floor(left / pixel_size) * pixel_size
+        top = np.ceil(top / pixel_size) * pixel_size
+        width = int(np.ceil((right - left) / pixel_size))
+        height = int(np.ceil((top - bottom) / pixel_size))
+        dst_tr = from_origin(left, top, pixel_size, pixel_size)
+        xs = left + (np.arange(width) + 0.5) * pixel_size
+        ys = top - (np.arange(height) + 0.5) * pixel_size
+
+        # Geocode the band block by block, writing each block on disk as soon as it is computed
+        dem_path = os.environ.get(DEM_PATH)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            native_path = os.path.join(
+                tmp_dir, f"{path.get_filename(pre_processed_path)}.tif"
+            )
+            with contextlib.ExitStack() as stack:
+                # DEM, warped on the fly to the output grid
+                dem_vrt = None
+                if dem_path:
+                    dem_vrt = stack.enter_context(
+                        WarpedVRT(
+                            stack.enter_context(rasterio.open(str(dem_path))),
+                            crs=self.crs(),
+                            transform=dst_tr,
+                            width=width,
+                            height=height,
+                            resampling=Resampling.bilinear,
+                            dtype="float32",
+                        )
+                    )
+                raw_ds = stack.enter_context(
+                    rasterio.open(str(self.get_raw_band_paths(**kwargs)[band]))
+                )
+                out_ds = stack.enter_context(
+                    rasterio.open(
+                        native_path,
+                        "w",
+                        driver="GTiff",
+                        width=width,
+                        height=height,
+                        count=1,
+                        dtype=np.float32,
+                        crs=self.crs(),
+                        transform=dst_tr,
+                        nodata=np.nan,
+                        tiled=True,
+                        blockxsize=256,
+                        blockysize=256,
+                    )
+                )
+
+                for row_off in range(0, height, NATIVE_BLOCK_SIZE):
+                    for col_off in range(0, width, NATIVE_BLOCK_SIZE):
+                        block_window = Window(
+                            col_off,
+                            row_off,
+                            min(NATIVE_BLOCK_SIZE, width - col_off),
+                            min(NATIVE_BLOCK_SIZE, height - row_off),
+                        )
+                        out_ds.write(
+                            self._geocode_native_block(
+                                band,
+                                raw_ds,
+                                dem_vrt,
+                                inverse_geoloc,
+                                geoloc["range_pixel_spacing"],
+                                xs[col_off : col_off + block_window.width],
+                                ys[row_off : row_off + block_window.height],
+                                block_window,
+                            ),
+                            1,
+                            window=block_window,
+                        )
+
+            # Read the geocoded band by chunks in order to write it with a fixed memory
+            arr = utils.read(native_path, masked=False).rename(self.bands[band].id)
+
+            return self._write_sar_arr(
+                pre_processed_path, arr, band, crop=window_to_crop, **kwargs
+            )
+
+    def _geocode_native_block(
+        self,
+        band: sab,
+        raw_ds,
+        dem_vrt,
+        inverse_geoloc,
+        range_pixel_spacing: float,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        block_window: Window,
+    ) -> np.ndarray:
+        """
+        Geocode (and calibrate) one output block of a band, used by the native pipeline.
+
+        Args:
+            band (sab): Band
+            raw_ds: Opened raw image of the band
+            dem_vrt: DEM warped to the output grid (None if no DEM is given)
+            inverse_geoloc: Interpolator from (x, y) to (line, pixel, height, incidence angle)
+            range_pixel_spacing (float): Ground range pixel spacing (in meters)
+            xs (np.ndarray): X coordinates of the block
+            ys (np.ndarray): Y coordinates of the block
+            block_window (Window): Window of the block in the output grid
+
+        Returns:
+            np.ndarray: Geocoded block (in dB, as float32, with its nodata set to NaN)
+        """
+        # Import scipy here (long import)
+        from scipy.ndimage import map_coordinates
+
+        out = np.full((ys.size, xs.size), np.nan, dtype=np.float32)
+
+        xx, yy = np.meshgrid(xs, ys)
+        lines, pixels, gcp_heights, inc_angles = np.moveaxis(
+            inverse_geoloc(xx, yy), -1, 0
+        )
+
+        if dem_vrt is not None:
+            # Elevated points are seen closer to the sensor (smaller range):
+            # shift the pixels in range by the displacement between the DEM and the geolocation grid height
+            dem = dem_vrt.read(1, window=block_window, masked=True).filled(np.nan)
+            dem = np.where(np.isnan(dem), gcp_heights, dem)
+            pixels -= (dem - gcp_heights) / (
+                np.tan(np.deg2rad(inc_angles)) * range_pixel_spacing
+            )
+
+        valid = np.isfinite(lines) & np.isfinite(pixels)
+        if not valid.any():
+            return out
+
+        # Only read and calibrate the needed part of the raw image
+        row_min = max(0, int(np.floor(lines[valid].min())) - 1)
+        row_max = min(raw_ds.height, int(np.ceil(lines[valid].max())) + 2)
+        col_min = max(0, int(np.floor(pixels[valid].min())) - 1)
+        col_max = min(raw_ds.width, int(np.ceil(pixels[valid].max())) + 2)
+        if row_min >= row_max or col_min >= col_max:
+            return out
+
+        raw_window = Window(col_min, row_min, col_max - col_min, row_max - row_min)
+        dn_arr = raw_ds.read(1, window=raw_window).astype(np.float32)
+        dn_arr[dn_arr == self._raw_no_data] = np.nan
+        sigma0 = self._calibrate_native(band, dn_arr, raw_window)
+
+        out = map_coordinates(
+            sigma0,
+            [
+                np.nan_to_num(lines - row_min, nan=-1),
+                np.nan_to_num(pixels - col_min, nan=-1),
+            ],
+            order=1,
+            mode="constant",
+            cval=np.nan,
+            prefilter=False,
+            output=np.float32,
+        )
+
+        # Convert to dB (negative values come from the thermal noise removal: set them to nodata)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(out > 0, 10 * np.log10(out), np.nan).astype(np.float32)
+
     def _pre_process_sar(
         self,
         pre_processed_path: AnyPathType,
@@ -1046,12 +1639,23 @@ class SarProduct(Product):
         Returns:
             AnyPathType: Band path
         """
+        if self._restore_from_cache(pre_processed_path, **kwargs):
+            return pre_processed_path
+
         if not self._need_snap:
             pre_process_fct = self._pre_process_no_snap
+        elif self._use_native_pre_process(**kwargs):
+            pre_process_fct = self._pre_process_native
         else:
             pre_process_fct = self._pre_process_snap
 
-        return pre_process_fct(pre_processed_path, band, pixel_size, **kwargs)
+        out_path = pre_process_fct(pre_processed_path, band, pixel_size, **kwargs)
+
+        # Don't cache bands derived from another already processed band
+        if AnyPath(out_path) == AnyPath(pre_processed_path):
+            self._put_in_cache(out_path, **kwargs)
+
+        return out_path
 
     def _despeckle_sar(
         self, despeckled_path: AnyPathType, band: sab, pixel_size, **kwargs
@@ -1110,7 +1714,12 @@ class SarProduct(Product):
         return out
 
     def _write_sar(
-        self, out_path: AnyPathType, dim_path: str, band: sab, **kwargs
+        self,
+        out_path: AnyPathType,
+        dim_path: str,
+        band: sab,
+        multi_pol: bool = False,
+        **kwargs,
     ) -> AnyPathType:
         """
         Write SAR image on disk.
@@ -1119,6 +1728,7 @@ class SarProduct(Product):
             out_path (AnyPathType): Out path
             dim_path (str): DIMAP path
             band (sab): Band
+            multi_pol (bool): Whether the DIMAP stores several polarisations (batched pre-processing)
             kwargs: Additional arguments
 
         Returns:
@@ -1127,31 +1737,17 @@ class SarProduct(Product):
         LOGGER.debug("Write SAR")
         # Save the file as the terrain-corrected image
         # input data
-        band_id = self.bands[band].id
-        dspk_suffix = "_DSPK"
-        dspk = dspk_suffix in band_id
-        pol = band_id.replace(dspk_suffix, "")
-
-        def interp_na(array, dim):
-            try:
-                array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-            except ValueError:
-                try:
-                    # ValueError: Index 'y' must be monotonically increasing
-                    dim_idx = getattr(array, dim)
-                    reversed_dim_idx = list(reversed(dim_idx))
-                    array = array.reindex(**{dim: reversed_dim_idx})
-                    array = array.interpolate_na(dim=dim, limit=10, keep_attrs=True)
-                    array = array.reindex(**{dim: dim_idx})
-                except ValueError:
-                    pass
-
-            return array
+        pol = self.bands[band].id.replace("_DSPK", "")
 
         # Get the .img path(s)
         try:
             imgs = utils.get_dim_img_path(dim_path, f"*{pol}*")
-        except FileNotFoundError:
+        except FileNotFoundError as exc:
+            if multi_pol:
+                # The other images are the other polarisations: don't mosaic them!
+                raise FileNotFoundError(
+                    f"No image of the {pol} polarisation found in {dim_path}"
+                ) from exc
             imgs = utils.get_dim_img_path(dim_path)  # Maybe not a good name
 
         # Manage cases where multiple swaths are ortho independently
@@ -1168,56 +1764,81 @@ class SarProduct(Product):
             mos_path = imgs[0]
 
         # Open SAR image and convert it to a clean geotiff
-        with rioxarray.open_rasterio(mos_path) as arr:
-            arr = arr.where(arr != self._snap_no_data, np.nan)
-
-            # Interpolate if needed (interpolate na works only 1D-like, sadly)
-            # DSPK step in done on already interpolated data
-            if not dspk and kwargs.get(SAR_INTERP_NA, False):
-                arr = interp_na(arr, dim="y")
-                arr = interp_na(arr, dim="x")
-
-            crop_window = kwargs.get("crop")
-            if crop_window is not None:
-                if isinstance(crop_window, Window):
-                    arr = arr.rio.isel_window(crop_window)
-                else:
-                    arr = rasters.crop(arr, crop_window)
-
-            # WARNING: Set nodata to 0 here as it is the value wanted by SNAP!
-            # SNAP < 10.0.0 fails with classic predictor !!! Set the predictor to the default value (1) !!!
-            # Caused by: javax.imageio.IIOException: Illegal value for Predictor in TIFF file
-            arr = utils.write_path_in_attrs(arr, out_path)
-            utils.write(
-                arr,
-                out_path,
-                dtype=np.float32,
-                nodata=self._snap_no_data,
-                predictor=self._get_predictor(),
-                driver="GTiff",  # SNAP doesn't handle COGs very well apparently
-            )
+        # Read it by chunks (if dask is used) in order to write it with a fixed memory
+        arr = utils.read(mos_path, masked=False)
+        arr = arr.where(arr != self._snap_no_data, np.nan)
+        return self._write_sar_arr(out_path, arr, band, **kwargs)
 
-        return out_path
-
-    def _compute_hillshade(
-        self,
-        dem_path: str = "",
-        pixel_size: Union[float, tuple] = None,
-        size: Union[list, tuple] = None,
-        resampling: Resampling = Resampling.bilinear,
+    def _write_sar_arr(
+        self, out_path: AnyPathType, arr: xr.DataArray, band: sab, **kwargs
     ) -> AnyPathType:
         """
-        Compute Hillshade mask
+        Write a pre-processed SAR array (with its nodata set to NaN) on disk as a clean GeoTiff.
 
         Args:
-            dem_path (str): DEM path, using EUDEM/MERIT DEM if none
-            pixel_size (Union[float, tuple]): Pixel size in meters. If not specified, use the product pixel size.
-            resampling (Resampling): Resampling method
-            size (Union[tuple, list]): Size of the array (width, height). Not used if pixel_size is provided.
+            out_path (AnyPathType): Out path
+            arr (xr.DataArray): SAR array
+            band (sab): Band
+            kwargs: Additional arguments
+
         Returns:
-            AnyPathType: Hillshade mask path
+            AnyPathType: SAR path
         """
-        raise InvalidProductError("Impossible to compute hillshade mask for SAR data.")
+        dspk = "_DSPK" in self.bands[band].id
+
+        def interp_na(array, dim):
+            try:
+                array = array.interpolate_na(
+                    dim=dim, limit=SAR_INTERP_NA_LIMIT, keep_attrs=True
+                )
+            except ValueError:
+                try:
+                    # ValueError: Index 'y' must be monotonically increasing
+                    dim_idx = getattr(array, dim)
+                    reversed_dim_idx = list(reversed(dim_idx))
+                    array = array.reindex(**{dim: reversed_dim_idx})
+                    array = array.interpolate_na(
+                        dim=dim, limit=SAR_INTERP_NA_LIMIT, keep_attrs=True
+                    )
+                    array = array.reindex(**{dim: dim_idx})
+                except ValueError:
+                    pass
+
+            return array
+
+        # Interpolate if needed
+        # DSPK step in done on already interpolated data
+        interp_na_method = kwargs.get(SAR_INTERP_NA, False)
+        if not dspk and interp_na_method:
+            if interp_na_method is True:
+                # Interpolate na works only 1D-like, sadly
+                arr = interp_na(arr, dim="y")
+                arr = interp_na(arr, dim="x")
+            else:
+                # Fill the holes block by block
+                arr = _fill_na(arr, interp_na_method, SAR_INTERP_NA_LIMIT)
+
+        crop_window = kwargs.get("crop")
+        if crop_window is not None:
+            if isinstance(crop_window, Window):
+                arr = arr.rio.isel_window(crop_window)
+            else:
+                arr = rasters.crop(arr, crop_window)
+
+        # WARNING: Set nodata to 0 here as it is the value wanted by SNAP!
+        # SNAP < 10.0.0 fails with classic predictor !!! Set the predictor to the default value (1) !!!
+        # Caused by: javax.imageio.IIOException: Illegal value for Predictor in TIFF file
+        arr = utils.write_path_in_attrs(arr, out_path)
+        utils.write(
+            arr,
+            out_path,
+            dtype=np.float32,
+            nodata=self._snap_no_data,
+            predictor=self._get_predictor(),
+            driver="GTiff",  # SNAP doesn't handle COGs very well apparently
+        )
+
+        return out_path
 
     def _has_cloud_band(self, band: BandNames) -> bool:
         """
@@ -1244,6 +1865,25 @@ class SarProduct(Product):
         pol_chan = [pol.value for pol in self.pol_channels]
         return f"{self.get_datetime()}_{self.constellation.name}_{'_'.join(pol_chan)}_{self.sensor_mode.name}_{self.product_type.value}"
 
+    def _get_cache_key_sensor_specific_parts(self, **kwargs) -> list:
+        """
+        Get the sensor-specific processing options that alter the content of the cached files.
+
+        Args:
+            **kwargs: Other arguments used to load bands
+
+        Returns:
+            list: Sensor-specific parts of the disk cache key
+        """
+        return [
+            kwargs.get(SAR_INTERP_NA, False),
+            os.environ.get(PP_GRAPH),
+            os.environ.get(SNAP_DEM_NAME),
+            os.environ.get(SAR_DEF_PIXEL_SIZE),
+            os.environ.get(DEM_PATH),
+            self._get_sar_engine(**kwargs).value,
+        ]
+
     def _update_attrs_constellation_specific(
         self, xarr: xr.DataArray, bands: list, **kwargs
     ) -> xr.DataArray:
@@ -20,6 +20,12 @@ from __future__ import annotations
 import importlib
 import logging
 import re
+from collections.abc import Iterator
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from enum import unique
 from typing import Union
 from zipfile import BadZipFile
@@ -29,8 +35,8 @@ from sertit import AnyPath, path, strings, types
 from sertit.misc import ListEnum
 from sertit.types import AnyPathStrType
 
-from eoreader import EOREADER_NAME, utils
-from eoreader.exceptions import InvalidProductError
+from eoreader import EOREADER_NAME, __version__, utils
+from eoreader.exceptions import InvalidProductError, InvalidTypeError
 
 try:
     import pystac
@@ -478,6 +484,22 @@ class Reader:
                 )
                 self._mtd_nested[constellation] = 0
 
+        # Combine all the metadata regex of the same nesting level
+        # to filter in one pass the files that may be a metadata file (for any constellation)
+        self._mtd_combined_regex = {}
+        for nested in set(self._mtd_nested.values()):
+            self._mtd_combined_regex[nested] = self._combine(
+                [
+                    regex
+                    for const, regex_list in self._mtd_regex.items()
+                    if self._mtd_nested[const] == nested
+                    for regex in regex_list
+                ]
+            )
+        self._mtd_combined_regex[None] = self._combine(
+            [regex for regex_list in self._mtd_regex.values() for regex in regex_list]
+        )
+
     @staticmethod
     def _compile(regex: Union[str, list], prefix="^", suffix="&") -> list:
         """
@@ -503,6 +525,19 @@ class Reader:
 
         return comp
 
+    @staticmethod
+    def _combine(regex_list: list) -> re.Pattern:
+        """
+        Combine compiled patterns into one pattern matching if any of them matches
+
+        Args:
+            regex_list (list): List of compiled pattern
+
+        Returns:
+            re.Pattern: Combined pattern
+        """
+        return re.compile("|".join(f"(?:{regex.pattern})" for regex in regex_list))
+
     def open(
         self,
         product_path: AnyPathStrType,
@@ -572,7 +607,7 @@ class Reader:
             remove_tmp (bool): Remove temp files (such as clean or orthorectified bands...) when the product is deleted
             custom (bool): True if we want to use a custom stack
             constellation (Union[Constellation, str, list]): One or several constellations to help the Reader to choose more rapidly the correct Product
-            **kwargs: Other arguments
+            **kwargs: Other arguments (such as :code:`lazy=True` to compute the product attributes on first access, see :code:`EOREADER_LAZY_INIT`)
         Returns:
             Product: EOReader's product
         """
@@ -743,48 +778,249 @@ class Reader:
             )
         else:
             prod = None
-            if constellation is None:
-                const_list = CONSTELLATION_REGEX.keys()
+            const = self._get_constellation(product_path, method, constellation)
+            if const is not None:
+                prod = create_product(
+                    product_path=product_path,
+                    archive_path=archive_path,
+                    output_path=output_path,
+                    remove_tmp=remove_tmp,
+                    constellation=const,
+                    **kwargs,
+                )
+
+        return prod
+
+    def _get_constellation(
+        self,
+        product_path: AnyPathStrType,
+        method: CheckMethod = CheckMethod.MTD,
+        constellation: Union[Constellation, str, list] = None,
+    ) -> Union[Constellation, None]:
+        """
+        Recognize the constellation of a product
+
+        Args:
+            product_path (AnyPathStrType): Product path
+            method (CheckMethod): Checking method used to recognize the products
+            constellation (Union[Constellation, str, list]): One or several constellations to help the Reader to choose more rapidly the correct Product
+
+        Returns:
+            Union[Constellation, None]: Constellation of the product, :code:`None` if not recognized
+        """
+        if constellation is None:
+            const_list = CONSTELLATION_REGEX.keys()
+        else:
+            # Manage other products which have the same constellation in them
+            if constellation == Constellation.S2:
+                constellation = [
+                    Constellation.S2,
+                    Constellation.S2_SIN,
+                    Constellation.S2_E84,
+                    Constellation.S2_MPC,
+                ]
+            elif constellation == Constellation.S1:
+                constellation = [
+                    Constellation.S1,
+                    Constellation.S1_RTC_ASF,
+                    Constellation.S1_RTC_MPC,
+                ]
+
+            const_list = Constellation.convert_from(constellation)
+
+        # List the product files only once for all the constellations
+        prod_files = _ProductFiles(product_path)
+        for const in const_list:
+            if method == CheckMethod.MTD:
+                is_valid = self._valid_mtd(prod_files, const)
+            elif method == CheckMethod.NAME:
+                is_valid = self._valid_name(prod_files, const)
             else:
-                # Manage other products which have the same constellation in them
-                if constellation == Constellation.S2:
-                    constellation = [
-                        Constellation.S2,
-                        Constellation.S2_SIN,
-                        Constellation.S2_E84,
-                        Constellation.S2_MPC,
-                    ]
-                elif constellation == Constellation.S1:
-                    constellation = [
-                        Constellation.S1,
-                        Constellation.S1_RTC_ASF,
-                        Constellation.S1_RTC_MPC,
-                    ]
-
-                const_list = Constellation.convert_from(constellation)
-
-            for const in const_list:
-                if method == CheckMethod.MTD:
-                    is_valid = self.valid_mtd(product_path, const)
-                elif method == CheckMethod.NAME:
-                    is_valid = self.valid_name(product_path, const)
-                else:
-                    is_valid = self.valid_name(product_path, const) and self.valid_mtd(
-                        product_path, const
-                    )
+                is_valid = self._valid_name(prod_files, const) and self._valid_mtd(
+                    prod_files, const
+                )
 
-                if is_valid:
-                    prod = create_product(
-                        product_path=product_path,
-                        archive_path=archive_path,
-                        output_path=output_path,
-                        remove_tmp=remove_tmp,
-                        constellation=const,
-                        **kwargs,
-                    )
-                    break
+            if is_valid:
+                return const
 
-        return prod
+        return None
+
+    def open_many(
+        self,
+        paths: list,
+        workers: int = None,
+        executor: str = "thread",
+        output_path: AnyPathStrType = None,
+        method: CheckMethod = CheckMethod.MTD,
+        remove_tmp: bool = False,
+        custom: bool = False,
+        constellation: Union[Constellation, str, list] = None,
+        **kwargs,
+    ) -> Iterator[tuple]:
+        """
+        Open many products concurrently, yielding them as soon as they are opened (not in the input order).
+
+        A product that cannot be opened doesn't stop the batch: its error is yielded instead.
+
+        - With :code:`executor="thread"`, the products are entirely opened in a thread pool sharing this Reader.
+        - With :code:`executor="process"`, the products are opened in a process pool, each process getting a copy of this Reader with its compiled regex.
+          They are sent back to the main process as descriptors (see :code:`Product.to_descriptor`), so their metadata is not parsed again.
+
+        .. code-block:: python
+
+            >>> from eoreader.reader import Reader
+            >>> paths = ["S2A_MSIL1C_20200824T110631_N0209_R137_T30TTK_20200824T150432.SAFE.zip", "LC08_L1TP_200030_20201220_20210310_02_T1.tar"]
+            >>> for path, prod, error in Reader().open_many(paths, workers=8):
+            >>>     if error is not None:
+            >>>         print(f"Cannot open {path}: {error}")
+
+        Args:
+            paths (list): Products paths (same inputs as :code:`open`)
+            workers (int): Number of workers. Default is the number of available cores.
+            executor (str): :code:`"thread"` or :code:`"process"`
+            output_path (AnyPathStrType): Output Path
+            method (CheckMethod): Checking method used to recognize the products
+            remove_tmp (bool): Remove temp files (such as clean or orthorectified bands...) when the product is deleted
+            custom (bool): True if we want to use custom stacks
+            constellation (Union[Constellation, str, list]): One or several constellations to help the Reader to choose more rapidly the correct Product
+            **kwargs: Other arguments
+
+        Yields:
+            tuple: Path, Product (:code:`None` if not recognized or in case of error) and error (:code:`None` if the product has been opened)
+        """
+        if workers is None:
+            workers = max(1, utils.get_max_cores())
+
+        open_kwargs = {
+            "output_path": output_path,
+            "method": method,
+            "remove_tmp": remove_tmp,
+            "custom": custom,
+            "constellation": constellation,
+            **kwargs,
+        }
+
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self.open, product_path, **open_kwargs): product_path
+                    for product_path in paths
+                }
+                for future in as_completed(futures):
+                    product_path = futures[future]
+                    try:
+                        yield product_path, future.result(), None
+                    except Exception as exc:
+                        LOGGER.warning(f"Cannot open {product_path}: {exc}")
+                        yield product_path, None, exc
+
+        elif executor == "process":
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_reader,
+                initargs=(self,),
+            ) as pool:
+                futures = {}
+                other_paths = []
+                for product_path in paths:
+                    # Only paths can be opened in other processes
+                    if path.is_path(product_path):
+                        future = pool.submit(
+                            _open_worker_product,
+                            product_path,
+                            **open_kwargs,
+                        )
+                        futures[future] = product_path
+                    else:
+                        other_paths.append(product_path)
+
+                # Open the other products while the processes work
+                for product_path in other_paths:
+                    try:
+                        yield product_path, self.open(product_path, **open_kwargs), None
+                    except Exception as exc:
+                        LOGGER.warning(f"Cannot open {product_path}: {exc}")
+                        yield product_path, None, exc
+
+                for future in as_completed(futures):
+                    product_path = futures[future]
+                    try:
+                        descriptor = future.result()
+                        prod = (
+                            None
+                            if descriptor is None
+                            else self.from_descriptor(
+                                descriptor,
+                                output_path=output_path,
+                                remove_tmp=remove_tmp,
+                            )
+                        )
+                        yield product_path, prod, None
+                    except Exception as exc:
+                        LOGGER.warning(f"Cannot open {product_path}: {exc}")
+                        yield product_path, None, exc
+        else:
+            raise ValueError(
+                f"Unknown executor: {executor}. It should be either 'thread' or 'process'."
+            )
+
+    def from_descriptor(
+        self,
+        descriptor: dict,
+        output_path: AnyPathStrType = None,
+        remove_tmp: bool = False,
+    ) -> Product:  # noqa: F821
+        """
+        Reconstruct a product from its descriptor (see :code:`Product.to_descriptor`),
+        without opening nor parsing its source files again.
+
+        .. WARNING::
+            A descriptor holds Python objects and is meant to be sent between processes as a pickle:
+            only unpickle descriptors coming from a trusted source.
+
+        .. code-block:: python
+
+            >>> from eoreader.reader import Reader
+            >>> path = r"S2B_MSIL1C_20210517T103619_N7990_R008_T30QVE_20210929T075738.SAFE.zip"
+            >>> desc = Reader().open(path).to_descriptor()
+            >>> # i.e. in another process
+            >>> prod = Reader().from_descriptor(desc)
+
+        Args:
+            descriptor (dict): Product descriptor
+            output_path (AnyPathStrType): Output Path. If not given, the output of the original product is used (or a new temporary directory if it was one)
+            remove_tmp (bool): Remove temp files (such as clean or orthorectified bands...) when the product is deleted
+
+        Returns:
+            Product: EOReader's product
+        """
+        if not isinstance(descriptor, dict):
+            raise InvalidTypeError(
+                f"A product descriptor should be a dict, not {type(descriptor)}"
+            )
+
+        if descriptor["version"] != __version__:
+            LOGGER.warning(
+                f"This descriptor has been created with EOReader {descriptor['version']} "
+                f"(current version: {__version__}). The product may be incoherent."
+            )
+
+        # Only reconstruct EOReader's products
+        module, class_name = descriptor["class"].rsplit(".", 1)
+        class_ = None
+        if module.startswith(f"{EOREADER_NAME}."):
+            class_ = getattr(importlib.import_module(module), class_name, None)
+
+        from eoreader.products.product import Product
+
+        if not (isinstance(class_, type) and issubclass(class_, Product)):
+            raise InvalidTypeError(
+                f"{descriptor['class']} is not an EOReader product class."
+            )
+
+        return class_._from_descriptor(
+            descriptor, output_path=output_path, remove_tmp=remove_tmp
+        )
 
     def valid_name(
         self,
@@ -825,9 +1061,26 @@ class Reader:
             bool: True if valid name
 
         """
+        return self._valid_name(_ProductFiles(product_path), constellation)
+
+    def _valid_name(
+        self,
+        prod_files: _ProductFiles,
+        constellation: Union[str, Constellation],
+    ) -> bool:
+        """
+        Check if the product's name is valid for the given satellite, with the already listed product files
+
+        Args:
+            prod_files (_ProductFiles): Product files
+            constellation (str): Constellation's name or ID
+
+        Returns:
+            bool: True if valid name
+        """
         constellation = Constellation.convert_from(constellation)[0]
         regex = self._constellation_regex[constellation]
-        return is_filename_valid(product_path, regex)
+        return is_filename_valid(prod_files.path, regex, prod_files=prod_files)
 
     def valid_mtd(
         self,
@@ -867,54 +1120,177 @@ class Reader:
             bool: True if valid name
 
         """
+        return self._valid_mtd(_ProductFiles(product_path), constellation)
+
+    def _valid_mtd(
+        self,
+        prod_files: _ProductFiles,
+        constellation: Union[str, Constellation],
+    ) -> bool:
+        """
+        Check if the product's mtd is in the product folder/archive, with the already listed product files
+
+        Args:
+            prod_files (_ProductFiles): Product files
+            constellation (Union[str, Constellation]): Constellation's name or ID
+
+        Returns:
+            bool: True if valid name
+        """
         # Convert constellation if needed
         constellation = Constellation.convert_from(constellation)[0]
 
-        product_path = AnyPath(product_path)
-
-        if not product_path.exists():
+        if not prod_files.exists:
             return False
 
         # Here the list is a check of several files
         regex_list = self._mtd_regex[constellation]
         nested = self._mtd_nested[constellation]
 
-        # False by default
-        is_valid = [False for _ in regex_list]
+        # Only check the files that may be a metadata file
+        # (filtered in one pass for all constellations with the same nesting level)
+        candidates = prod_files.get_candidates(
+            nested,
+            self._mtd_combined_regex[nested if prod_files.is_dir else None],
+        )
+
+        return all(
+            any(regex.match(prod_file) for prod_file in candidates)
+            for regex in regex_list
+        )
+
+
+_WORKER_READER = None
+""" Reader of the current worker process (see :code:`Reader.open_many`) """
+
+
+def _init_worker_reader(reader: Reader) -> None:
+    """
+    Set the Reader (and its compiled regex) of a worker process, only once per process
+
+    Args:
+        reader (Reader): Reader
+    """
+    global _WORKER_READER
+    _WORKER_READER = reader
+
+
+def _open_worker_product(product_path: AnyPathStrType, **kwargs) -> Union[dict, None]:
+    """
+    Open a product in a worker process and get its descriptor
+
+    Args:
+        product_path (AnyPathStrType): Product path
+        **kwargs: Other arguments passed to :code:`Reader.open`
+
+    Returns:
+        Union[dict, None]: Descriptor of the product, :code:`None` if not recognized
+    """
+    # Don't create any folder in the worker: the product will be used in the main process
+    kwargs["lazy"] = True
+    kwargs["remove_tmp"] = False
+    prod = _WORKER_READER.open(product_path, **kwargs)
+    if prod is None:
+        return None
+
+    return prod.to_descriptor(geometry=False)
+
+
+class _ProductFiles:
+    """
+    Files of a product (folder or archive), listed only once and shared between all the checked constellations.
+    """
+
+    def __init__(self, product_path: AnyPathStrType) -> None:
+        self.path = AnyPath(product_path)
+        self.exists = self.path.exists()
+        self.is_dir = self.exists and self.path.is_dir()
+
+        self._children = None
+        self._files = {}
+        self._candidates = {}
+
+    def get_children(self) -> list:
+        """
+        Get the direct children (files and folders) of the product folder
+
+        Returns:
+            list: Children paths
+        """
+        if self._children is None:
+            self._children = list(self.path.iterdir())
+        return self._children
+
+    def get_files(self, nested: int) -> list:
+        """
+        Get the files of the product, at the given nesting level
+        (for archives, all the archived files are returned).
 
-        # Folder
-        if product_path.is_dir():
-            if nested < 0:
-                prod_files = list(product_path.glob("**/*.*"))
+        Args:
+            nested (int): Nesting level (:code:`-1` for any level)
+
+        Returns:
+            list: Files (as strings)
+        """
+        if not self.is_dir:
+            nested = None
+
+        if nested not in self._files:
+            if nested is None:
+                try:
+                    prod_files = utils.get_archived_file_list(self.path)
+                except BadZipFile as exc:
+                    raise BadZipFile(f"{self.path} is not a zip file") from exc
             elif nested == 0:
-                prod_files = list(
+                prod_files = [
                     prod_path
-                    for prod_path in product_path.iterdir()
+                    for prod_path in self.get_children()
                     if prod_path.is_file()
-                )
+                ]
+            elif -1 in self._files:
+                # Derive it from the recursive listing instead of listing again
+                prod_files = [
+                    prod_path
+                    for prod_path in self._files[-1]
+                    if len(AnyPath(prod_path).relative_to(self.path).parts)
+                    == nested + 1
+                ]
+            elif nested < 0:
+                prod_files = list(self.path.glob("**/*.*"))
+                nested = -1
             else:
                 nested_wildcard = "/".join(["*" for _ in range(nested)])
-                prod_files = list(product_path.glob(f"{nested_wildcard}/*.*"))
+                prod_files = list(self.path.glob(f"{nested_wildcard}/*.*"))
 
-        # Archive
-        else:
-            try:
-                prod_files = utils.get_archived_file_list(product_path)
-            except BadZipFile as exc:
-                raise BadZipFile(f"{product_path} is not a zip file") from exc
+            self._files[nested] = [str(prod_file) for prod_file in prod_files]
 
-        # Check
-        for idx, regex in enumerate(regex_list):
-            for prod_file in prod_files:
-                if regex.match(str(prod_file)):
-                    is_valid[idx] = True
-                    break
+        return self._files[nested]
+
+    def get_candidates(self, nested: int, combined_regex: re.Pattern) -> list:
+        """
+        Get the files that match the combined metadata regex of their nesting level
+
+        Args:
+            nested (int): Nesting level (:code:`-1` for any level)
+            combined_regex (re.Pattern): Combined metadata regex
 
-        return all(is_valid)
+        Returns:
+            list: Candidate files (as strings)
+        """
+        key = nested if self.is_dir else None
+        if key not in self._candidates:
+            self._candidates[key] = [
+                prod_file
+                for prod_file in self.get_files(nested)
+                if combined_regex.match(prod_file)
+            ]
+        return self._candidates[key]
 
 
 def is_filename_valid(
-    product_path: AnyPathStrType, regex: Union[list, re.Pattern]
+    product_path: AnyPathStrType,
+    regex: Union[list, re.Pattern],
+    prod_files: _ProductFiles = None,
 ) -> bool:
     """
     Check if the filename corresponds to the given satellite regex.
@@ -927,10 +1303,14 @@ def is_filename_valid(
     Args:
         product_path (AnyPathStrType): Product path
         regex (Union[list, re.Pattern]): Regex or list of regex
+        prod_files (_ProductFiles): Already listed product files, to avoid listing them again
 
     Returns:
         bool: True if the filename corresponds to the given satellite regex
     """
+    if prod_files is None:
+        prod_files = _ProductFiles(product_path)
+
     product_path = AnyPath(product_path)
     # Handle HLS folders...
     if product_path.is_dir() and product_path.suffix in [".0"]:
@@ -943,15 +1323,15 @@ def is_filename_valid(
     is_valid = bool(regex[0].match(product_file_name))
     if is_valid and len(regex) > 1:
         is_valid = False  # Reset
-        if product_path.is_dir():
-            file_list = product_path.iterdir()
+        if prod_files.is_dir:
+            file_list = prod_files.get_children()
             for file in file_list:
                 if regex[1].match(file.name):
                     is_valid = True
                     break
         else:
             try:
-                file_list = utils.get_archived_file_list(product_path)
+                file_list = prod_files.get_files(None)
                 for file in file_list:
                     if regex[1].match(file):
                         is_valid = True
@@ -19,6 +19,7 @@ import contextlib
 import logging
 import os
 import platform
+import tempfile
 import warnings
 from functools import wraps
 from typing import Callable, Union
@@ -27,11 +28,14 @@ import numpy as np
 import pandas as pd
 import geopandas as gpd
 import xarray as xr
+import rasterio
 from lxml import etree
 from rasterio import errors
+from rasterio import shutil as rio_shutil
 from rasterio.enums import Resampling
 from rasterio.errors import NotGeoreferencedWarning
 from rasterio.rpc import RPC
+from rasterio.windows import Window
 from sertit import AnyPath, files, geometry, path, rasters, misc
 from sertit.snap import SU_MAX_CORE
 from sertit.types import AnyPathStrType, AnyPathType, AnyXrDataStructure
@@ -51,6 +55,7 @@ from eoreader.keywords import _prune_keywords
 LOGGER = logging.getLogger(EOREADER_NAME)
 DEFAULT_TILE_SIZE = 1024
 DEFAULT_NOF_BANDS_IN_CHUNKS = 1
+DEFAULT_MAX_SAMPLE_SIZE = 1000000
 UINT16_NODATA = rasters.UINT16_NODATA
 
 
@@ -277,6 +282,71 @@ def read(
             raise
 
 
+def read_stack(
+    raster_path: AnyPathStrType,
+    indexes: list,
+    pixel_size: Union[tuple, list, float] = None,
+    size: Union[tuple, list] = None,
+    resampling: Resampling = Resampling.nearest,
+    **kwargs,
+) -> list:
+    """
+    Read several bands of a stack in one call and split them into one-band arrays.
+
+    The stack is opened, resampled and decoded only once (a pixel-interleaved block holds all the bands),
+    and the chunks span all the read bands.
+
+    .. code-block:: python
+
+        >>> raster_path = "path/to/stack.tif"
+        >>> green, red = read_stack(raster_path, indexes=[2, 3])
+        >>> red.equals(read(raster_path, indexes=[3]))
+        True
+
+    Args:
+        raster_path (AnyPathStrType): Path to the stack
+        indexes (list): Indexes to load
+        pixel_size (Union[tuple, list, float]): Size of the pixels of the wanted bands, in dataset unit (X, Y)
+        size (Union[tuple, list]): Size of the arrays (width, height). Overrides pixel_size if provided.
+        resampling (Resampling): Resampling method
+        **kwargs: Other arguments passed to :py:func:`read`
+
+    Returns:
+        list: One xarray per index, in the same order
+    """
+    tile_size = os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE)
+    if (
+        use_dask()
+        and "chunks" not in kwargs
+        and tile_size not in [True, "auto", "True", "true"]
+    ):
+        kwargs["chunks"] = {
+            "band": len(indexes),
+            "x": int(tile_size),
+            "y": int(tile_size),
+        }
+
+    stack = read(
+        raster_path,
+        pixel_size=pixel_size,
+        size=size,
+        resampling=resampling,
+        indexes=indexes,
+        **kwargs,
+    )
+
+    # The long names are the descriptions of all the bands of the stack, not only of the read ones
+    long_names = stack.attrs.get("long_name")
+    arrs = []
+    for i, idx in enumerate(indexes):
+        arr = stack.isel(band=[i]).assign_coords({"band": [1]})
+        if isinstance(long_names, (list, tuple)):
+            arr.attrs = {**arr.attrs, "long_name": long_names[idx - 1]}
+        arrs.append(arr)
+
+    return arrs
+
+
 def write(xds: xr.DataArray, filepath: AnyPathStrType, **kwargs) -> None:
     """
     Overload of :code:`sertit.rasters.write()` managing DASK in EOReader's way.
@@ -556,6 +626,242 @@ def stack(band_xds: xr.Dataset, **kwargs) -> (xr.DataArray, type):
     return stack, dtype
 
 
+def get_uint16_conversion(
+    band_xds: xr.Dataset, max_sample_size: int = DEFAULT_MAX_SAMPLE_SIZE
+) -> (type, dict, bool):
+    """
+    Get how to convert the bands to uint16 (as :py:func:`convert_to_uint16` does), without converting them.
+
+    The statistics (quantile and maximum of the bands) are approximated on a regular subsample of each band
+    (at most :code:`max_sample_size` pixels per band), so the bands are never loaded entirely.
+
+    Args:
+        band_xds (xr.Dataset): Dataset containing the bands
+        max_sample_size (int): Maximum number of pixels sampled per band
+
+    Returns:
+        (type, dict, bool): Dtype of the stack, scale of each band and whether the negative values need to be clipped
+    """
+    scale = 10000
+    round_nb = 1000
+    round_min = -0.1
+
+    samples = {}
+    for band, band_xda in band_xds.items():
+        step = max(1, int(np.ceil(np.sqrt(band_xda.size / max_sample_size))))
+        samples[band] = np.asarray(
+            band_xda[..., ::step, ::step].data, dtype=np.float32
+        ).ravel()
+
+    stack_sample = np.concatenate(list(samples.values()))
+    if np.isnan(stack_sample).all():
+        stack_min = np.nan
+    else:
+        stack_min = float(np.nanquantile(stack_sample, 0.001))
+
+    if np.round(stack_min * round_nb) / round_nb < round_min:
+        LOGGER.warning(
+            f"Cannot convert the stack to uint16 as it has negative values ({stack_min} < {round_min}). Keeping it in float32."
+        )
+        return np.float32, {}, False
+
+    clip = bool(stack_min < 0)
+    if clip:
+        LOGGER.warning("Small negative values ]-0.1, 0] have been found. Clipping to 0.")
+
+    # SCALING
+    # NOT ALL bands need to be scaled, only:
+    # - Satellite bands
+    # - index
+    scales = {}
+    for band, sample in samples.items():
+        if is_sat_band(band) or is_index(band):
+            is_scaled = (
+                not np.isnan(sample).all()
+                and np.nanmax(sample) > UINT16_NODATA / scale
+            )
+            if is_scaled:
+                LOGGER.debug(
+                    f"Band {to_str(band, as_list=False)} seems already scaled, keeping it as is (the values will be rounded to integers though)."
+                )
+            else:
+                scales[band] = scale
+
+    return np.uint16, scales, clip
+
+
+def write_stack(
+    band_xds: xr.Dataset,
+    stack_path: AnyPathStrType,
+    dtype: type = np.float32,
+    nodata: float = None,
+    scales: dict = None,
+    clip: bool = False,
+    attrs: dict = None,
+    **kwargs,
+) -> None:
+    """
+    Write the bands of a dataset into a multi-band raster, band by band and strip by strip,
+    without creating the stack in memory.
+
+    The bands are written into a preallocated tiled GeoTiff, converted afterwards to the wanted driver (i.e. COG).
+    The file is written with the same defaults as :code:`write` (compression, predictor, statistics...).
+
+    .. code-block:: python
+
+        >>> band_xds = prod.load([RED, GREEN, BLUE])
+        >>> dtype, scales, clip = get_uint16_conversion(band_xds)
+        >>> write_stack(band_xds, "path/to/stack.tif", dtype=dtype, scales=scales, clip=clip)
+
+    Args:
+        band_xds (xr.Dataset): Dataset containing the bands
+        stack_path (AnyPathStrType): Stack path
+        dtype (type): Dtype of the stack
+        nodata (float): Nodata of the stack. If not given, the default nodata of the dtype.
+        scales (dict): Scale applied to some bands before converting them to the dtype, i.e. :code:`{RED: 10000}`
+        clip (bool): Clip the negative values to 0
+        attrs (dict): Attributes of the stack, written as tags (:code:`long_name` is written as the band descriptions)
+        **kwargs: Other arguments, such as :code:`driver`, :code:`tags` or the creation options (:code:`compress`, :code:`predictor`...)
+    """
+    if nodata is None:
+        nodata = rasters.get_nodata_value_from_dtype(dtype)
+    if scales is None:
+        scales = {}
+    if attrs is None:
+        attrs = {}
+
+    try:
+        strip_size = int(os.getenv(TILE_SIZE, DEFAULT_TILE_SIZE))
+    except ValueError:
+        strip_size = DEFAULT_TILE_SIZE
+
+    first_xda = next(iter(band_xds.values()))
+    height, width = first_xda.rio.height, first_xda.rio.width
+    driver = get_driver(kwargs)
+
+    # Same default creation options as sertit.rasters.write
+    options = {
+        key: val
+        for key, val in _prune_keywords(
+            ["window", "driver", "tags", "dtype", "nodata"], **kwargs
+        ).items()
+        if val is not None
+    }
+    if driver == "COG":
+        options["compress"] = options.get("compress", "deflate")
+        options["BLOCKSIZE"] = options.get(
+            "BLOCKSIZE", 128 if height < 1000 or width < 1000 else 512
+        )
+    elif driver == "GTiff":
+        options["compress"] = options.get("compress", "lzw")
+    if (
+        str(options.get("compress", "")).lower() in ["lzw", "deflate", "zstd"]
+        and "predictor" not in options
+    ):
+        options["predictor"] = "3" if np.dtype(dtype).kind == "f" else "2"
+
+    tags = {
+        key: val
+        for key, val in attrs.items()
+        if key not in ["long_name", "_FillValue", "scale_factor", "add_offset"]
+    }
+    tags.update(kwargs.get("tags") or {})
+
+    # Statistics of the valid pixels, computed when writing the strips (as GDAL's, only for dtypes larger than 32 bits)
+    compute_stats = np.dtype(dtype).itemsize >= 4
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if driver == "GTiff":
+            gtiff_path = str(stack_path)
+            gtiff_options = options
+        else:
+            gtiff_path = os.path.join(tmp_dir, "stack.tif")
+            gtiff_options = {"compress": "lzw"}
+
+        profile = {
+            "driver": "GTiff",
+            "dtype": np.dtype(dtype).name,
+            "count": len(band_xds),
+            "width": width,
+            "height": height,
+            "crs": first_xda.rio.crs,
+            "transform": first_xda.rio.transform(),
+            "nodata": nodata,
+            "tiled": True,
+            "blockxsize": 512,
+            "blockysize": 512,
+            "BIGTIFF": "IF_NEEDED",
+            "NUM_THREADS": "ALL_CPUS",
+            **gtiff_options,
+        }
+
+        with rasterio.open(gtiff_path, "w", **profile) as dst:
+            long_name = attrs.get("long_name")
+            if isinstance(long_name, str):
+                long_name = long_name.split(" ")
+            if long_name and len(long_name) == dst.count:
+                dst.descriptions = tuple(long_name)
+            dst.update_tags(**tags)
+
+            for band_id, (band, band_xda) in enumerate(band_xds.items(), start=1):
+                band_xda = band_xda.squeeze(drop=True).transpose("y", "x")
+                stats = {
+                    "min": np.inf,
+                    "max": -np.inf,
+                    "sum": 0.0,
+                    "sum_sq": 0.0,
+                    "count": 0,
+                }
+                for row_off in range(0, height, strip_size):
+                    strip = np.asarray(
+                        band_xda[row_off : row_off + strip_size].data,
+                        dtype=np.float32,
+                    )
+                    if clip:
+                        strip = np.clip(strip, 0, None)
+                    if band in scales:
+                        strip = strip * scales[band]
+                    strip = np.where(np.isnan(strip), nodata, strip).astype(dtype)
+                    dst.write(
+                        strip,
+                        band_id,
+                        window=Window(0, row_off, width, strip.shape[0]),
+                    )
+
+                    if compute_stats:
+                        valid = strip[strip != nodata].astype(np.float64)
+                        if valid.size > 0:
+                            stats["min"] = min(stats["min"], valid.min())
+                            stats["max"] = max(stats["max"], valid.max())
+                            stats["sum"] += valid.sum()
+                            stats["sum_sq"] += np.square(valid).sum()
+                            stats["count"] += valid.size
+
+                if compute_stats and stats["count"] > 0:
+                    mean = stats["sum"] / stats["count"]
+                    std = np.sqrt(max(stats["sum_sq"] / stats["count"] - mean**2, 0))
+                    dst.update_tags(
+                        band_id,
+                        STATISTICS_MINIMUM=stats["min"],
+                        STATISTICS_MAXIMUM=stats["max"],
+                        STATISTICS_MEAN=mean,
+                        STATISTICS_STDDEV=std,
+                        STATISTICS_VALID_PERCENT=100
+                        * stats["count"]
+                        / (width * height),
+                    )
+
+        if driver != "GTiff":
+            rio_shutil.copy(
+                gtiff_path,
+                str(stack_path),
+                driver=driver,
+                BIGTIFF="IF_NEEDED",
+                NUM_THREADS="ALL_CPUS",
+                **options,
+            )
+
+
 def get_dim_img_path(dim_path: AnyPathStrType, img_name: str = "*") -> list:
     """
     Get the image path from a :code:`BEAM-DIMAP` data.